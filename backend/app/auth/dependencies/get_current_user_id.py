@@ -2,6 +2,7 @@ from typing import Annotated
 from fastapi import Depends, Header, HTTPException, status
 from app.auth.dependencies.get_jwt_decode_service import get_jwt_decode_service
 from app.auth.services.jwt_decode_service import JWTDecodeService
+from core.metrics import auth_attempts
 
 
 async def get_current_user_id(
@@ -9,11 +10,14 @@ async def get_current_user_id(
     decoder: Annotated[JWTDecodeService, Depends(get_jwt_decode_service)] = None,
 ) -> int:
     if not authorization:
+        auth_attempts.labels("token", "failure").inc()
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing Authorization header")
     token = authorization.replace("Bearer ", "").strip()
     data = await decoder.decode_token(token)
     if not data.get("success"):
+        auth_attempts.labels("token", "failure").inc()
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    auth_attempts.labels("token", "success").inc()
     return int(data["user_id"]) 
 
 
@@ -1,9 +1,10 @@
 from app.user.schemas.user_schem import User
 from app.user.schemas.role_schem import Roles
+from sqlalchemy import func
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
-from core.security.password import verify_password, get_password_hash
+from core.security.password import verify_password_async, get_password_hash_async
 from core.exceptions.auth import UserNotFound
 
 
@@ -29,7 +30,7 @@ class AuthRepo:
         )
         result = await self.db.execute(query)
         user: User = result.scalars().first()
-        if user and verify_password(password, user.hased_password):
+        if user and await verify_password_async(password, user.hased_password):
             return user
             
         raise UserNotFound
@@ -57,6 +58,22 @@ class AuthRepo:
         else:
             raise UserNotFound
 
+    async def email_exists(self, email: str) -> bool:
+        """
+        Проверяет, занят ли email, не загружая пользователя и его роли.
+
+        Адреса сравниваются без учёта регистра, как при импорте пользователей
+        (индекс ix_users_email_lower).
+
+        Аргументы:
+            email (str): Проверяемый email.
+
+        Возвращает:
+            bool: True, если пользователь с таким email уже есть.
+        """
+        result = await self.db.execute(select(User.id).where(func.lower(User.email) == email.lower()).limit(1))
+        return result.first() is not None
+
     async def get_user_by_id(self, user_id: int) -> User:
         """
         Получает пользователя по его ID.
@@ -102,7 +119,7 @@ class AuthRepo:
             email=email,
             first_name=first_name,
             last_name=last_name,
-            hased_password=get_password_hash(password)
+            hased_password=await get_password_hash_async(password)
         )
         if role_name:
             result = await self.db.execute(select(Roles).where(Roles.name == role_name))
@@ -110,6 +127,7 @@ class AuthRepo:
             if role is not None:
                 new_user.roles.append(role)
         self.db.add(new_user)
+        # id заполняется при flush, а серверных значений по умолчанию у users нет,
+        # поэтому refresh не нужен — и роли остаются загруженными для ответа регистрации.
         await self.db.commit()
-        await self.db.refresh(new_user)
         return new_user
\ No newline at end of file
@@ -3,9 +3,11 @@ from app.auth.models.auth_model import LoginRequest, RegisterRequest
 from core.security.jwt import JWTManager
 from core.exceptions.auth import UserNotFound
 from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from fastapi.responses import JSONResponse
 from core.config import config
 from core.logging import logger
+from core.metrics import auth_attempts
 from app.user.schemas.user_schem import User
 
 
@@ -40,6 +42,7 @@ class AuthService:
         try:
             user: User = await self.auth_repo.verify_user(login_request.email, login_request.password)
         except UserNotFound:
+            auth_attempts.labels("login", "failure").inc()
             logger.error(f"User {login_request.email} not found")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -48,12 +51,27 @@ class AuthService:
                 },
             )
         except Exception as e:
+            auth_attempts.labels("login", "error").inc()
             logger.error(f"Error when attempting to log in as user {login_request.email}. Error: {e}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Something went wrong",
             )
 
+        auth_attempts.labels("login", "success").inc()
+        return self._build_login_response(user, remember_me)
+
+    def _build_login_response(self, user: User, remember_me: bool = False) -> JSONResponse:
+        """
+        Выпускает JWT для пользователя и собирает ответ входа с cookie access_token.
+
+        Аргументы:
+            user (User): Пользователь с загруженными ролями.
+            remember_me (bool): Флаг "запомнить меня" для увеличенного срока жизни токена.
+
+        Возвращает:
+            JSONResponse: Ответ с JWT токеном и данными пользователя.
+        """
         access_token = self.jwt_manager.create_token(
             {"sub": user.email, "user_id": user.id},
             remember_me=remember_me
@@ -104,31 +122,42 @@ class AuthService:
         return response
 
     async def register(self, register_request: RegisterRequest) -> JSONResponse:
-        # Проверяем существование пользователя с таким email
-        try:
-            await self.auth_repo.get_user_by_email(register_request.email)
-            # Если не выброшено исключение, пользователь уже существует
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail={"detail": "User with this email already exists"}
-            )
-        except UserNotFound:
-            pass
-
-        user = await self.auth_repo.create_user(
-            register_request.email, 
-            register_request.first_name, 
-            register_request.last_name, 
-            register_request.password,
-            role_name=register_request.role
+        """
+        Регистрирует пользователя и сразу выдаёт ему токен.
+
+        Токен выпускается по только что созданному пользователю, без повторного
+        поиска по email и второй проверки bcrypt, как при обычном входе.
+
+        Аргументы:
+            register_request (RegisterRequest): Данные нового пользователя.
+
+        Возвращает:
+            JSONResponse: Тот же ответ, что и у login.
+
+        Вызывает:
+            HTTPException: 409, если email уже занят.
+        """
+        conflict = HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"detail": "User with this email already exists"}
         )
-        if user:
-            return await self.login(LoginRequest(
-                email=register_request.email,
-                password=register_request.password
-            ))
-        else: 
-            raise HTTPException(
-                status_code=500 
+        if await self.auth_repo.email_exists(register_request.email):
+            auth_attempts.labels("register", "failure").inc()
+            raise conflict
+
+        try:
+            user = await self.auth_repo.create_user(
+                register_request.email,
+                register_request.first_name,
+                register_request.last_name,
+                register_request.password,
+                role_name=register_request.role
             )
+        except IntegrityError:
+            # Параллельная регистрация с тем же email успела раньше.
+            await self.auth_repo.db.rollback()
+            auth_attempts.labels("register", "failure").inc()
+            raise conflict
+        auth_attempts.labels("register", "success").inc()
+        return self._build_login_response(user)
         
@@ -1,9 +1,11 @@
 from typing import Optional, Dict, Any
 from core.security.jwt import JWTManager
+from core.security.token_cache import token_cache, CachedToken
 from core.exceptions.auth import TokenExpired
 from app.auth.repositories import auth_repo
 from app.user.schemas.user_schem import User
 from core.logging import logger
+from core.metrics import cache_requests
 
 
 class JWTDecodeService:
@@ -14,6 +16,9 @@ class JWTDecodeService:
     - Декодирования JWT токена
     - Валидации токена
     - Получения дополнительной информации о пользователе из базы данных
+
+    Успешно проверенные токены кешируются в core.security.token_cache,
+    поэтому повторный запрос с тем же токеном не декодирует JWT и не ходит в БД.
     """
     
     def __init__(self, auth_repo: auth_repo.AuthRepo):
@@ -33,6 +38,21 @@ class JWTDecodeService:
         return len(parts) == 3 and all(parts)
 
 
+    def _from_cache(self, cached: CachedToken) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "user_id": str(cached.user_id),
+            "email": cached.email,
+            "first_name": cached.first_name,
+            "last_name": cached.last_name,
+            "roles": list(cached.roles),
+            "two_fa_enabled": False,
+            "exp": cached.claims.get("exp", 0),
+            "iat": cached.claims.get("iat", 0),
+            "remember_me": cached.claims.get("remember_me", False),
+            "error_message": ""
+        }
+
     async def decode_token(self, jwt_token: str) -> Dict[str, Any]:
         """
         Декодирует JWT токен и возвращает информацию о пользователе.
@@ -50,6 +70,7 @@ class JWTDecodeService:
                 "email": str,
                 "first_name": str,
                 "last_name": str,
+                "roles": list[str],
                 "two_fa_enabled": bool,
                 "exp": int,
                 "iat": int,
@@ -57,8 +78,15 @@ class JWTDecodeService:
                 "error_message": str
             }
         """
+        token = jwt_token.replace("Bearer ", "").strip()
+        cached = token_cache.get(token)
+        if cached is not None:
+            cache_requests.labels("token", "hit").inc()
+            return self._from_cache(cached)
+        cache_requests.labels("token", "miss").inc()
+
         try:
-            payload = self.jwt_manager.decode_token(jwt_token)
+            payload = self.jwt_manager.decode_token(token)
             
             user_id = str(payload.get("user_id", ""))
             email = payload.get("sub", "")
@@ -74,6 +102,7 @@ class JWTDecodeService:
                     "email": "",
                     "first_name": "",
                     "last_name": "",
+                    "roles": [],
                     "two_fa_enabled": False,
                     "exp": 0,
                     "iat": 0,
@@ -83,14 +112,25 @@ class JWTDecodeService:
             
             try:
                 user: User = await self.auth_repo.get_user_by_id(int(user_id))
-                
+                role_names = [r.name for r in (user.roles or [])]
+                token_cache.put(
+                    token,
+                    payload,
+                    user_id=user.id,
+                    email=email,
+                    first_name=user.first_name or "",
+                    last_name=user.last_name or "",
+                    roles=tuple(role_names),
+                )
+
                 return {
                     "success": True,
                     "user_id": user_id,
                     "email": email,
                     "first_name": user.first_name or "",
                     "last_name": user.last_name or "",
-                    "two_fa_enabled": user.twoFA_enabled,
+                    "roles": role_names,
+                    "two_fa_enabled": getattr(user, "twoFA_enabled", False),
                     "exp": exp,
                     "iat": iat,
                     "remember_me": remember_me,
@@ -105,6 +145,7 @@ class JWTDecodeService:
                     "email": email,
                     "first_name": "",
                     "last_name": "",
+                    "roles": [],
                     "two_fa_enabled": False,
                     "exp": exp,
                     "iat": iat,
@@ -113,13 +154,14 @@ class JWTDecodeService:
                 }
                 
         except TokenExpired:
-            logger.error(f"Token expired: {jwt_token[:20]}...")
+            logger.error(f"Token expired: {token[:20]}...")
             return {
                 "success": False,
                 "user_id": "",
                 "email": "",
                 "first_name": "",
                 "last_name": "",
+                "roles": [],
                 "two_fa_enabled": False,
                 "exp": 0,
                 "iat": 0,
@@ -135,6 +177,7 @@ class JWTDecodeService:
                 "email": "",
                 "first_name": "",
                 "last_name": "",
+                "roles": [],
                 "two_fa_enabled": False,
                 "exp": 0,
                 "iat": 0,
@@ -150,6 +193,7 @@ class JWTDecodeService:
                 "email": "",
                 "first_name": "",
                 "last_name": "",
+                "roles": [],
                 "two_fa_enabled": False,
                 "exp": 0,
                 "iat": 0,
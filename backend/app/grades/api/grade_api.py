@@ -1,34 +1,102 @@
-from typing import Annotated, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Annotated, List, Literal, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
 from app.grades.dependencies.get_grade_service import get_grade_service
+from app.grades.dependencies.get_read_grade_service import get_read_grade_service
+from app.grades.repositories.grade_repo import GradeRepo
 from app.grades.services.grade_service import GradeService
-from app.grades.models.grade_model import GradeCreate, GradeUpdate, GradeResponse
+from app.grades.models.grade_model import GradeCreate, GradeUpdate, GradeResponse, GradeStatsResponse, GradeBatchError
+from core.database.pagination import Page, PageParams, get_page_params
+from core.serialization.export import ExportFormat, export_response
+from core.serialization.response import items_json, json_response, page_response
+from core.serialization.conditional import conditional_get
 
 
 router = APIRouter(prefix="/grades", tags=["grades"])
 
+BATCH_LIMIT = 500
 
-@router.get("/", response_model=List[GradeResponse], status_code=status.HTTP_200_OK)
+
+@router.get(
+    "/",
+    response_model=Page[GradeResponse],
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(conditional_get("grades"))],
+)
 async def list_grades(
-    service: Annotated[GradeService, Depends(get_grade_service)],
-    student_id: Optional[int] = Query(default=None)
+    service: Annotated[GradeService, Depends(get_read_grade_service)],
+    page: Annotated[PageParams, Depends(get_page_params)],
+    student_id: Optional[int] = Query(default=None),
+    teacher_id: Optional[int] = Query(default=None),
+    subject: Optional[str] = Query(default=None),
+):
+    grades, next_cursor = await service.list_grades(student_id, page.limit, page.after, teacher_id, subject)
+    return page_response(grades, next_cursor, GradeResponse)
+
+
+@router.get(
+    "/stats",
+    response_model=GradeStatsResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(conditional_get("grades", "grade_summary"))],
+)
+async def grade_stats(
+    service: Annotated[GradeService, Depends(get_read_grade_service)],
+    student_id: Optional[int] = Query(default=None),
+    teacher_id: Optional[int] = Query(default=None),
+    granularity: Literal["week", "month"] = Query(default="month"),
+):
+    stats = await service.grade_stats(student_id, teacher_id, granularity)
+    return GradeStatsResponse(**stats)
+
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_grades(
+    student_id: Optional[int] = Query(default=None),
+    teacher_id: Optional[int] = Query(default=None),
+    format: ExportFormat = Query(default="ndjson"),
 ):
-    grades = await service.list_grades(student_id)
-    return [GradeResponse(**g.__dict__) for g in grades]
+    """
+    Потоковая выгрузка оценок в NDJSON или CSV без загрузки всей таблицы в память.
+    """
+    return export_response(GradeRepo.export_query(student_id, teacher_id), GradeResponse, format, "grades")
 
 
-@router.get("/{grade_id}", response_model=GradeResponse, status_code=status.HTTP_200_OK)
-async def get_grade(grade_id: int, service: Annotated[GradeService, Depends(get_grade_service)]):
+@router.get(
+    "/{grade_id}",
+    response_model=GradeResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(conditional_get("grades"))],
+)
+async def get_grade(grade_id: int, service: Annotated[GradeService, Depends(get_read_grade_service)]):
     g = await service.get_grade(grade_id)
     if not g:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Grade not found")
-    return GradeResponse(**g.__dict__)
+    return GradeResponse.model_validate(g, from_attributes=True)
 
 
 @router.post("/", response_model=GradeResponse, status_code=status.HTTP_201_CREATED)
 async def create_grade(payload: GradeCreate, service: Annotated[GradeService, Depends(get_grade_service)]):
     g = await service.create_grade(payload.dict())
-    return GradeResponse(**g.__dict__)
+    return GradeResponse.model_validate(g, from_attributes=True)
+
+
+@router.post(
+    "/batch",
+    response_model=List[GradeResponse],
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": List[GradeBatchError]}},
+)
+async def create_grades(
+    payload: Annotated[List[GradeCreate], Body(min_length=1, max_length=BATCH_LIMIT)],
+    service: Annotated[GradeService, Depends(get_grade_service)],
+):
+    """
+    Создаёт пачку оценок в одной транзакции: либо все, либо ни одной (422 со списком ошибок по строкам).
+    """
+    grades, errors = await service.create_grades([g.dict() for g in payload])
+    if errors:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=errors)
+    return json_response(items_json(grades, GradeResponse), status.HTTP_201_CREATED)
 
 
 @router.patch("/{grade_id}", response_model=GradeResponse, status_code=status.HTTP_200_OK)
@@ -36,7 +104,7 @@ async def update_grade(grade_id: int, payload: GradeUpdate, service: Annotated[G
     g = await service.update_grade(grade_id, {k: v for k, v in payload.dict().items() if v is not None})
     if not g:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Grade not found")
-    return GradeResponse(**g.__dict__)
+    return GradeResponse.model_validate(g, from_attributes=True)
 
 
 @router.delete("/{grade_id}", status_code=status.HTTP_204_NO_CONTENT)
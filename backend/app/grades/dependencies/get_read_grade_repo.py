@@ -0,0 +1,11 @@
+from typing import Annotated
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.database import get_read_db
+from app.grades.repositories.grade_repo import GradeRepo
+
+
+async def get_read_grade_repo(db: Annotated[AsyncSession, Depends(get_read_db)]) -> GradeRepo:
+    return GradeRepo(db)
+
+
@@ -1,6 +1,7 @@
+import datetime
 from datetime import date
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Dict, List, Literal, Optional
 
 
 class GradeCreate(BaseModel):
@@ -12,10 +13,17 @@ class GradeCreate(BaseModel):
     comment: Optional[str] = None
 
 
+class GradeBatchError(BaseModel):
+    index: int
+    field: str
+    message: str
+
+
 class GradeUpdate(BaseModel):
     subject: Optional[str] = None
     value: Optional[int] = None
-    date: Optional[date] = None
+    # Поле date затеняет тип date в теле класса, поэтому тип указан через модуль.
+    date: Optional[datetime.date] = None
     comment: Optional[str] = None
 
 
@@ -29,3 +37,30 @@ class GradeResponse(BaseModel):
     comment: Optional[str] = None
 
 
+class GradeTrendPoint(BaseModel):
+    period: str
+    count: int
+    mean: float
+
+
+class SubjectGradeStats(BaseModel):
+    subject: str
+    count: int
+    mean: float
+    variance: float
+    min_value: int
+    max_value: int
+    last_date: date
+    distribution: Dict[int, int]
+    trend: List[GradeTrendPoint]
+
+
+class GradeStatsResponse(BaseModel):
+    student_id: Optional[int] = None
+    teacher_id: Optional[int] = None
+    granularity: Literal["week", "month"]
+    count: int
+    mean: Optional[float] = None
+    subjects: List[SubjectGradeStats]
+
+
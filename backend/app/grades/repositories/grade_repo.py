@@ -1,20 +1,133 @@
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update, delete
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy import update, delete, insert, func, case, cast, literal_column, Date, Row, Select
 from app.grades.schemas.grade_schem import Grade
+from app.grades.schemas.grade_summary_schem import GradeSummary
+from app.user.schemas.user_schem import User
+from core.database.pagination import decode_cursor, paginate
+from core.database.returning import update_returning
 
 
 class GradeRepo:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def list_grades(self, student_id: Optional[int] = None) -> List[Grade]:
-        stmt = select(Grade)
+    async def list_grades(
+        self,
+        student_id: Optional[int] = None,
+        limit: int = 50,
+        after: Optional[str] = None,
+        teacher_id: Optional[int] = None,
+        subject: Optional[str] = None,
+    ) -> Tuple[List[Row], Optional[str]]:
+        stmt = select(*Grade.__table__.columns)
         if student_id is not None:
             stmt = stmt.where(Grade.student_id == student_id)
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        if teacher_id is not None:
+            stmt = stmt.where(Grade.teacher_id == teacher_id)
+        if subject is not None:
+            stmt = stmt.where(Grade.subject == subject)
+        if after is not None:
+            (last_id,) = decode_cursor(after, int)
+            stmt = stmt.where(Grade.id > last_id)
+        result = await self.db.execute(stmt.order_by(Grade.id).limit(limit + 1))
+        return paginate(result.all(), limit, lambda g: (g.id,))
+
+    @staticmethod
+    def export_query(student_id: Optional[int] = None, teacher_id: Optional[int] = None) -> Select:
+        stmt = select(*Grade.__table__.columns)
+        if student_id is not None:
+            stmt = stmt.where(Grade.student_id == student_id)
+        if teacher_id is not None:
+            stmt = stmt.where(Grade.teacher_id == teacher_id)
+        return stmt.order_by(Grade.id)
+
+    def _period_expr(self, granularity: str):
+        # Неделя группируется по дате её понедельника на всех диалектах:
+        # у SQLite нет %G/%V, а %W даёт не ISO-номер. ISO-метку строит сервис.
+        # Для PostgreSQL аргументы — литералы, а не bind-параметры: иначе
+        # выражение в SELECT и в GROUP BY получает разные $n и не совпадает.
+        dialect = self.db.bind.dialect.name
+        if granularity == "week":
+            if dialect == "postgresql":
+                return cast(func.date_trunc(literal_column("'week'"), Grade.date), Date)
+            if dialect in ("mysql", "mariadb"):
+                return func.subdate(Grade.date, func.weekday(Grade.date))
+            return func.date(Grade.date, "-6 days", "weekday 1")
+        if dialect == "postgresql":
+            return func.to_char(Grade.date, literal_column("'YYYY-MM'"))
+        if dialect in ("mysql", "mariadb"):
+            return func.date_format(Grade.date, "%Y-%m")
+        return func.strftime("%Y-%m", Grade.date)
+
+    async def grade_stats(
+        self,
+        student_id: Optional[int] = None,
+        teacher_id: Optional[int] = None,
+        granularity: str = "month",
+    ) -> Tuple[List[Row], List[Row], List[Row]]:
+        """
+        Считает агрегаты оценок через GROUP BY на стороне БД.
+
+        Если задан только student_id, агрегаты по предметам читаются
+        из grade_summary, а GROUP BY выполняется лишь для распределения и тренда.
+
+        Возвращает:
+            Tuple: Строки (subject, count, sum, sum_sq, min, max, last_date),
+            (subject, value, count) и (subject, period, count, mean); для
+            недельной детализации period — дата понедельника недели.
+        """
+        filters = []
+        if student_id is not None:
+            filters.append(Grade.student_id == student_id)
+        if teacher_id is not None:
+            filters.append(Grade.teacher_id == teacher_id)
+
+        if student_id is not None and teacher_id is None:
+            per_subject = await self.db.execute(
+                select(
+                    GradeSummary.subject,
+                    GradeSummary.grade_count,
+                    GradeSummary.value_sum,
+                    GradeSummary.value_sum_sq,
+                    GradeSummary.min_value,
+                    GradeSummary.max_value,
+                    GradeSummary.last_date,
+                )
+                .where(GradeSummary.student_id == student_id)
+                .order_by(GradeSummary.subject)
+            )
+        else:
+            per_subject = await self.db.execute(
+                select(
+                    Grade.subject,
+                    func.count(Grade.id),
+                    func.sum(Grade.value),
+                    func.sum(Grade.value * Grade.value),
+                    func.min(Grade.value),
+                    func.max(Grade.value),
+                    func.max(Grade.date),
+                )
+                .where(*filters)
+                .group_by(Grade.subject)
+                .order_by(Grade.subject)
+            )
+        distribution = await self.db.execute(
+            select(Grade.subject, Grade.value, func.count(Grade.id))
+            .where(*filters)
+            .group_by(Grade.subject, Grade.value)
+            .order_by(Grade.subject, Grade.value)
+        )
+        period = self._period_expr(granularity).label("period")
+        trend = await self.db.execute(
+            select(Grade.subject, period, func.count(Grade.id), func.avg(Grade.value))
+            .where(*filters)
+            .group_by(Grade.subject, period)
+            .order_by(Grade.subject, period)
+        )
+        return list(per_subject.all()), list(distribution.all()), list(trend.all())
 
     async def get_grade(self, grade_id: int) -> Optional[Grade]:
         result = await self.db.execute(select(Grade).where(Grade.id == grade_id))
@@ -23,21 +136,218 @@ class GradeRepo:
     async def create_grade(self, payload: dict) -> Grade:
         grade = Grade(**payload)
         self.db.add(grade)
+        await self.db.flush()
+        await self._merge_summary([self._summary_delta(grade)])
         await self.db.commit()
         await self.db.refresh(grade)
         return grade
 
+    async def create_grades(self, payloads: List[dict]) -> List[Grade]:
+        """
+        Вставляет пачку оценок одним INSERT ... RETURNING и одним commit.
+
+        Аргументы:
+            payloads (List[dict]): Уже проверенные строки оценок.
+
+        Возвращает:
+            List[Grade]: Созданные оценки, отсортированные по id.
+        """
+        grades = await self.insert_grades(payloads)
+        await self.db.commit()
+        return grades
+
+    async def insert_grades(self, payloads: List[dict]) -> List[Grade]:
+        """
+        То же, что create_grades, но без commit — для вставки нескольких пачек в одной транзакции.
+        """
+        # sort_by_parameter_order не используется: на SQLite он отключает
+        # многострочный INSERT и возвращает по запросу на строку.
+        result = await self.db.execute(insert(Grade).returning(Grade), payloads)
+        grades = sorted(result.scalars().all(), key=lambda g: g.id)
+        await self._merge_summary(self._aggregate_deltas(grades))
+        return grades
+
+    async def existing_user_ids(self, user_ids: Set[int]) -> Set[int]:
+        result = await self.db.execute(select(User.id).where(User.id.in_(user_ids)))
+        return set(result.scalars().all())
+
     async def update_grade(self, grade_id: int, payload: dict) -> Optional[Grade]:
-        await self.db.execute(
-            update(Grade)
-            .where(Grade.id == grade_id)
-            .values(**payload)
-        )
+        # Ключ grade_summary (student_id, subject) меняется только вместе с этими
+        # полями — лишь тогда нужна прежняя строка, чтобы пересчитать и старый ключ.
+        # Правка оценки или даты обходится одним UPDATE ... RETURNING и пересчётом
+        # её собственного ключа.
+        old_key = None
+        if payload.keys() & {"student_id", "subject"}:
+            current = await self.get_grade(grade_id)
+            if current is None:
+                return None
+            old_key = (current.student_id, current.subject)
+        grade = await update_returning(self.db, Grade, grade_id, payload)
+        if grade is None:
+            return None
+        if payload.keys() & {"student_id", "subject", "value", "date"}:
+            key = (grade.student_id, grade.subject)
+            await self._recompute_summary(*key)
+            if old_key is not None and old_key != key:
+                await self._recompute_summary(*old_key)
         await self.db.commit()
-        return await self.get_grade(grade_id)
+        return grade
 
     async def delete_grade(self, grade_id: int) -> None:
+        grade = await self.get_grade(grade_id)
+        if grade is None:
+            return
         await self.db.execute(delete(Grade).where(Grade.id == grade_id))
+        await self._recompute_summary(grade.student_id, grade.subject)
         await self.db.commit()
 
+    async def rebuild_summary(self) -> int:
+        """
+        Полностью пересчитывает таблицу grade_summary по таблице grades.
+
+        Возвращает:
+            int: Количество строк в пересобранной таблице.
+        """
+        await self.db.execute(delete(GradeSummary))
+        await self.db.execute(
+            insert(GradeSummary).from_select(
+                [
+                    GradeSummary.student_id,
+                    GradeSummary.subject,
+                    GradeSummary.grade_count,
+                    GradeSummary.value_sum,
+                    GradeSummary.value_sum_sq,
+                    GradeSummary.min_value,
+                    GradeSummary.max_value,
+                    GradeSummary.last_date,
+                ],
+                self._summary_select().group_by(Grade.student_id, Grade.subject),
+            )
+        )
+        await self.db.commit()
+        return await self.db.scalar(select(func.count()).select_from(GradeSummary))
+
+    @staticmethod
+    def _summary_delta(grade: Grade) -> dict:
+        return {
+            "student_id": grade.student_id,
+            "subject": grade.subject,
+            "grade_count": 1,
+            "value_sum": grade.value,
+            "value_sum_sq": grade.value * grade.value,
+            "min_value": grade.value,
+            "max_value": grade.value,
+            "last_date": grade.date,
+        }
+
+    @classmethod
+    def _aggregate_deltas(cls, grades: List[Grade]) -> List[dict]:
+        deltas = {}
+        for grade in grades:
+            delta = cls._summary_delta(grade)
+            key = (delta["student_id"], delta["subject"])
+            merged = deltas.get(key)
+            if merged is None:
+                deltas[key] = delta
+                continue
+            merged["grade_count"] += 1
+            merged["value_sum"] += delta["value_sum"]
+            merged["value_sum_sq"] += delta["value_sum_sq"]
+            merged["min_value"] = min(merged["min_value"], delta["min_value"])
+            merged["max_value"] = max(merged["max_value"], delta["max_value"])
+            merged["last_date"] = max(merged["last_date"], delta["last_date"])
+        return list(deltas.values())
+
+    @staticmethod
+    def _summary_select():
+        return select(
+            Grade.student_id,
+            Grade.subject,
+            func.count(Grade.id),
+            func.sum(Grade.value),
+            func.sum(Grade.value * Grade.value),
+            func.min(Grade.value),
+            func.max(Grade.value),
+            func.max(Grade.date),
+        )
+
+    async def _merge_summary(self, deltas: List[dict]) -> None:
+        """
+        Прибавляет агрегаты новых оценок к grade_summary (по одной дельте на ключ).
+        """
+        dialect = self.db.bind.dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            stmt = dialect_insert(GradeSummary).values(deltas)
+            excluded = stmt.excluded
+            await self.db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[GradeSummary.student_id, GradeSummary.subject],
+                    set_={
+                        "grade_count": GradeSummary.grade_count + excluded.grade_count,
+                        "value_sum": GradeSummary.value_sum + excluded.value_sum,
+                        "value_sum_sq": GradeSummary.value_sum_sq + excluded.value_sum_sq,
+                        "min_value": case(
+                            (excluded.min_value < GradeSummary.min_value, excluded.min_value),
+                            else_=GradeSummary.min_value,
+                        ),
+                        "max_value": case(
+                            (excluded.max_value > GradeSummary.max_value, excluded.max_value),
+                            else_=GradeSummary.max_value,
+                        ),
+                        "last_date": case(
+                            (excluded.last_date > GradeSummary.last_date, excluded.last_date),
+                            else_=GradeSummary.last_date,
+                        ),
+                    },
+                )
+            )
+            return
+
+        for delta in deltas:
+            summary = await self.db.get(GradeSummary, (delta["student_id"], delta["subject"]))
+            if summary is None:
+                self.db.add(GradeSummary(**delta))
+                continue
+            summary.grade_count += delta["grade_count"]
+            summary.value_sum += delta["value_sum"]
+            summary.value_sum_sq += delta["value_sum_sq"]
+            summary.min_value = min(summary.min_value, delta["min_value"])
+            summary.max_value = max(summary.max_value, delta["max_value"])
+            summary.last_date = max(summary.last_date, delta["last_date"])
+
+    async def _recompute_summary(self, student_id: int, subject: str) -> None:
+        """
+        Пересчитывает одну строку grade_summary после изменения или удаления оценки.
+
+        Минимум, максимум и последнюю дату нельзя "вычесть", поэтому ключ
+        пересчитывается по оценкам ученика по предмету целиком.
+        """
+        row = (
+            await self.db.execute(
+                self._summary_select()
+                .where(Grade.student_id == student_id, Grade.subject == subject)
+                .group_by(Grade.student_id, Grade.subject)
+            )
+        ).first()
+        await self.db.execute(
+            delete(GradeSummary)
+            .where(GradeSummary.student_id == student_id, GradeSummary.subject == subject)
+            .execution_options(synchronize_session=False)
+        )
+        if row is not None:
+            _, _, count, value_sum, value_sum_sq, min_value, max_value, last_date = row
+            await self.db.execute(
+                insert(GradeSummary).values(
+                    student_id=student_id,
+                    subject=subject,
+                    grade_count=count,
+                    value_sum=value_sum,
+                    value_sum_sq=value_sum_sq,
+                    min_value=min_value,
+                    max_value=max_value,
+                    last_date=last_date,
+                )
+            )
+
 
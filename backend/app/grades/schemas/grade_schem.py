@@ -1,11 +1,16 @@
 from datetime import date
-from sqlalchemy import Integer, String, Date, ForeignKey
+from sqlalchemy import Integer, String, Date, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from core.database import Base
 
 
 class Grade(Base):
     __tablename__ = 'grades'
+    __table_args__ = (
+        Index('ix_grades_student_id_id', 'student_id', 'id'),
+        Index('ix_grades_teacher_id_id', 'teacher_id', 'id'),
+        Index('ix_grades_student_id_subject', 'student_id', 'subject'),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     student_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'), nullable=False)
@@ -0,0 +1,26 @@
+from datetime import date
+from sqlalchemy import Integer, String, Date, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from core.database import Base
+
+
+class GradeSummary(Base):
+    """
+    Инкрементально поддерживаемые агрегаты оценок ученика по предмету.
+
+    Обновляется GradeRepo в той же транзакции, что и сама оценка,
+    и пересобирается командой `python manage.py rebuild-grade-summary`.
+    """
+    __tablename__ = 'grade_summary'
+
+    student_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'), primary_key=True)
+    subject: Mapped[str] = mapped_column(String(100), primary_key=True)
+    grade_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    value_sum: Mapped[int] = mapped_column(Integer, nullable=False)
+    value_sum_sq: Mapped[int] = mapped_column(Integer, nullable=False)
+    min_value: Mapped[int] = mapped_column(Integer, nullable=False)
+    max_value: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+
+
@@ -1,14 +1,75 @@
-from typing import List, Optional
+from datetime import date
+from typing import List, Optional, Tuple
+from sqlalchemy import Row
 from app.grades.repositories.grade_repo import GradeRepo
 from app.grades.schemas.grade_schem import Grade
 
 
+def iso_week_label(week_start) -> str:
+    """
+    Переводит дату начала недели (date или "YYYY-MM-DD" из SQLite) в ISO-метку "2026-W01".
+    """
+    if not isinstance(week_start, date):
+        week_start = date.fromisoformat(str(week_start)[:10])
+    year, week, _ = week_start.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
 class GradeService:
     def __init__(self, repo: GradeRepo):
         self.repo = repo
 
-    async def list_grades(self, student_id: Optional[int] = None) -> List[Grade]:
-        return await self.repo.list_grades(student_id)
+    async def list_grades(
+        self,
+        student_id: Optional[int] = None,
+        limit: int = 50,
+        after: Optional[str] = None,
+        teacher_id: Optional[int] = None,
+        subject: Optional[str] = None,
+    ) -> Tuple[List[Row], Optional[str]]:
+        return await self.repo.list_grades(student_id, limit, after, teacher_id, subject)
+
+    async def grade_stats(
+        self,
+        student_id: Optional[int] = None,
+        teacher_id: Optional[int] = None,
+        granularity: str = "month",
+    ) -> dict:
+        per_subject, distribution, trend = await self.repo.grade_stats(student_id, teacher_id, granularity)
+
+        subjects = {}
+        total = 0
+        total_sum = 0
+        for subject, count, value_sum, value_sum_sq, min_value, max_value, last_date in per_subject:
+            mean = value_sum / count
+            subjects[subject] = {
+                "subject": subject,
+                "count": count,
+                "mean": round(mean, 2),
+                "variance": round(max(value_sum_sq / count - mean * mean, 0.0), 2),
+                "min_value": min_value,
+                "max_value": max_value,
+                "last_date": last_date,
+                "distribution": {},
+                "trend": [],
+            }
+            total += count
+            total_sum += value_sum
+        for subject, value, count in distribution:
+            subjects[subject]["distribution"][value] = count
+        for subject, period, count, mean in trend:
+            if granularity == "week":
+                period = iso_week_label(period)
+            subjects[subject]["trend"].append({"period": period, "count": count, "mean": round(float(mean), 2)})
+
+        return {
+            "student_id": student_id,
+            "teacher_id": teacher_id,
+            "granularity": granularity,
+            "count": total,
+            "mean": round(total_sum / total, 2) if total else None,
+            "subjects": list(subjects.values()),
+        }
 
     async def get_grade(self, grade_id: int) -> Optional[Grade]:
         return await self.repo.get_grade(grade_id)
@@ -16,10 +77,29 @@ class GradeService:
     async def create_grade(self, payload: dict) -> Grade:
         return await self.repo.create_grade(payload)
 
+    async def create_grades(self, payloads: List[dict]) -> Tuple[List[Grade], List[dict]]:
+        """
+        Проверяет все строки пачки и вставляет их только если ошибок нет.
+
+        Возвращает:
+            Tuple[List[Grade], List[dict]]: Созданные оценки и ошибки по строкам
+            (index, field, message); при наличии ошибок ничего не вставляется.
+        """
+        user_ids = {p["student_id"] for p in payloads} | {p["teacher_id"] for p in payloads}
+        existing = await self.repo.existing_user_ids(user_ids)
+        errors = []
+        for index, payload in enumerate(payloads):
+            for field in ("student_id", "teacher_id"):
+                if payload[field] not in existing:
+                    errors.append({"index": index, "field": field, "message": f"User {payload[field]} not found"})
+            if not payload["subject"].strip():
+                errors.append({"index": index, "field": "subject", "message": "Subject must not be empty"})
+        if errors:
+            return [], errors
+        return await self.repo.create_grades(payloads), []
+
     async def update_grade(self, grade_id: int, payload: dict) -> Optional[Grade]:
         return await self.repo.update_grade(grade_id, payload)
 
     async def delete_grade(self, grade_id: int) -> None:
         await self.repo.delete_grade(grade_id)
-
-
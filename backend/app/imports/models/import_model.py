@@ -0,0 +1,55 @@
+from datetime import date
+from pydantic import BaseModel, EmailStr, Field, field_validator
+from typing import List, Literal, Optional
+
+
+class UserImportRow(BaseModel):
+    email: EmailStr
+    first_name: str = Field(min_length=1)
+    last_name: str = Field(min_length=1)
+    password: str = Field(min_length=1)
+    roles: List[Literal["student", "teacher"]] = []
+
+    @field_validator("roles", mode="before")
+    @classmethod
+    def split_roles(cls, value):
+        if value is None:
+            return []
+        if isinstance(value, str):
+            return [role.strip() for role in value.split(";") if role.strip()]
+        return value
+
+
+class ScheduleImportRow(BaseModel):
+    class_name: str = Field(min_length=1)
+    weekday: int = Field(ge=1, le=7)
+    time_from: str
+    time_to: str
+    subject: str = Field(min_length=1)
+    teacher_email: Optional[EmailStr] = None
+
+
+class GradeImportRow(BaseModel):
+    student_email: EmailStr
+    teacher_email: EmailStr
+    subject: str = Field(min_length=1)
+    value: int
+    date: date
+    comment: Optional[str] = None
+
+
+class ImportIssue(BaseModel):
+    line: int
+    field: Optional[str] = None
+    message: str
+
+
+class ImportReport(BaseModel):
+    kind: Literal["users", "schedule", "grades"]
+    source: str
+    dry_run: bool = False
+    rows_total: int = 0
+    created: int = 0
+    skipped: List[ImportIssue] = []
+    errors: List[ImportIssue] = []
+    elapsed_s: float = 0.0
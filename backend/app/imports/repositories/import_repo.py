@@ -0,0 +1,69 @@
+from typing import Dict, List
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.grades.repositories.grade_repo import GradeRepo
+from app.schedule.schemas.schedule_schem import ScheduleItem
+from app.user.schemas.role_schem import Roles
+from app.user.schemas.user_schem import User
+from core.database.schemas.user_roles import user_roles
+
+
+BATCH_SIZE = 500
+
+
+def batches(rows: List[dict], size: int = BATCH_SIZE):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+class ImportRepo:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def user_ids_by_email(self) -> Dict[str, int]:
+        """
+        Одним запросом читает все email пользователей (в нижнем регистре) для проверки дубликатов по множеству.
+        """
+        result = await self.db.execute(select(User.email, User.id))
+        return {email.lower(): user_id for email, user_id in result.all()}
+
+    async def role_ids(self) -> Dict[str, int]:
+        result = await self.db.execute(select(Roles.name, Roles.id))
+        return dict(result.all())
+
+    async def insert_users(self, users: List[dict], roles: List[List[int]]) -> Dict[str, int]:
+        """
+        Вставляет пользователей и их роли пачками по BATCH_SIZE строк без commit.
+
+        Аргументы:
+            users (List[dict]): Строки таблицы users.
+            roles (List[List[int]]): ID ролей для каждого пользователя, в том же порядке.
+
+        Возвращает:
+            Dict[str, int]: ID созданных пользователей по email.
+        """
+        ids: Dict[str, int] = {}
+        for chunk in batches(users):
+            result = await self.db.execute(insert(User).returning(User.id, User.email), chunk)
+            ids.update({email: user_id for user_id, email in result.all()})
+        links = [
+            {"user_id": ids[user["email"]], "role_id": role_id}
+            for user, role_ids in zip(users, roles)
+            for role_id in role_ids
+        ]
+        for chunk in batches(links):
+            await self.db.execute(insert(user_roles), chunk)
+        return ids
+
+    async def insert_schedule(self, items: List[dict]) -> None:
+        for chunk in batches(items):
+            await self.db.execute(insert(ScheduleItem), chunk)
+
+    async def insert_grades(self, grades: List[dict]) -> None:
+        grade_repo = GradeRepo(self.db)
+        for chunk in batches(grades):
+            await grade_repo.insert_grades(chunk)
+
+    async def commit(self) -> None:
+        await self.db.commit()
@@ -0,0 +1,156 @@
+import asyncio
+import csv
+import time
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Type
+from pydantic import BaseModel, ValidationError
+from app.imports.models.import_model import (
+    GradeImportRow,
+    ImportIssue,
+    ImportReport,
+    ScheduleImportRow,
+    UserImportRow,
+)
+from app.imports.repositories.import_repo import ImportRepo
+from app.schedule.services.schedule_cache import ScheduleCache, schedule_cache
+from core.security.password import get_hashing_executor, get_password_hash, is_password_hash
+
+
+def read_rows(path: Path, model: Type[BaseModel], report: ImportReport) -> Iterator[Tuple[int, BaseModel]]:
+    """
+    Читает CSV с заголовком и проверяет каждую строку моделью.
+
+    Пустые ячейки считаются отсутствующими значениями. Ошибки валидации
+    попадают в report.errors с номером строки файла, а сами строки пропускаются.
+    """
+    with path.open(newline="", encoding="utf-8-sig") as file:
+        for line, raw in enumerate(csv.DictReader(file), start=2):
+            report.rows_total += 1
+            data = {key.strip(): (value.strip() or None) if value is not None else None for key, value in raw.items() if key}
+            try:
+                yield line, model.model_validate({k: v for k, v in data.items() if v is not None})
+            except ValidationError as exc:
+                for error in exc.errors():
+                    field = ".".join(str(part) for part in error["loc"]) or None
+                    report.errors.append(ImportIssue(line=line, field=field, message=error["msg"]))
+
+
+class ImportService:
+    def __init__(
+        self,
+        repo: ImportRepo,
+        hashing_executor: Optional[Executor] = None,
+        cache: ScheduleCache = schedule_cache,
+    ):
+        self.repo = repo
+        self.hashing_executor = hashing_executor or get_hashing_executor()
+        self.cache = cache
+
+    async def _hash_passwords(self, passwords: List[str]) -> List[bytes]:
+        # bcrypt освобождает GIL, поэтому хеши считаются параллельно на всех потоках пула.
+        # Готовые bcrypt-хеши из прежней системы переносятся как есть.
+        loop = asyncio.get_running_loop()
+
+        async def hash_one(password: str) -> bytes:
+            if is_password_hash(password):
+                return password.encode("utf-8")
+            return await loop.run_in_executor(self.hashing_executor, get_password_hash, password)
+
+        return await asyncio.gather(*(hash_one(password) for password in passwords))
+
+    async def _finish(self, report: ImportReport, started: float, dry_run: bool) -> ImportReport:
+        if not dry_run and report.created:
+            await self.repo.commit()
+        report.elapsed_s = round(time.perf_counter() - started, 3)
+        return report
+
+    async def import_users(self, path: Path, dry_run: bool = False) -> ImportReport:
+        started = time.perf_counter()
+        report = ImportReport(kind="users", source=str(path), dry_run=dry_run)
+        known = await self.repo.user_ids_by_email()
+        role_ids = await self.repo.role_ids()
+
+        rows: List[UserImportRow] = []
+        for line, row in read_rows(path, UserImportRow, report):
+            email = row.email.lower()
+            if email in known:
+                report.skipped.append(ImportIssue(line=line, field="email", message=f"User {row.email} already exists"))
+                continue
+            # Роль без записи в таблице roles не выдаётся молча: строка целиком уходит в ошибки.
+            missing = [role for role in row.roles if role not in role_ids]
+            if missing:
+                for role in missing:
+                    report.errors.append(ImportIssue(line=line, field="roles", message=f"Role {role} not found"))
+                continue
+            known[email] = 0
+            rows.append(row)
+
+        report.created = len(rows)
+        if dry_run or not rows:
+            return await self._finish(report, started, dry_run)
+
+        hashes = await self._hash_passwords([row.password for row in rows])
+        await self.repo.insert_users(
+            [
+                {"email": row.email, "first_name": row.first_name, "last_name": row.last_name, "hased_password": hashed}
+                for row, hashed in zip(rows, hashes)
+            ],
+            [[role_ids[role] for role in row.roles] for row in rows],
+        )
+        return await self._finish(report, started, dry_run)
+
+    async def import_schedule(self, path: Path, dry_run: bool = False) -> ImportReport:
+        started = time.perf_counter()
+        report = ImportReport(kind="schedule", source=str(path), dry_run=dry_run)
+        users = await self.repo.user_ids_by_email()
+
+        items: List[dict] = []
+        for line, row in read_rows(path, ScheduleImportRow, report):
+            teacher_id = None
+            if row.teacher_email is not None:
+                teacher_id = users.get(row.teacher_email.lower())
+                if teacher_id is None:
+                    report.errors.append(
+                        ImportIssue(line=line, field="teacher_email", message=f"User {row.teacher_email} not found")
+                    )
+                    continue
+            items.append({**row.model_dump(exclude={"teacher_email"}), "teacher_id": teacher_id})
+
+        report.created = len(items)
+        if dry_run or not items:
+            return await self._finish(report, started, dry_run)
+
+        await self.repo.insert_schedule(items)
+        report = await self._finish(report, started, dry_run)
+        # Кеш страниц GET /schedule (в Redis — общий для воркеров) сбрасывается
+        # после commit, как в ScheduleService.
+        await self.cache.invalidate({item["class_name"] for item in items})
+        return report
+
+    async def import_grades(self, path: Path, dry_run: bool = False) -> ImportReport:
+        started = time.perf_counter()
+        report = ImportReport(kind="grades", source=str(path), dry_run=dry_run)
+        users = await self.repo.user_ids_by_email()
+
+        grades: List[dict] = []
+        for line, row in read_rows(path, GradeImportRow, report):
+            ids: Dict[str, int] = {}
+            for field in ("student_email", "teacher_email"):
+                user_id = users.get(getattr(row, field).lower())
+                if user_id is None:
+                    report.errors.append(ImportIssue(line=line, field=field, message=f"User {getattr(row, field)} not found"))
+                else:
+                    ids[field] = user_id
+            if len(ids) < 2:
+                continue
+            grades.append({
+                **row.model_dump(exclude={"student_email", "teacher_email"}),
+                "student_id": ids["student_email"],
+                "teacher_id": ids["teacher_email"],
+            })
+
+        report.created = len(grades)
+        if not dry_run and grades:
+            await self.repo.insert_grades(grades)
+        return await self._finish(report, started, dry_run)
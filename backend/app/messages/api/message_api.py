@@ -1,13 +1,34 @@
 from typing import Annotated, List, Optional
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, status
+from app.messages.dependencies.get_conversation_service import get_conversation_service
 from app.messages.dependencies.get_message_service import get_message_service
+from app.messages.dependencies.get_read_message_service import get_read_message_service
+from app.messages.dependencies.get_realtime_service import get_realtime_service
+from app.messages.repositories.message_repo import MessageRepo
+from app.messages.services.conversation_service import ConversationService
 from app.messages.services.message_service import MessageService
-from app.messages.models.message_model import MessageCreate, MessageResponse
+from app.messages.services.realtime_service import RealtimeService
+from app.messages.models.message_model import (
+    ConversationReadResponse,
+    ConversationSummary,
+    MessageCreate,
+    MessageResponse,
+    MessageSyncResponse,
+)
 from app.auth.dependencies.get_current_user_id import get_current_user_id
+from core.database.pagination import Page, PageParams, get_page_params
+from core.serialization.export import ExportFormat, export_response
+from core.serialization.response import envelope, items_json, json_response, page_response
+from core.serialization.conditional import conditional_get
+from core.config import config
 
 
 router = APIRouter(prefix="/messages", tags=["messages"])
 
+conversation_conditional_get = conditional_get(
+    "conversations", "conversation_participants", "messages", primary=True, vary_on_user=get_current_user_id
+)
+
 
 @router.post("/", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
 async def send_message(
@@ -16,17 +37,160 @@ async def send_message(
 ):
     data = payload.dict()
     m = await service.send(data)
-    return MessageResponse(**m.__dict__)
+    return MessageResponse.model_validate(m, from_attributes=True)
 
 
-@router.get("/", response_model=List[MessageResponse], status_code=status.HTTP_200_OK)
+@router.get(
+    "/",
+    response_model=Page[MessageResponse],
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(conditional_get("messages"))],
+)
 async def list_messages(
-    service: Annotated[MessageService, Depends(get_message_service)],
+    service: Annotated[MessageService, Depends(get_read_message_service)],
+    page: Annotated[PageParams, Depends(get_page_params)],
     from_id: Optional[int] = Query(default=None),
     to_id: Optional[int] = Query(default=None),
     class_name: Optional[str] = Query(default=None),
 ):
-    messages = await service.list_messages(from_id, to_id, class_name)
-    return [MessageResponse(**m.__dict__) for m in messages]
+    messages, next_cursor = await service.list_messages(from_id, to_id, class_name, page.limit, page.after)
+    return page_response(messages, next_cursor, MessageResponse)
+
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_messages(
+    from_id: Optional[int] = Query(default=None),
+    to_id: Optional[int] = Query(default=None),
+    class_name: Optional[str] = Query(default=None),
+    format: ExportFormat = Query(default="ndjson"),
+):
+    """
+    Потоковая выгрузка сообщений в NDJSON или CSV без загрузки всей таблицы в память.
+    """
+    return export_response(MessageRepo.export_query(from_id, to_id, class_name), MessageResponse, format, "messages")
+
 
+@router.get(
+    "/inbox",
+    response_model=Page[ConversationSummary],
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(conversation_conditional_get)],
+)
+async def inbox(
+    service: Annotated[ConversationService, Depends(get_conversation_service)],
+    user_id: Annotated[int, Depends(get_current_user_id)],
+    page: Annotated[PageParams, Depends(get_page_params)],
+):
+    """
+    Последние ветки текущего пользователя с превью последнего сообщения и счётчиком непрочитанных.
+
+    Ограничение: в схеме нет состава классов (у пользователя нет класса), поэтому
+    участники чата класса не создаются заранее. Чат класса появляется во входящих
+    пользователя только после того, как он сам написал в него или открыл его
+    (POST /messages/conversations/{id}/read); до этого новые сообщения класса
+    здесь не видны и в unread_count не учитываются.
+    """
+    items, next_cursor = await service.inbox(user_id, page.limit, page.after)
+    return Page[ConversationSummary](
+        items=[ConversationSummary(**item) for item in items],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    "/conversations/{conversation_id}/messages",
+    response_model=Page[MessageResponse],
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(conversation_conditional_get)],
+)
+async def list_conversation_messages(
+    conversation_id: int,
+    service: Annotated[ConversationService, Depends(get_conversation_service)],
+    user_id: Annotated[int, Depends(get_current_user_id)],
+    page: Annotated[PageParams, Depends(get_page_params)],
+):
+    conversation = await service.get_for_user(conversation_id, user_id)
+    if not conversation:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
+    messages, next_cursor = await service.list_thread(conversation.id, page.limit, page.after)
+    return page_response(messages, next_cursor, MessageResponse)
+
+
+@router.post(
+    "/conversations/{conversation_id}/read",
+    response_model=ConversationReadResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def mark_conversation_read(
+    conversation_id: int,
+    service: Annotated[ConversationService, Depends(get_conversation_service)],
+    user_id: Annotated[int, Depends(get_current_user_id)],
+):
+    conversation = await service.get_for_user(conversation_id, user_id)
+    if not conversation:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
+    participant = await service.mark_read(conversation, user_id)
+    return ConversationReadResponse(
+        conversation_id=participant.conversation_id,
+        unread_count=participant.unread_count,
+        last_read_message_id=participant.last_read_message_id,
+    )
+
+
+@router.get(
+    "/sync",
+    response_model=MessageSyncResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(conditional_get("messages"))],
+)
+async def sync_messages(
+    service: Annotated[MessageService, Depends(get_read_message_service)],
+    since_id: int = Query(default=0, ge=0, description="Последний известный клиенту id сообщения"),
+    from_id: Optional[int] = Query(default=None),
+    to_id: Optional[int] = Query(default=None),
+    class_name: Optional[str] = Query(default=None),
+    limit: int = Query(default=config.pagination.default_limit, ge=1, le=config.pagination.max_limit),
+):
+    """
+    Инкрементальная синхронизация: только сообщения с id больше since_id.
+
+    Если новых сообщений нет, возвращается пустой список и тот же watermark.
+    """
+    messages, watermark, has_more = await service.sync_messages(since_id, from_id, to_id, class_name, limit)
+    return json_response(envelope(items_json(messages, MessageResponse), watermark=watermark, has_more=has_more))
+
+
+@router.get("/poll", response_model=List[MessageResponse], status_code=status.HTTP_200_OK)
+async def poll_messages(
+    realtime: Annotated[RealtimeService, Depends(get_realtime_service)],
+    after_id: int = Query(ge=0, description="Последний известный клиенту id сообщения"),
+    from_id: Optional[int] = Query(default=None),
+    to_id: Optional[int] = Query(default=None),
+    class_name: Optional[str] = Query(default=None),
+    timeout: int = Query(default=config.realtime.long_poll_timeout_seconds, ge=0, le=60),
+):
+    """
+    Long-poll: блокируется, пока не появится сообщение с id больше after_id, или до истечения timeout.
+    """
+    messages = await realtime.wait_for_messages(after_id, timeout, from_id, to_id, class_name)
+    return [MessageResponse(**m) for m in messages]
+
+
+@router.websocket("/ws")
+async def messages_ws(
+    websocket: WebSocket,
+    realtime: Annotated[RealtimeService, Depends(get_realtime_service)],
+    token: str = Query(),
+    class_name: List[str] = Query(default=[]),
+    after_id: Optional[int] = Query(default=None, ge=0),
+):
+    """
+    Push-канал новых сообщений: личные сообщения пользователя из токена и сообщения указанных классов.
+    """
+    user_id = await realtime.authenticate(token)
+    if user_id is None:
+        await websocket.close(code=1008)
+        return
+    await websocket.accept()
+    await realtime.stream(websocket, user_id, class_name, after_id)
 
@@ -0,0 +1,11 @@
+from typing import Annotated
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.database import get_db
+from app.messages.repositories.conversation_repo import ConversationRepo
+
+
+async def get_conversation_repo(db: Annotated[AsyncSession, Depends(get_db)]) -> ConversationRepo:
+    return ConversationRepo(db)
+
+
@@ -0,0 +1,13 @@
+from typing import Annotated
+from fastapi import Depends
+from app.messages.repositories.conversation_repo import ConversationRepo
+from app.messages.services.conversation_service import ConversationService
+from app.messages.dependencies.get_conversation_repo import get_conversation_repo
+
+
+async def get_conversation_service(
+    repo: Annotated[ConversationRepo, Depends(get_conversation_repo)],
+) -> ConversationService:
+    return ConversationService(repo)
+
+
@@ -0,0 +1,11 @@
+from typing import Annotated
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.database import get_read_db
+from app.messages.repositories.message_repo import MessageRepo
+
+
+async def get_read_message_repo(db: Annotated[AsyncSession, Depends(get_read_db)]) -> MessageRepo:
+    return MessageRepo(db)
+
+
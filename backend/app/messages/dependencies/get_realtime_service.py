@@ -0,0 +1,7 @@
+from app.messages.services.realtime_service import RealtimeService
+
+
+async def get_realtime_service() -> RealtimeService:
+    return RealtimeService()
+
+
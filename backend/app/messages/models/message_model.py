@@ -15,7 +15,30 @@ class MessageResponse(BaseModel):
     from_id: int
     to_id: Optional[int] = None
     class_name: Optional[str] = None
+    conversation_id: Optional[int] = None
     content: str
     created_at: datetime
 
 
+class MessageSyncResponse(BaseModel):
+    items: List[MessageResponse]
+    watermark: int
+    has_more: bool = False
+
+
+class ConversationSummary(BaseModel):
+    id: int
+    kind: str
+    peer_id: Optional[int] = None
+    class_name: Optional[str] = None
+    message_count: int
+    unread_count: int
+    last_message_at: Optional[datetime] = None
+    last_message: Optional[MessageResponse] = None
+    preview: Optional[str] = None
+
+
+class ConversationReadResponse(BaseModel):
+    conversation_id: int
+    unread_count: int
+    last_read_message_id: int
@@ -0,0 +1,174 @@
+from typing import List, Optional, Tuple
+from sqlalchemy import Row, and_, or_, update, case
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.messages.schemas.conversation_schem import Conversation, ConversationParticipant
+from app.messages.schemas.message_schem import Message
+from core.database.pagination import decode_cursor, paginate
+
+
+def conversation_key(from_id: int, to_id: Optional[int], class_name: Optional[str]) -> Optional[str]:
+    if to_id is not None:
+        low, high = sorted((from_id, to_id))
+        return f"direct:{low}:{high}"
+    if class_name is not None:
+        return f"class:{class_name}"
+    return None
+
+
+class ConversationRepo:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _insert_ignore(self, model, rows: List[dict], index_elements: list) -> None:
+        dialect = self.db.bind.dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            await self.db.execute(
+                dialect_insert(model).values(rows).on_conflict_do_nothing(index_elements=index_elements)
+            )
+            return
+
+        for row in rows:
+            conditions = [getattr(model, column.key) == row[column.key] for column in index_elements]
+            existing = await self.db.execute(select(model).where(*conditions))
+            if existing.scalar_one_or_none() is None:
+                self.db.add(model(**row))
+        await self.db.flush()
+
+    async def get_or_create(self, from_id: int, to_id: Optional[int], class_name: Optional[str]) -> Optional[int]:
+        key = conversation_key(from_id, to_id, class_name)
+        if key is None:
+            return None
+        row = {"key": key, "message_count": 0}
+        if to_id is not None:
+            row.update(kind="direct", user_low_id=min(from_id, to_id), user_high_id=max(from_id, to_id))
+        else:
+            row.update(kind="class", class_name=class_name)
+        await self._insert_ignore(Conversation, [row], [Conversation.key])
+        result = await self.db.execute(select(Conversation.id).where(Conversation.key == key))
+        return result.scalar_one()
+
+    async def record_message(self, msg: Message) -> None:
+        """
+        Обновляет денормализованные поля ветки и счётчики непрочитанных после вставки сообщения.
+
+        Вызывается в транзакции отправки до commit, поэтому ветка и сообщение
+        всегда согласованы.
+
+        Участниками становятся только отправитель и получатель. Для чата класса
+        состав класса неизвестен, и остальные ученики добавляются при первом
+        прочтении (mark_read), см. docstring маршрута /messages/inbox.
+        """
+        participants = {msg.from_id}
+        if msg.to_id is not None:
+            participants.add(msg.to_id)
+        await self._insert_ignore(
+            ConversationParticipant,
+            [
+                {"conversation_id": msg.conversation_id, "user_id": user_id, "unread_count": 0,
+                 "last_read_message_id": 0, "last_message_id": msg.id}
+                for user_id in sorted(participants)
+            ],
+            [ConversationParticipant.conversation_id, ConversationParticipant.user_id],
+        )
+        await self.db.execute(
+            update(Conversation)
+            .where(Conversation.id == msg.conversation_id)
+            .values(
+                last_message_id=msg.id,
+                last_message_at=select(Message.created_at).where(Message.id == msg.id).scalar_subquery(),
+                message_count=Conversation.message_count + 1,
+            )
+        )
+        is_sender = ConversationParticipant.user_id == msg.from_id
+        await self.db.execute(
+            update(ConversationParticipant)
+            .where(ConversationParticipant.conversation_id == msg.conversation_id)
+            .values(
+                last_message_id=msg.id,
+                unread_count=case((is_sender, 0), else_=ConversationParticipant.unread_count + 1),
+                last_read_message_id=case((is_sender, msg.id), else_=ConversationParticipant.last_read_message_id),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def inbox(
+        self,
+        user_id: int,
+        limit: int = 50,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Tuple[ConversationParticipant, Conversation, Optional[Message]]], Optional[str]]:
+        stmt = (
+            select(ConversationParticipant, Conversation, Message)
+            .join(Conversation, Conversation.id == ConversationParticipant.conversation_id)
+            .outerjoin(Message, Message.id == Conversation.last_message_id)
+            .where(ConversationParticipant.user_id == user_id)
+        )
+        if after is not None:
+            last_message_id, conversation_id = decode_cursor(after, int, int)
+            stmt = stmt.where(
+                or_(
+                    ConversationParticipant.last_message_id < last_message_id,
+                    and_(
+                        ConversationParticipant.last_message_id == last_message_id,
+                        ConversationParticipant.conversation_id < conversation_id,
+                    ),
+                )
+            )
+        result = await self.db.execute(
+            stmt.order_by(
+                ConversationParticipant.last_message_id.desc(),
+                ConversationParticipant.conversation_id.desc(),
+            ).limit(limit + 1)
+        )
+        rows = [tuple(row) for row in result.all()]
+        return paginate(rows, limit, lambda row: (row[0].last_message_id, row[0].conversation_id))
+
+    async def get_for_user(self, conversation_id: int, user_id: int) -> Optional[Conversation]:
+        """
+        Возвращает ветку, если пользователь может её читать: участник личного диалога или любой пользователь для чата класса.
+        """
+        conversation = await self.db.get(Conversation, conversation_id)
+        if conversation is None:
+            return None
+        if conversation.kind == "direct" and user_id not in (conversation.user_low_id, conversation.user_high_id):
+            return None
+        return conversation
+
+    async def list_thread(
+        self,
+        conversation_id: int,
+        limit: int = 50,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Row], Optional[str]]:
+        stmt = select(*Message.__table__.columns).where(Message.conversation_id == conversation_id)
+        if after is not None:
+            (last_id,) = decode_cursor(after, int)
+            stmt = stmt.where(Message.id > last_id)
+        result = await self.db.execute(stmt.order_by(Message.id).limit(limit + 1))
+        return paginate(result.all(), limit, lambda m: (m.id,))
+
+    async def mark_read(self, conversation: Conversation, user_id: int) -> ConversationParticipant:
+        last_message_id = conversation.last_message_id or 0
+        # Чат класса может читать и тот, кто ещё ничего в него не писал, — он становится участником.
+        await self._insert_ignore(
+            ConversationParticipant,
+            [{"conversation_id": conversation.id, "user_id": user_id, "unread_count": 0,
+              "last_read_message_id": last_message_id, "last_message_id": last_message_id}],
+            [ConversationParticipant.conversation_id, ConversationParticipant.user_id],
+        )
+        await self.db.execute(
+            update(ConversationParticipant)
+            .where(
+                ConversationParticipant.conversation_id == conversation.id,
+                ConversationParticipant.user_id == user_id,
+            )
+            .values(unread_count=0, last_read_message_id=last_message_id)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        return await self.db.get(
+            ConversationParticipant, (conversation.id, user_id), populate_existing=True
+        )
@@ -1,7 +1,11 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import Row, Select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from app.messages.repositories.conversation_repo import ConversationRepo
 from app.messages.schemas.message_schem import Message
+from app.messages.services.message_hub import message_hub
+from core.database.pagination import decode_cursor, paginate
 
 
 class MessageRepo:
@@ -9,26 +13,106 @@ class MessageRepo:
         self.db = db
 
     async def send(self, payload: dict) -> Message:
-        msg = Message(**payload)
+        conversations = ConversationRepo(self.db)
+        conversation_id = await conversations.get_or_create(
+            payload["from_id"], payload.get("to_id"), payload.get("class_name")
+        )
+        msg = Message(**payload, conversation_id=conversation_id)
         self.db.add(msg)
+        await self.db.flush()
+        if conversation_id is not None:
+            await conversations.record_message(msg)
         await self.db.commit()
         await self.db.refresh(msg)
+        message_hub.publish(self.to_dict(msg))
         return msg
 
+    @staticmethod
+    def to_dict(msg: Message) -> dict:
+        return {
+            "id": msg.id,
+            "from_id": msg.from_id,
+            "to_id": msg.to_id,
+            "class_name": msg.class_name,
+            "conversation_id": msg.conversation_id,
+            "content": msg.content,
+            "created_at": msg.created_at,
+        }
+
     async def list_messages(
         self,
         from_id: Optional[int] = None,
         to_id: Optional[int] = None,
         class_name: Optional[str] = None,
-    ) -> List[Message]:
-        stmt = select(Message)
+        limit: int = 50,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Row], Optional[str]]:
+        stmt = select(*Message.__table__.columns)
         if from_id is not None:
             stmt = stmt.where(Message.from_id == from_id)
         if to_id is not None:
             stmt = stmt.where(Message.to_id == to_id)
         if class_name is not None:
             stmt = stmt.where(Message.class_name == class_name)
-        result = await self.db.execute(stmt.order_by(Message.created_at))
-        return list(result.scalars().all())
+        if after is not None:
+            (last_id,) = decode_cursor(after, int)
+            stmt = stmt.where(Message.id > last_id)
+        # created_at заполняется server_default при вставке, поэтому порядок id
+        # совпадает с хронологическим и не зависит от точности хранения даты в SQLite.
+        result = await self.db.execute(stmt.order_by(Message.id).limit(limit + 1))
+        return paginate(result.all(), limit, lambda m: (m.id,))
+
+    @staticmethod
+    def export_query(
+        from_id: Optional[int] = None,
+        to_id: Optional[int] = None,
+        class_name: Optional[str] = None,
+    ) -> Select:
+        stmt = select(*Message.__table__.columns)
+        if from_id is not None:
+            stmt = stmt.where(Message.from_id == from_id)
+        if to_id is not None:
+            stmt = stmt.where(Message.to_id == to_id)
+        if class_name is not None:
+            stmt = stmt.where(Message.class_name == class_name)
+        return stmt.order_by(Message.id)
 
+    async def list_since(
+        self,
+        after_id: int,
+        limit: int,
+        from_id: Optional[int] = None,
+        to_id: Optional[int] = None,
+        class_name: Optional[str] = None,
+    ) -> List[Row]:
+        stmt = select(*Message.__table__.columns).where(Message.id > after_id)
+        if from_id is not None:
+            stmt = stmt.where(Message.from_id == from_id)
+        if to_id is not None:
+            stmt = stmt.where(Message.to_id == to_id)
+        if class_name is not None:
+            stmt = stmt.where(Message.class_name == class_name)
+        result = await self.db.execute(stmt.order_by(Message.id).limit(limit))
+        return list(result.all())
+
+    async def list_for_subscriber(
+        self,
+        after_id: int,
+        limit: int,
+        user_id: int,
+        class_names: Sequence[str] = (),
+    ) -> List[Message]:
+        audience = [Message.from_id == user_id, Message.to_id == user_id]
+        if class_names:
+            audience.append(Message.class_name.in_(class_names))
+        result = await self.db.execute(
+            select(Message)
+            .where(Message.id > after_id, or_(*audience))
+            .order_by(Message.id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
 
+    async def last_id(self) -> int:
+        result = await self.db.execute(select(Message.id).order_by(Message.id.desc()).limit(1))
+        return result.scalar() or 0
@@ -0,0 +1,45 @@
+from datetime import datetime
+from sqlalchemy import Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from core.database import Base
+
+
+class Conversation(Base):
+    """
+    Ветка переписки: личный диалог двух пользователей или чат класса.
+
+    key однозначно определяет ветку ("direct:<меньший id>:<больший id>" или "class:<класс>"),
+    last_message_* и message_count денормализованы и обновляются MessageRepo.send.
+    """
+    __tablename__ = 'conversations'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    key: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    kind: Mapped[str] = mapped_column(String(10), nullable=False)
+    user_low_id: Mapped[int | None] = mapped_column(Integer, ForeignKey('users.id'), nullable=True)
+    user_high_id: Mapped[int | None] = mapped_column(Integer, ForeignKey('users.id'), nullable=True)
+    class_name: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    last_message_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    last_message_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    message_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class ConversationParticipant(Base):
+    """
+    Участник ветки со своим счётчиком непрочитанных сообщений.
+
+    last_message_id дублирует значение из conversations, чтобы inbox пользователя
+    читался одним проходом по индексу (user_id, last_message_id, conversation_id).
+    """
+    __tablename__ = 'conversation_participants'
+    __table_args__ = (
+        Index(
+            'ix_conversation_participants_inbox', 'user_id', 'last_message_id', 'conversation_id',
+        ),
+    )
+
+    conversation_id: Mapped[int] = mapped_column(Integer, ForeignKey('conversations.id'), primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'), primary_key=True)
+    unread_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_read_message_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_message_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -1,15 +1,22 @@
-from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, func
+from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 from core.database import Base
 
 
 class Message(Base):
     __tablename__ = 'messages'
+    __table_args__ = (
+        Index('ix_messages_from_id_id', 'from_id', 'id'),
+        Index('ix_messages_to_id_id', 'to_id', 'id'),
+        Index('ix_messages_class_name_id', 'class_name', 'id'),
+        Index('ix_messages_conversation_id_id', 'conversation_id', 'id'),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     from_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'), nullable=False)
     to_id: Mapped[int | None] = mapped_column(Integer, ForeignKey('users.id'), nullable=True)
     class_name: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    conversation_id: Mapped[int | None] = mapped_column(Integer, ForeignKey('conversations.id'), nullable=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[DateTime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
 
@@ -0,0 +1,47 @@
+from typing import List, Optional, Tuple
+from sqlalchemy import Row
+from app.messages.repositories.conversation_repo import ConversationRepo
+from app.messages.repositories.message_repo import MessageRepo
+from app.messages.schemas.conversation_schem import Conversation, ConversationParticipant
+
+
+PREVIEW_LENGTH = 100
+
+
+class ConversationService:
+    def __init__(self, repo: ConversationRepo):
+        self.repo = repo
+
+    async def inbox(self, user_id: int, limit: int = 50, after: Optional[str] = None) -> Tuple[List[dict], Optional[str]]:
+        rows, next_cursor = await self.repo.inbox(user_id, limit, after)
+        items = []
+        for participant, conversation, last_message in rows:
+            peer_id = None
+            if conversation.kind == "direct":
+                peer_id = conversation.user_high_id if conversation.user_low_id == user_id else conversation.user_low_id
+            items.append({
+                "id": conversation.id,
+                "kind": conversation.kind,
+                "peer_id": peer_id,
+                "class_name": conversation.class_name,
+                "message_count": conversation.message_count,
+                "unread_count": participant.unread_count,
+                "last_message_at": conversation.last_message_at,
+                "last_message": MessageRepo.to_dict(last_message) if last_message is not None else None,
+                "preview": last_message.content[:PREVIEW_LENGTH] if last_message is not None else None,
+            })
+        return items, next_cursor
+
+    async def get_for_user(self, conversation_id: int, user_id: int) -> Optional[Conversation]:
+        return await self.repo.get_for_user(conversation_id, user_id)
+
+    async def list_thread(
+        self,
+        conversation_id: int,
+        limit: int = 50,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Row], Optional[str]]:
+        return await self.repo.list_thread(conversation_id, limit, after)
+
+    async def mark_read(self, conversation: Conversation, user_id: int) -> ConversationParticipant:
+        return await self.repo.mark_read(conversation, user_id)
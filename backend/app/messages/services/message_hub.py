@@ -0,0 +1,96 @@
+import asyncio
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+from core.config import config
+
+
+ALL_TOPIC = "*"
+
+
+def user_topic(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def class_topic(class_name: str) -> str:
+    return f"class:{class_name}"
+
+
+def message_topics(message: Dict[str, Any]) -> List[str]:
+    topics = [ALL_TOPIC, user_topic(message["from_id"])]
+    if message.get("to_id") is not None:
+        topics.append(user_topic(message["to_id"]))
+    if message.get("class_name"):
+        topics.append(class_topic(message["class_name"]))
+    return topics
+
+
+class MessageHub:
+    """
+    Внутрипроцессный pub/sub для новых сообщений.
+
+    Каждый подписчик получает собственную ограниченную очередь. Если подписчик
+    не успевает её разбирать, новые события для него отбрасываются — он догонит
+    пропущенное из БД при следующей ресинхронизации по id. Хаб живёт в одном
+    воркере uvicorn, поэтому подписчики периодически перечитывают БД, чтобы
+    получить сообщения, отправленные через другие воркеры.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+
+    @contextmanager
+    def subscribe(self, topics: Iterable[str]) -> Iterator[asyncio.Queue]:
+        """
+        Подписывает новую очередь на набор топиков на время блока with.
+
+        Аргументы:
+            topics (Iterable[str]): Топики (user:<id>, class:<name> или "*").
+
+        Возвращает:
+            asyncio.Queue: Очередь, в которую попадают словари сообщений.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        topics = set(topics)
+        for topic in topics:
+            self._subscribers[topic].add(queue)
+        try:
+            yield queue
+        finally:
+            for topic in topics:
+                subscribers = self._subscribers.get(topic)
+                if subscribers is not None:
+                    subscribers.discard(queue)
+                    if not subscribers:
+                        del self._subscribers[topic]
+
+    def publish(self, message: Dict[str, Any]) -> int:
+        """
+        Рассылает сообщение всем подписчикам его топиков.
+
+        Аргументы:
+            message (Dict[str, Any]): Сериализуемое представление сообщения.
+
+        Возвращает:
+            int: Количество очередей, в которые сообщение было доставлено.
+        """
+        delivered: Set[int] = set()
+        for topic in message_topics(message):
+            for queue in self._subscribers.get(topic, ()):
+                if id(queue) in delivered:
+                    continue
+                delivered.add(id(queue))
+                try:
+                    queue.put_nowait(message)
+                except asyncio.QueueFull:
+                    pass
+        return len(delivered)
+
+    def subscriber_count(self, topic: Optional[str] = None) -> int:
+        if topic is not None:
+            return len(self._subscribers.get(topic, ()))
+        return len({id(q) for queues in self._subscribers.values() for q in queues})
+
+
+message_hub = MessageHub(queue_size=config.realtime.subscriber_queue_size)
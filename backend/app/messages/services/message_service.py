@@ -1,4 +1,5 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from sqlalchemy import Row
 from app.messages.repositories.message_repo import MessageRepo
 from app.messages.schemas.message_schem import Message
 
@@ -15,7 +16,23 @@ class MessageService:
         from_id: Optional[int] = None,
         to_id: Optional[int] = None,
         class_name: Optional[str] = None,
-    ) -> List[Message]:
-        return await self.repo.list_messages(from_id, to_id, class_name)
+        limit: int = 50,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Row], Optional[str]]:
+        return await self.repo.list_messages(from_id, to_id, class_name, limit, after)
+
+    async def sync_messages(
+        self,
+        since_id: int,
+        from_id: Optional[int] = None,
+        to_id: Optional[int] = None,
+        class_name: Optional[str] = None,
+        limit: int = 50,
+    ) -> Tuple[List[Row], int, bool]:
+        messages = await self.repo.list_since(since_id, limit + 1, from_id, to_id, class_name)
+        has_more = len(messages) > limit
+        messages = messages[:limit]
+        watermark = messages[-1].id if messages else since_id
+        return messages, watermark, has_more
 
 
@@ -0,0 +1,179 @@
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Sequence, Set
+from fastapi import WebSocket, WebSocketDisconnect
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.auth.repositories.auth_repo import AuthRepo
+from app.auth.services.jwt_decode_service import JWTDecodeService
+from app.messages.models.message_model import MessageResponse
+from app.messages.repositories.message_repo import MessageRepo
+from app.messages.schemas.message_schem import Message
+from app.messages.services.message_hub import (
+    ALL_TOPIC,
+    MessageHub,
+    class_topic,
+    message_hub,
+    user_topic,
+)
+from core.config import config
+from core.database.db import async_session_maker
+
+
+class RealtimeService:
+    """
+    Доставка новых сообщений через WebSocket и long-poll.
+
+    Ожидание строится на внутрипроцессном MessageHub, а каждое обращение к БД
+    открывает короткую сессию, чтобы долгоживущее соединение клиента не держало
+    соединение из пула. Раз в config.realtime.resync_interval_seconds подписчик
+    перечитывает БД по id, подхватывая сообщения из других воркеров.
+    """
+
+    def __init__(
+        self,
+        hub: MessageHub = message_hub,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_maker,
+    ):
+        self.hub = hub
+        self.session_factory = session_factory
+        self.resync_interval = config.realtime.resync_interval_seconds
+        self.batch_limit = config.realtime.batch_limit
+
+    async def _fetch(self, query: Callable[[MessageRepo], Awaitable[List[Message]]]) -> List[dict]:
+        async with self.session_factory() as session:
+            messages = await query(MessageRepo(session))
+            return [MessageRepo.to_dict(m) for m in messages]
+
+    async def authenticate(self, token: str) -> Optional[int]:
+        """
+        Проверяет токен подписчика.
+
+        Возвращает:
+            Optional[int]: ID пользователя или None, если токен недействителен.
+        """
+        async with self.session_factory() as session:
+            data = await JWTDecodeService(AuthRepo(session)).decode_token(token)
+        if not data.get("success"):
+            return None
+        return int(data["user_id"])
+
+    async def wait_for_messages(
+        self,
+        after_id: int,
+        timeout: float,
+        from_id: Optional[int] = None,
+        to_id: Optional[int] = None,
+        class_name: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        Long-poll: возвращает сообщения с id больше after_id, ожидая их появления не дольше timeout.
+
+        Возвращает:
+            List[dict]: Новые сообщения (пустой список, если за timeout ничего не пришло).
+        """
+        topics = []
+        if from_id is not None:
+            topics.append(user_topic(from_id))
+        if to_id is not None:
+            topics.append(user_topic(to_id))
+        if class_name is not None:
+            topics.append(class_topic(class_name))
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        # Подписываемся до первого чтения БД, чтобы не потерять сообщение между ними.
+        with self.hub.subscribe(topics or [ALL_TOPIC]) as queue:
+            while True:
+                messages = await self._fetch(
+                    lambda repo: repo.list_since(after_id, self.batch_limit, from_id, to_id, class_name)
+                )
+                remaining = deadline - loop.time()
+                if messages or remaining <= 0:
+                    return messages
+                try:
+                    await asyncio.wait_for(queue.get(), timeout=min(remaining, self.resync_interval))
+                except asyncio.TimeoutError:
+                    pass
+
+    async def stream(
+        self,
+        websocket: WebSocket,
+        user_id: int,
+        class_names: Sequence[str] = (),
+        after_id: Optional[int] = None,
+    ) -> None:
+        """
+        Отправляет в WebSocket новые личные сообщения пользователя и сообщения его классов.
+
+        Аргументы:
+            websocket (WebSocket): Принятое WebSocket-соединение.
+            user_id (int): ID подписчика.
+            class_names (Sequence[str]): Классы, на чаты которых он подписан.
+            after_id (Optional[int]): Последний известный клиенту id; сообщения после него досылаются сразу.
+        """
+        topics = [user_topic(user_id)] + [class_topic(name) for name in class_names]
+        watermark = after_id
+        if watermark is None:
+            async with self.session_factory() as session:
+                watermark = await MessageRepo(session).last_id()
+        sent: Set[int] = set()
+
+        async def send(message: dict) -> None:
+            sent.add(message["id"])
+            await websocket.send_json({
+                "type": "message",
+                "message": MessageResponse(**message).model_dump(mode="json"),
+            })
+
+        async def resync() -> None:
+            nonlocal watermark, sent
+            messages = await self._fetch(
+                lambda repo: repo.list_for_subscriber(watermark, self.batch_limit, user_id, class_names)
+            )
+            for message in messages:
+                if message["id"] not in sent:
+                    await send(message)
+            if messages:
+                watermark = messages[-1]["id"]
+                sent = {message_id for message_id in sent if message_id > watermark}
+
+        async def drain() -> None:
+            while True:
+                await websocket.receive_text()
+
+        with self.hub.subscribe(topics) as queue:
+            receiver = asyncio.create_task(drain())
+            loop = asyncio.get_running_loop()
+            try:
+                if after_id is not None:
+                    await resync()
+                # Срок пересинхронизации не сдвигается локальными сообщениями:
+                # иначе при оживлённом чате на этом воркере сообщения с других
+                # воркеров ждали бы, пока трафик не стихнет.
+                next_resync = loop.time() + self.resync_interval
+                while True:
+                    getter = asyncio.create_task(queue.get())
+                    done, _ = await asyncio.wait(
+                        {getter, receiver},
+                        timeout=max(0.0, next_resync - loop.time()),
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    if getter in done:
+                        message = getter.result()
+                        if message["id"] > watermark and message["id"] not in sent:
+                            await send(message)
+                    else:
+                        getter.cancel()
+                    if receiver in done:
+                        break
+                    if loop.time() >= next_resync:
+                        await resync()
+                        next_resync = loop.time() + self.resync_interval
+            except WebSocketDisconnect:
+                pass
+            finally:
+                if not receiver.done():
+                    receiver.cancel()
+                elif not receiver.cancelled():
+                    # Забираем WebSocketDisconnect, чтобы asyncio не писал
+                    # "Task exception was never retrieved".
+                    receiver.exception()
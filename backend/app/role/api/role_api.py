@@ -1,17 +1,30 @@
 from fastapi import APIRouter, Depends, status
-from typing import Annotated, List
+from typing import Annotated
 from app.role.dependencies.get_role_service import get_role_service
 from app.role.services.role_service import RoleService
 from app.role.models.role_model import RoleCreate, RoleResponse
+from core.database.pagination import Page, PageParams, get_page_params
+from core.serialization.conditional import conditional_get
 
 
 router = APIRouter(prefix="/roles", tags=["roles"])
 
 
-@router.get("/", response_model=List[RoleResponse], status_code=status.HTTP_200_OK)
-async def list_roles(service: Annotated[RoleService, Depends(get_role_service)]):
-    roles = await service.list_roles()
-    return [RoleResponse(id=r.id, name=r.name) for r in roles]
+@router.get(
+    "/",
+    response_model=Page[RoleResponse],
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(conditional_get("roles", primary=True))],
+)
+async def list_roles(
+    service: Annotated[RoleService, Depends(get_role_service)],
+    page: Annotated[PageParams, Depends(get_page_params)],
+):
+    roles, next_cursor = await service.list_roles(page.limit, page.after)
+    return Page[RoleResponse](
+        items=[RoleResponse(id=r.id, name=r.name) for r in roles],
+        next_cursor=next_cursor,
+    )
 
 
 @router.post("/", response_model=RoleResponse, status_code=status.HTTP_201_CREATED)
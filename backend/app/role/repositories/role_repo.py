@@ -1,16 +1,21 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import List
+from typing import List, Optional, Tuple
 from app.user.schemas.role_schem import Roles
+from core.database.pagination import decode_cursor, paginate
 
 
 class RoleRepo:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def list_roles(self) -> List[Roles]:
-        result = await self.db.execute(select(Roles))
-        return list(result.scalars().all())
+    async def list_roles(self, limit: int = 50, after: Optional[str] = None) -> Tuple[List[Roles], Optional[str]]:
+        stmt = select(Roles)
+        if after is not None:
+            (last_id,) = decode_cursor(after, int)
+            stmt = stmt.where(Roles.id > last_id)
+        result = await self.db.execute(stmt.order_by(Roles.id).limit(limit + 1))
+        return paginate(result.scalars().all(), limit, lambda r: (r.id,))
 
     async def create_role(self, name: str) -> Roles:
         role = Roles(name=name)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Tuple
 from app.user.schemas.role_schem import Roles
 from app.role.repositories.role_repo import RoleRepo
 
@@ -7,8 +7,8 @@ class RoleService:
     def __init__(self, role_repo: RoleRepo):
         self.role_repo = role_repo
 
-    async def list_roles(self) -> List[Roles]:
-        return await self.role_repo.list_roles()
+    async def list_roles(self, limit: int = 50, after: Optional[str] = None) -> Tuple[List[Roles], Optional[str]]:
+        return await self.role_repo.list_roles(limit, after)
 
     async def create_role(self, name: str) -> Roles:
         return await self.role_repo.create_role(name)
@@ -1,5 +1,6 @@
-from typing import Annotated, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Annotated, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from app.schedule.dependencies.get_read_schedule_service import get_read_schedule_service
 from app.schedule.dependencies.get_schedule_service import get_schedule_service
 from app.schedule.services.schedule_service import ScheduleService
 from app.schedule.models.schedule_model import (
@@ -7,33 +8,47 @@ from app.schedule.models.schedule_model import (
     ScheduleUpdate,
     ScheduleResponse,
 )
+from core.database.pagination import Page, PageParams, get_page_params
+from core.serialization.etag import etag_matches
+from core.serialization.conditional import conditional_get
 
 
 router = APIRouter(prefix="/schedule", tags=["schedule"])
 
 
-@router.get("/", response_model=List[ScheduleResponse], status_code=status.HTTP_200_OK)
+@router.get("/", response_model=Page[ScheduleResponse], status_code=status.HTTP_200_OK)
 async def list_items(
     service: Annotated[ScheduleService, Depends(get_schedule_service)],
+    page: Annotated[PageParams, Depends(get_page_params)],
     class_name: Optional[str] = Query(default=None),
     weekday: Optional[int] = Query(default=None),
+    if_none_match: Optional[str] = Header(default=None),
 ):
-    items = await service.list_items(class_name, weekday)
-    return [ScheduleResponse(**i.__dict__) for i in items]
+    # Cache misses read from the primary so a lagging replica cannot pin a stale page.
+    cached = await service.list_page(class_name, weekday, page.limit, page.after)
+    headers = {"ETag": cached.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
 
 
-@router.get("/{item_id}", response_model=ScheduleResponse, status_code=status.HTTP_200_OK)
-async def get_item(item_id: int, service: Annotated[ScheduleService, Depends(get_schedule_service)]):
+@router.get(
+    "/{item_id}",
+    response_model=ScheduleResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(conditional_get("schedule"))],
+)
+async def get_item(item_id: int, service: Annotated[ScheduleService, Depends(get_read_schedule_service)]):
     i = await service.get_item(item_id)
     if not i:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Schedule item not found")
-    return ScheduleResponse(**i.__dict__)
+    return ScheduleResponse.model_validate(i, from_attributes=True)
 
 
 @router.post("/", response_model=ScheduleResponse, status_code=status.HTTP_201_CREATED)
 async def create_item(payload: ScheduleCreate, service: Annotated[ScheduleService, Depends(get_schedule_service)]):
     i = await service.create_item(payload.dict())
-    return ScheduleResponse(**i.__dict__)
+    return ScheduleResponse.model_validate(i, from_attributes=True)
 
 
 @router.patch("/{item_id}", response_model=ScheduleResponse, status_code=status.HTTP_200_OK)
@@ -41,7 +56,7 @@ async def update_item(item_id: int, payload: ScheduleUpdate, service: Annotated[
     i = await service.update_item(item_id, {k: v for k, v in payload.dict().items() if v is not None})
     if not i:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Schedule item not found")
-    return ScheduleResponse(**i.__dict__)
+    return ScheduleResponse.model_validate(i, from_attributes=True)
 
 
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
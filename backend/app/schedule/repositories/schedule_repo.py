@@ -1,27 +1,42 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update, delete
+from sqlalchemy import Row, delete
 from app.schedule.schemas.schedule_schem import ScheduleItem
+from core.database.pagination import decode_cursor, paginate
+from core.database.returning import update_returning
 
 
 class ScheduleRepo:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def list_items(self, class_name: Optional[str] = None, weekday: Optional[int] = None) -> List[ScheduleItem]:
-        stmt = select(ScheduleItem)
+    async def list_items(
+        self,
+        class_name: Optional[str] = None,
+        weekday: Optional[int] = None,
+        limit: int = 50,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Row], Optional[str]]:
+        stmt = select(*ScheduleItem.__table__.columns)
         if class_name is not None:
             stmt = stmt.where(ScheduleItem.class_name == class_name)
         if weekday is not None:
             stmt = stmt.where(ScheduleItem.weekday == weekday)
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        if after is not None:
+            (last_id,) = decode_cursor(after, int)
+            stmt = stmt.where(ScheduleItem.id > last_id)
+        result = await self.db.execute(stmt.order_by(ScheduleItem.id).limit(limit + 1))
+        return paginate(result.all(), limit, lambda i: (i.id,))
 
     async def get_item(self, item_id: int) -> Optional[ScheduleItem]:
         result = await self.db.execute(select(ScheduleItem).where(ScheduleItem.id == item_id))
         return result.scalars().first()
 
+    async def get_class_name(self, item_id: int) -> Optional[str]:
+        result = await self.db.execute(select(ScheduleItem.class_name).where(ScheduleItem.id == item_id))
+        return result.scalar_one_or_none()
+
     async def create_item(self, payload: dict) -> ScheduleItem:
         item = ScheduleItem(**payload)
         self.db.add(item)
@@ -30,16 +45,20 @@ class ScheduleRepo:
         return item
 
     async def update_item(self, item_id: int, payload: dict) -> Optional[ScheduleItem]:
-        await self.db.execute(
-            update(ScheduleItem)
-            .where(ScheduleItem.id == item_id)
-            .values(**payload)
-        )
-        await self.db.commit()
-        return await self.get_item(item_id)
+        item = await update_returning(self.db, ScheduleItem, item_id, payload)
+        if item is not None:
+            await self.db.commit()
+        return item
 
-    async def delete_item(self, item_id: int) -> None:
-        await self.db.execute(delete(ScheduleItem).where(ScheduleItem.id == item_id))
+    async def delete_item(self, item_id: int) -> Optional[str]:
+        stmt = delete(ScheduleItem).where(ScheduleItem.id == item_id)
+        if self.db.bind.dialect.delete_returning:
+            result = await self.db.execute(stmt.returning(ScheduleItem.class_name))
+            class_name = result.scalar_one_or_none()
+        else:
+            class_name = await self.get_class_name(item_id)
+            await self.db.execute(stmt)
         await self.db.commit()
+        return class_name
 
 
@@ -1,10 +1,13 @@
-from sqlalchemy import Integer, String
+from sqlalchemy import Integer, String, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from core.database import Base
 
 
 class ScheduleItem(Base):
     __tablename__ = 'schedule'
+    __table_args__ = (
+        Index('ix_schedule_class_name_weekday', 'class_name', 'weekday'),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     class_name: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -0,0 +1,248 @@
+import time
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Protocol, Tuple
+import orjson
+from core.config import config
+from core.logging import logger
+from core.metrics import cache_requests
+from core.serialization.etag import make_etag
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    """
+    Сериализованная страница расписания.
+
+    Атрибуты:
+        body (bytes): JSON-тело ответа.
+        etag (str): Сильный ETag тела.
+    """
+    body: bytes
+    etag: str
+
+    def dump(self) -> bytes:
+        return self.etag.encode() + b"\n" + self.body
+
+    @classmethod
+    def load(cls, raw: bytes) -> "CachedPage":
+        etag, _, body = raw.partition(b"\n")
+        return cls(body=body, etag=etag.decode())
+
+
+class CacheBackend(Protocol):
+    # True, если счётчики поколений общие для всех воркеров.
+    shared: bool
+
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None: ...
+
+    async def get_counter(self, key: str) -> int: ...
+
+    async def incr(self, key: str) -> int: ...
+
+    async def close(self) -> None: ...
+
+
+class MemoryCacheBackend:
+    """
+    LRU-кеш в памяти процесса с TTL.
+
+    Кеш и счётчики поколений локальны для воркера, поэтому ScheduleCache
+    добавляет в ключ страницы версию таблицы schedule из table_versions:
+    запись через другой воркер меняет её, и устаревшая страница больше не читается.
+    """
+
+    shared = False
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def get_counter(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    async def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    async def close(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCacheBackend:
+    """
+    Кеш в Redis (или совместимом сервере: KeyDB, Valkey, Dragonfly).
+
+    Требует пакет redis; страницы истекают по TTL, счётчики поколений хранятся
+    без срока жизни и общие для всех воркеров.
+    """
+
+    shared = True
+
+    def __init__(self, url: str):
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise RuntimeError("schedule_cache.backend = 'redis' requires the 'redis' package") from e
+        self._client = redis_asyncio.from_url(url)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        await self._client.set(key, value, ex=ttl_seconds)
+
+    async def get_counter(self, key: str) -> int:
+        value = await self._client.get(key)
+        return int(value) if value is not None else 0
+
+    async def incr(self, key: str) -> int:
+        return await self._client.incr(key)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class ScheduleCache:
+    """
+    Кеш сериализованных страниц GET /schedule с инвалидацией по поколениям.
+
+    Ключ страницы включает (class_name, weekday, limit, after) и текущее
+    поколение класса; запросы без class_name используют общее поколение.
+    Любое изменение расписания увеличивает поколение затронутых классов и
+    общее поколение, после чего старые ключи больше не читаются и вытесняются
+    по LRU/TTL. Поколение читается до запроса в БД, поэтому страница,
+    прочитанная до коммита конкурентной записи, сохраняется под уже
+    устаревшим ключом и не отдаётся. Ошибки бэкенда не ломают запрос:
+    кеш просто пропускается.
+
+    Счётчики MemoryCacheBackend видит только свой воркер, поэтому для него
+    вызывающий код передаёт version — версию таблицы schedule из общей
+    table_versions (один запрос по первичному ключу вместо запроса страницы).
+    """
+
+    def __init__(self, backend: Optional[CacheBackend], ttl_seconds: int, key_prefix: str):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+
+    def _generation_key(self, class_name: Optional[str]) -> str:
+        return f"{self.key_prefix}:gen:{orjson.dumps(class_name).decode()}"
+
+    @property
+    def needs_version(self) -> bool:
+        """
+        Нужно ли передавать в get_or_load версию таблицы schedule.
+        """
+        return self.backend is not None and not self.backend.shared
+
+    def _page_key(self, generation: int, *parts) -> str:
+        return f"{self.key_prefix}:page:{generation}:{orjson.dumps(parts).decode()}"
+
+    async def get_or_load(
+        self,
+        class_name: Optional[str],
+        weekday: Optional[int],
+        limit: int,
+        after: Optional[str],
+        load: Callable[[], Awaitable[bytes]],
+        version: Optional[int] = None,
+    ) -> CachedPage:
+        """
+        Возвращает страницу из кеша или загружает её через load и сохраняет.
+
+        Аргументы:
+            class_name (Optional[str]): Фильтр по классу.
+            weekday (Optional[int]): Фильтр по дню недели.
+            limit (int): Размер страницы.
+            after (Optional[str]): Курсор.
+            load (Callable[[], Awaitable[bytes]]): Загрузка тела страницы из БД.
+            version (Optional[int]): Версия таблицы schedule; обязательна, если needs_version.
+
+        Возвращает:
+            CachedPage: Тело страницы и его ETag.
+        """
+        if self.backend is None:
+            body = await load()
+            return CachedPage(body=body, etag=make_etag(body))
+        key = None
+        try:
+            generation = await self.backend.get_counter(self._generation_key(class_name))
+            key = self._page_key(generation, version, class_name, weekday, limit, after)
+            raw = await self.backend.get(key)
+            if raw is not None:
+                cache_requests.labels("schedule", "hit").inc()
+                return CachedPage.load(raw)
+        except Exception as e:
+            logger.error(f"Schedule cache read failed: {e}")
+        cache_requests.labels("schedule", "miss").inc()
+        body = await load()
+        page = CachedPage(body=body, etag=make_etag(body))
+        if key is not None:
+            try:
+                await self.backend.set(key, page.dump(), self.ttl_seconds)
+            except Exception as e:
+                logger.error(f"Schedule cache write failed: {e}")
+        return page
+
+    async def invalidate(self, class_names: Iterable[Optional[str]]) -> None:
+        """
+        Делает недействительными страницы указанных классов и все страницы без фильтра по классу.
+
+        Вызывается после коммита изменения.
+
+        Аргументы:
+            class_names (Iterable[Optional[str]]): Классы, чьё расписание изменилось.
+        """
+        if self.backend is None:
+            return
+        for class_name in {*class_names, None}:
+            try:
+                await self.backend.incr(self._generation_key(class_name))
+            except Exception as e:
+                logger.error(f"Schedule cache invalidation failed for {class_name!r}: {e}")
+
+    async def close(self) -> None:
+        if self.backend is not None:
+            await self.backend.close()
+
+
+def create_schedule_cache() -> ScheduleCache:
+    settings = config.schedule_cache
+    backend: Optional[CacheBackend] = None
+    if settings.backend == "memory":
+        backend = MemoryCacheBackend(settings.max_entries)
+    elif settings.backend == "redis":
+        if not settings.redis_url:
+            raise RuntimeError("schedule_cache.redis_url (REDIS_URL) is required for the redis backend")
+        backend = RedisCacheBackend(settings.redis_url)
+    return ScheduleCache(backend, settings.ttl_seconds, settings.key_prefix)
+
+
+schedule_cache = create_schedule_cache()
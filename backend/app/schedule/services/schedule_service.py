@@ -1,25 +1,59 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from sqlalchemy import Row
+from app.schedule.models.schedule_model import ScheduleResponse
 from app.schedule.repositories.schedule_repo import ScheduleRepo
 from app.schedule.schemas.schedule_schem import ScheduleItem
+from app.schedule.services.schedule_cache import CachedPage, ScheduleCache, schedule_cache
+from core.database.versions import read_versions
+from core.serialization.response import page_body
 
 
 class ScheduleService:
-    def __init__(self, repo: ScheduleRepo):
+    def __init__(self, repo: ScheduleRepo, cache: ScheduleCache = schedule_cache):
         self.repo = repo
-
-    async def list_items(self, class_name: Optional[str] = None, weekday: Optional[int] = None) -> List[ScheduleItem]:
-        return await self.repo.list_items(class_name, weekday)
+        self.cache = cache
+
+    async def list_items(
+        self,
+        class_name: Optional[str] = None,
+        weekday: Optional[int] = None,
+        limit: int = 50,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Row], Optional[str]]:
+        return await self.repo.list_items(class_name, weekday, limit, after)
+
+    async def list_page(
+        self,
+        class_name: Optional[str] = None,
+        weekday: Optional[int] = None,
+        limit: int = 50,
+        after: Optional[str] = None,
+    ) -> CachedPage:
+        async def load() -> bytes:
+            items, next_cursor = await self.repo.list_items(class_name, weekday, limit, after)
+            return page_body(items, next_cursor, ScheduleResponse)
+
+        version = None
+        if self.cache.needs_version:
+            version = (await read_versions(self.repo.db, ["schedule"]))["schedule"]
+        return await self.cache.get_or_load(class_name, weekday, limit, after, load, version)
 
     async def get_item(self, item_id: int) -> Optional[ScheduleItem]:
         return await self.repo.get_item(item_id)
 
     async def create_item(self, payload: dict) -> ScheduleItem:
-        return await self.repo.create_item(payload)
+        item = await self.repo.create_item(payload)
+        await self.cache.invalidate([item.class_name])
+        return item
 
     async def update_item(self, item_id: int, payload: dict) -> Optional[ScheduleItem]:
-        return await self.repo.update_item(item_id, payload)
+        previous_class = await self.repo.get_class_name(item_id) if "class_name" in payload else None
+        item = await self.repo.update_item(item_id, payload)
+        if item is not None:
+            await self.cache.invalidate([previous_class, item.class_name])
+        return item
 
     async def delete_item(self, item_id: int) -> None:
-        await self.repo.delete_item(item_id)
-
-
+        class_name = await self.repo.delete_item(item_id)
+        if class_name is not None:
+            await self.cache.invalidate([class_name])
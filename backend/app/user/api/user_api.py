@@ -1,16 +1,26 @@
 from typing import Annotated, List
 from fastapi import APIRouter, Depends, HTTPException, status
-from app.user.dependencies.get_user_service import get_user_service
+from app.user.dependencies.get_read_user_service import get_read_user_service
 from app.user.services.user_service import UserService
 from app.user.models.user_model import UserResponse
+from core.database.pagination import Page, PageParams, get_page_params
+from core.serialization.conditional import conditional_get
 
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
-@router.get("/", response_model=List[UserResponse], status_code=status.HTTP_200_OK)
-async def list_users(service: Annotated[UserService, Depends(get_user_service)]):
-    users = await service.list_users()
+@router.get(
+    "/",
+    response_model=Page[UserResponse],
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(conditional_get("users", "roles", "user_roles"))],
+)
+async def list_users(
+    service: Annotated[UserService, Depends(get_read_user_service)],
+    page: Annotated[PageParams, Depends(get_page_params)],
+):
+    users, next_cursor = await service.list_users(page.limit, page.after)
     data: List[UserResponse] = []
     for u in users:
         data.append(UserResponse(
@@ -20,11 +30,16 @@ async def list_users(service: Annotated[UserService, Depends(get_user_service)])
             last_name=u.last_name,
             roles=[r.name for r in (u.roles or [])]
         ))
-    return data
+    return Page[UserResponse](items=data, next_cursor=next_cursor)
 
 
-@router.get("/{user_id}", response_model=UserResponse, status_code=status.HTTP_200_OK)
-async def get_user(user_id: int, service: Annotated[UserService, Depends(get_user_service)]):
+@router.get(
+    "/{user_id}",
+    response_model=UserResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(conditional_get("users", "roles", "user_roles"))],
+)
+async def get_user(user_id: int, service: Annotated[UserService, Depends(get_read_user_service)]):
     u = await service.get_user(user_id)
     if not u:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
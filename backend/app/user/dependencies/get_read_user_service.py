@@ -0,0 +1,11 @@
+from typing import Annotated
+from fastapi import Depends
+from app.user.repositories.user_repo import UserRepo
+from app.user.services.user_service import UserService
+from app.user.dependencies.get_read_user_repo import get_read_user_repo
+
+
+async def get_read_user_service(repo: Annotated[UserRepo, Depends(get_read_user_repo)]) -> UserService:
+    return UserService(repo)
+
+
@@ -1,17 +1,22 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 from app.user.schemas.user_schem import User
+from core.database.pagination import decode_cursor, paginate
 
 
 class UserRepo:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def list_users(self) -> List[User]:
-        result = await self.db.execute(select(User).options(selectinload(User.roles)))
-        return list(result.scalars().all())
+    async def list_users(self, limit: int = 50, after: Optional[str] = None) -> Tuple[List[User], Optional[str]]:
+        stmt = select(User).options(selectinload(User.roles))
+        if after is not None:
+            (last_id,) = decode_cursor(after, int)
+            stmt = stmt.where(User.id > last_id)
+        result = await self.db.execute(stmt.order_by(User.id).limit(limit + 1))
+        return paginate(result.scalars().all(), limit, lambda u: (u.id,))
 
     async def get_user(self, user_id: int) -> Optional[User]:
         result = await self.db.execute(
@@ -13,5 +13,5 @@ class Roles(Base):
         "User",
         secondary=user_roles,
         back_populates="roles",
-        lazy="selectin",
+        lazy="raise",
     )
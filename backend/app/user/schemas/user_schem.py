@@ -1,5 +1,5 @@
 from typing import List
-from sqlalchemy import Integer, String, ForeignKey, LargeBinary
+from sqlalchemy import Index, Integer, String, ForeignKey, LargeBinary, func
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from core.database import Base
 from core.database.schemas.user_roles import user_roles
@@ -17,5 +17,9 @@ class User(Base):
         "Roles",
         secondary=user_roles,
         back_populates="users",
-        lazy="selectin",
-    )
\ No newline at end of file
+        lazy="raise",
+    )
+
+
+# Проверки занятости email (регистрация, импорт) сравнивают адреса без учёта регистра.
+Index('ix_users_email_lower', func.lower(User.email))
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from app.user.repositories.user_repo import UserRepo
 from app.user.schemas.user_schem import User
 
@@ -7,8 +7,8 @@ class UserService:
     def __init__(self, repo: UserRepo):
         self.repo = repo
 
-    async def list_users(self) -> List[User]:
-        return await self.repo.list_users()
+    async def list_users(self, limit: int = 50, after: Optional[str] = None) -> Tuple[List[User], Optional[str]]:
+        return await self.repo.list_users(limit, after)
 
     async def get_user(self, user_id: int) -> Optional[User]:
         return await self.repo.get_user(user_id)
@@ -0,0 +1,219 @@
+"""
+Бенчмарк пропускной способности параллельных входов.
+
+Сравнивает проверку bcrypt прямо в цикле событий (поведение до переноса
+в пул потоков) с core.security.password.verify_password_async. Параллельно
+с входами работает "зонд", который спит по 10 мс и измеряет задержку
+цикла событий — так выглядит латентность посторонних запросов (например,
+чтения оценок) во время волны логинов.
+
+Дополнительно замеряется регистрация через AuthService на SQLite в памяти:
+прежняя схема (поиск по email, create_user, затем login со вторым bcrypt)
+против текущей AuthService.register.
+
+Запуск из каталога backend:
+    python -m benchmarks.auth_benchmark --logins 64 --concurrency 16 --registrations 16
+    python -m benchmarks.auth_benchmark --json
+"""
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from core.config import config
+from core.database import Base
+from core.database.models import import_models
+from core.exceptions.auth import UserNotFound
+from core.security.password import (
+    get_password_hash,
+    shutdown_hashing_executor,
+    verify_password,
+    verify_password_async,
+)
+
+import_models()
+
+from app.auth.models.auth_model import LoginRequest, RegisterRequest  # noqa: E402
+from app.auth.repositories.auth_repo import AuthRepo  # noqa: E402
+from app.auth.services.auth_service import AuthService  # noqa: E402
+from app.user.schemas.role_schem import Roles  # noqa: E402
+
+
+PROBE_INTERVAL = 0.01
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def blocking_login(password: str, hashed: bytes) -> bool:
+    return verify_password(password, hashed)
+
+
+async def executor_login(password: str, hashed: bytes) -> bool:
+    return await verify_password_async(password, hashed)
+
+
+async def run_scenario(
+    login: Callable[[str, bytes], Awaitable[bool]],
+    hashed: bytes,
+    logins: int,
+    concurrency: int,
+) -> Dict[str, Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    probe_lag: List[float] = []
+    done = asyncio.Event()
+
+    async def one_login() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            assert await login("correct horse", hashed)
+            latencies.append(time.perf_counter() - started)
+
+    async def probe() -> None:
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(PROBE_INTERVAL)
+            probe_lag.append(time.perf_counter() - started - PROBE_INTERVAL)
+
+    probe_task = asyncio.create_task(probe())
+    started = time.perf_counter()
+    await asyncio.gather(*(one_login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await probe_task
+
+    return {
+        "logins": logins,
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_per_s": round(logins / elapsed, 2),
+        "login_p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "login_p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "loop_lag_p50_ms": round(percentile(probe_lag, 50) * 1000, 1),
+        "loop_lag_p99_ms": round(percentile(probe_lag, 99) * 1000, 1),
+        "loop_lag_max_ms": round(max(probe_lag, default=0.0) * 1000, 1),
+    }
+
+
+async def legacy_register(service: AuthService, request: RegisterRequest) -> None:
+    # Поведение до выпуска токена прямо из созданного пользователя.
+    try:
+        await service.auth_repo.get_user_by_email(request.email)
+        raise RuntimeError("duplicate email")
+    except UserNotFound:
+        pass
+    await service.auth_repo.create_user(
+        request.email, request.first_name, request.last_name, request.password, role_name=request.role
+    )
+    await service.login(LoginRequest(email=request.email, password=request.password))
+
+
+async def current_register(service: AuthService, request: RegisterRequest) -> None:
+    await service.register(request)
+
+
+async def run_register_scenario(
+    register: Callable[[AuthService, RegisterRequest], Awaitable[None]],
+    registrations: int,
+    concurrency: int,
+) -> Dict[str, Any]:
+    # Файл, а не :memory: — у каждой сессии должно быть своё соединение.
+    workdir = tempfile.TemporaryDirectory()
+    engine = create_async_engine(f"sqlite+aiosqlite:///{Path(workdir.name) / 'register.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_maker() as session:
+        session.add_all([Roles(name="student"), Roles(name="teacher")])
+        await session.commit()
+
+    statements = 0
+
+    def count_statement(*_: Any) -> None:
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def one_register(index: int) -> None:
+        request = RegisterRequest(
+            email=f"user{index}@example.com",
+            password="correct horse",
+            first_name="Bench",
+            last_name=str(index),
+            role="student",
+        )
+        async with semaphore:
+            async with session_maker() as session:
+                started = time.perf_counter()
+                await register(AuthService(AuthRepo(session)), request)
+                latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one_register(i) for i in range(registrations)))
+    elapsed = time.perf_counter() - started
+    await engine.dispose()
+    workdir.cleanup()
+
+    return {
+        "registrations": registrations,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_per_s": round(registrations / elapsed, 2),
+        "register_p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "register_p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "statements_per_register": round(statements / registrations, 2),
+    }
+
+
+async def main(args: argparse.Namespace) -> Dict[str, Any]:
+    hashed = get_password_hash("correct horse")
+    results = {
+        "hashing_workers": config.password_hashing.workers,
+        "blocking": await run_scenario(blocking_login, hashed, args.logins, args.concurrency),
+        "executor": await run_scenario(executor_login, hashed, args.logins, args.concurrency),
+        "register_legacy": await run_register_scenario(legacy_register, args.registrations, args.concurrency),
+        "register": await run_register_scenario(current_register, args.registrations, args.concurrency),
+    }
+    shutdown_hashing_executor()
+    return results
+
+
+def print_table(results: Dict[str, Any]) -> None:
+    print(f"hashing workers: {results['hashing_workers']}")
+    keys = [k for k in results["blocking"] if k not in ("logins", "concurrency")]
+    print(f"{'metric':<20}{'blocking':>12}{'executor':>12}")
+    for key in keys:
+        print(f"{key:<20}{results['blocking'][key]:>12}{results['executor'][key]:>12}")
+    print()
+    print(f"{'metric':<24}{'legacy':>12}{'register':>12}")
+    for key in results["register"]:
+        print(f"{key:<24}{results['register_legacy'][key]:>12}{results['register'][key]:>12}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--registrations", type=int, default=16)
+    parser.add_argument("--json", action="store_true", help="вывести результат в JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(main(args))
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_table(results)
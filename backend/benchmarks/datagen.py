@@ -0,0 +1,346 @@
+"""
+Генератор синтетических данных школьного масштаба для нагрузочных тестов и EXPLAIN.
+
+Заполняет пустую базу: школы из классов с учениками и классным
+руководителем (с ролями в user_roles), недельное расписание, оценки за
+несколько учебных лет и сообщения — чаты классов и личные переписки
+ученик—учитель вместе с conversations и conversation_participants.
+grade_summary пересобирается в конце одним запросом.
+
+Данные детерминированы: один и тот же DatasetSpec (включая seed и end_date)
+даёт те же строки с теми же id. Строки пишутся пачками по batch_size через
+insert executemany с заранее вычисленными id, без RETURNING.
+
+Запуск (из каталога backend, база — DATABASE_URL):
+    python manage.py generate-data --schools 10
+"""
+import random
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.grades.repositories.grade_repo import GradeRepo
+from app.grades.schemas.grade_schem import Grade
+from app.messages.repositories.conversation_repo import conversation_key
+from app.messages.schemas.conversation_schem import Conversation, ConversationParticipant
+from app.messages.schemas.message_schem import Message
+from app.schedule.schemas.schedule_schem import ScheduleItem
+from app.user.schemas.role_schem import Roles
+from app.user.schemas.user_schem import User
+from core.database.schemas.user_roles import user_roles
+from core.security.password import get_password_hash
+
+PASSWORD = "load-password"
+SUBJECTS = ("Matematyka", "Polski", "Angielski", "Historia", "Biologia", "Fizyka", "Chemia", "Geografia")
+LESSONS = (
+    ("08:00", "08:45"), ("08:55", "09:40"), ("09:50", "10:35"),
+    ("10:55", "11:40"), ("11:50", "12:35"), ("12:45", "13:30"),
+)
+FIRST_NAMES = ("Anna", "Jan", "Maria", "Piotr", "Katarzyna", "Tomasz", "Zofia", "Jakub", "Julia", "Michał")
+LAST_NAMES = ("Nowak", "Kowalski", "Wiśniewski", "Wójcik", "Kamiński", "Lewandowski", "Zieliński", "Szymański")
+COMMENTS = ("Sprawdzian", "Kartkówka", "Odpowiedź ustna", "Praca domowa", None, None, None)
+MESSAGES = ("Dzień dobry", "Proszę o kontakt", "Przypominam o sprawdzianie", "Dziękuję")
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    schools: int = 1
+    classes_per_school: int = 16
+    students_per_class: int = 25
+    years: int = 3
+    grades_per_student_week: float = 3.0
+    class_messages_per_day: float = 4.0
+    direct_messages_per_student_week: float = 1.0
+    end_date: date = date(2026, 6, 26)
+    seed: int = 1
+    batch_size: int = 5000
+
+    @property
+    def classes(self) -> int:
+        return self.schools * self.classes_per_school
+
+
+def class_name(spec: DatasetSpec, index: int) -> str:
+    school, number = divmod(index, spec.classes_per_school)
+    name = f"{number // 4 + 1}{'ABCD'[number % 4]}"
+    return name if spec.schools == 1 else f"S{school + 1}-{name}"
+
+
+def student_email(class_index: int, number: int) -> str:
+    return f"student.{class_index}.{number}@example.com"
+
+
+def teacher_email(class_index: int) -> str:
+    return f"teacher.{class_index}@example.com"
+
+
+def school_days(spec: DatasetSpec) -> List[date]:
+    """
+    Учебные дни (пн—пт, без июля и августа) за spec.years лет до end_date включительно.
+    """
+    start = spec.end_date - timedelta(days=365 * spec.years)
+    days = []
+    day = start
+    while day <= spec.end_date:
+        if day.weekday() < 5 and day.month not in (7, 8):
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+class _Writer:
+    """
+    Буферизует строки по таблицам и пишет их пачками по batch_size.
+
+    Перед пачкой таблицы пишутся буферы таблиц, на которые она ссылается
+    (depends), чтобы внешние ключи были выполнены и в PostgreSQL.
+    """
+
+    def __init__(self, session: AsyncSession, batch_size: int, depends: Dict[object, Tuple[object, ...]]):
+        self.session = session
+        self.batch_size = batch_size
+        self.depends = depends
+        self.buffers: Dict[object, List[dict]] = {}
+        self.counts: Dict[str, int] = {}
+
+    async def add(self, table, row: dict) -> None:
+        buffer = self.buffers.setdefault(table, [])
+        buffer.append(row)
+        if len(buffer) >= self.batch_size:
+            await self.flush(table)
+
+    async def flush(self, table) -> None:
+        rows = self.buffers.get(table)
+        if not rows:
+            return
+        for parent in self.depends.get(table, ()):
+            await self.flush(parent)
+        # Core-insert таблицы: ORM bulk insert дробит executemany на группы по
+        # наличию None в строках, а здесь None чередуются (comment, to_id).
+        target = getattr(table, "__table__", table)
+        await self.session.execute(insert(target), rows)
+        name = target.name
+        self.counts[name] = self.counts.get(name, 0) + len(rows)
+        self.buffers[table] = []
+
+    async def flush_all(self, *tables) -> None:
+        for table in tables or list(self.buffers):
+            await self.flush(table)
+
+
+def _occurrences(rng: random.Random, rate: float) -> int:
+    whole = int(rate)
+    return whole + (rng.random() < rate - whole)
+
+
+async def _next_id(session: AsyncSession, column) -> int:
+    return (await session.scalar(select(func.max(column)))) or 0
+
+
+async def _advance_sequences(session: AsyncSession, *models) -> None:
+    """
+    Сдвигает SERIAL-последовательности PostgreSQL за вставленные явно id.
+
+    Иначе следующая вставка через ORM или API получит id из последовательности,
+    начиная с 1, и упадёт на дубликате ключа. SQLite берёт max(rowid) + 1 сам.
+    """
+    if session.bind.dialect.name != "postgresql":
+        return
+    for model in models:
+        table = model.__tablename__
+        await session.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) FROM {table}"
+        ))
+
+
+async def generate(
+    session: AsyncSession,
+    spec: DatasetSpec,
+    progress: Optional[Callable[[str], None]] = None,
+) -> Dict[str, int]:
+    """
+    Заполняет базу набором данных по spec.
+
+    Аргументы:
+        session (AsyncSession): Сессия пустой базы с применёнными миграциями.
+        spec (DatasetSpec): Размер и параметры набора.
+        progress (Optional[Callable[[str], None]]): Куда писать ход генерации.
+
+    Возвращает:
+        Dict[str, int]: Число вставленных строк по таблицам.
+
+    Вызывает:
+        RuntimeError: Если в базе уже есть пользователи.
+    """
+    report = progress or (lambda message: None)
+    if await session.scalar(select(func.count()).select_from(User)):
+        raise RuntimeError("generate-data expects an empty database (users table is not empty)")
+
+    rng = random.Random(spec.seed)
+    started = time.perf_counter()
+    writer = _Writer(session, spec.batch_size, depends={
+        user_roles: (User,),
+        Message: (Conversation,),
+        ConversationParticipant: (Conversation,),
+    })
+
+    role_ids = dict((await session.execute(select(Roles.name, Roles.id))).tuples().all())
+    for role_name in ("student", "teacher"):
+        if role_name not in role_ids:
+            role_ids[role_name] = await session.scalar(insert(Roles).values(name=role_name).returning(Roles.id))
+
+    hashed = get_password_hash(PASSWORD)
+    user_id = await _next_id(session, User.id)
+    teachers: List[int] = []
+    students: List[List[Tuple[int, float]]] = []
+    for c in range(spec.classes):
+        user_id += 1
+        teachers.append(user_id)
+        await writer.add(User, {
+            "id": user_id, "email": teacher_email(c), "hased_password": hashed,
+            "first_name": rng.choice(FIRST_NAMES), "last_name": rng.choice(LAST_NAMES),
+        })
+        await writer.add(user_roles, {"user_id": user_id, "role_id": role_ids["teacher"]})
+        members = []
+        for n in range(spec.students_per_class):
+            user_id += 1
+            members.append((user_id, rng.uniform(2.5, 5.5)))
+            await writer.add(User, {
+                "id": user_id, "email": student_email(c, n), "hased_password": hashed,
+                "first_name": rng.choice(FIRST_NAMES), "last_name": rng.choice(LAST_NAMES),
+            })
+            await writer.add(user_roles, {"user_id": user_id, "role_id": role_ids["student"]})
+        students.append(members)
+    await writer.flush_all(User, user_roles)
+
+    # Предмет каждого урока ведёт классный руководитель одного из классов той же школы.
+    timetable: List[Dict[int, List[Tuple[str, int]]]] = []
+    for c in range(spec.classes):
+        school_first = c - c % spec.classes_per_school
+        week: Dict[int, List[Tuple[str, int]]] = {}
+        for weekday in range(1, 6):
+            lessons = []
+            for slot, (time_from, time_to) in enumerate(LESSONS):
+                subject_index = rng.randrange(len(SUBJECTS))
+                teacher_id = teachers[school_first + (c + subject_index) % spec.classes_per_school]
+                lessons.append((SUBJECTS[subject_index], teacher_id))
+                await writer.add(ScheduleItem, {
+                    "class_name": class_name(spec, c), "weekday": weekday, "time_from": time_from,
+                    "time_to": time_to, "subject": SUBJECTS[subject_index], "teacher_id": teacher_id,
+                })
+            week[weekday] = lessons
+        timetable.append(week)
+    await writer.flush_all(ScheduleItem)
+    await session.commit()
+    report(f"users, roles and schedule: {time.perf_counter() - started:.1f}s")
+
+    grade_id = await _next_id(session, Grade.id)
+    message_id = await _next_id(session, Message.id)
+    conversation_id = await _next_id(session, Conversation.id)
+    conversations: Dict[str, dict] = {}
+    # user_id -> [unread_count, last_read_message_id] для каждой ветки.
+    participants: Dict[int, Dict[int, List[int]]] = {}
+    grade_probability = spec.grades_per_student_week / (5 * len(LESSONS))
+    direct_probability = spec.direct_messages_per_student_week / 5
+
+    async def open_conversation(key: str, **fields) -> dict:
+        nonlocal conversation_id
+        conversation = conversations.get(key)
+        if conversation is None:
+            conversation_id += 1
+            conversation = {"id": conversation_id, "key": key, "last_message_id": None,
+                            "last_message_at": None, "message_count": 0, **fields}
+            conversations[key] = conversation
+            participants[conversation_id] = {}
+            await writer.add(Conversation, {**conversation})
+        return conversation
+
+    days = school_days(spec)
+    for index, day in enumerate(days):
+        weekday = day.isoweekday()
+        pending: List[Tuple[datetime, int, Optional[int], Optional[str]]] = []
+        for c in range(spec.classes):
+            for subject, teacher_id in timetable[c][weekday]:
+                for student_id, ability in students[c]:
+                    if rng.random() >= grade_probability:
+                        continue
+                    grade_id += 1
+                    await writer.add(Grade, {
+                        "id": grade_id, "student_id": student_id, "teacher_id": teacher_id,
+                        "subject": subject, "value": min(6, max(1, round(rng.gauss(ability, 1.0)))),
+                        "date": day, "comment": rng.choice(COMMENTS),
+                    })
+
+            day_start = datetime.combine(day, datetime.min.time()) + timedelta(hours=7)
+            for _ in range(_occurrences(rng, spec.class_messages_per_day)):
+                sender = teachers[c] if rng.random() < 0.4 else rng.choice(students[c])[0]
+                sent_at = day_start + timedelta(seconds=rng.randrange(14 * 3600))
+                pending.append((sent_at, sender, None, class_name(spec, c)))
+            for student_id, _ in students[c]:
+                if rng.random() >= direct_probability:
+                    continue
+                sent_at = day_start + timedelta(seconds=rng.randrange(14 * 3600))
+                pair = (student_id, teachers[c]) if rng.random() < 0.5 else (teachers[c], student_id)
+                pending.append((sent_at, pair[0], pair[1], None))
+
+        # Сообщения дня упорядочены по времени, чтобы id рос вместе с created_at, как в проде.
+        pending.sort(key=lambda message: message[0])
+        for sent_at, sender, recipient, chat in pending:
+            key = conversation_key(sender, recipient, chat)
+            if recipient is not None:
+                conversation = await open_conversation(
+                    key, kind="direct", user_low_id=min(sender, recipient),
+                    user_high_id=max(sender, recipient), class_name=None,
+                )
+            else:
+                conversation = await open_conversation(
+                    key, kind="class", user_low_id=None, user_high_id=None, class_name=chat,
+                )
+            message_id += 1
+            await writer.add(Message, {
+                "id": message_id, "from_id": sender, "to_id": recipient, "class_name": chat,
+                "conversation_id": conversation["id"], "content": rng.choice(MESSAGES),
+                "created_at": sent_at,
+            })
+            conversation.update(last_message_id=message_id, last_message_at=sent_at,
+                                message_count=conversation["message_count"] + 1)
+            members = participants[conversation["id"]]
+            for user_id in (sender, recipient):
+                if user_id is not None:
+                    members.setdefault(user_id, [0, 0])
+            for user_id, state in members.items():
+                if user_id == sender:
+                    state[0], state[1] = 0, message_id
+                else:
+                    state[0] += 1
+
+        if index % 20 == 19:
+            await writer.flush_all(Grade, Message)
+            await session.commit()
+            report(f"{day.isoformat()}: {grade_id} grades, {message_id} messages, "
+                   f"{time.perf_counter() - started:.1f}s")
+
+    await writer.flush_all(Conversation, Grade, Message)
+    await session.execute(update(Conversation), [
+        {"id": c["id"], "last_message_id": c["last_message_id"], "last_message_at": c["last_message_at"],
+         "message_count": c["message_count"]}
+        for c in conversations.values()
+    ])
+    for conversation in conversations.values():
+        for user_id, (unread_count, last_read_message_id) in participants[conversation["id"]].items():
+            await writer.add(ConversationParticipant, {
+                "conversation_id": conversation["id"], "user_id": user_id, "unread_count": unread_count,
+                "last_read_message_id": last_read_message_id, "last_message_id": conversation["last_message_id"],
+            })
+    await writer.flush_all(ConversationParticipant)
+    await _advance_sequences(session, User, Grade, Message, Conversation)
+    await session.commit()
+
+    writer.counts["grade_summary"] = await GradeRepo(session).rebuild_summary()
+    report(f"done in {time.perf_counter() - started:.1f}s")
+    return writer.counts
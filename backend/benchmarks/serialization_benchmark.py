@@ -0,0 +1,145 @@
+"""
+Микробенчмарк сериализации списка оценок.
+
+Сравнивает прежний путь (select(Grade) → GradeResponse(**g.__dict__) →
+повторная валидация response_model → JSONResponse) с
+core.serialization.response.page_response (select колонок → одна
+валидация TypeAdapter и кодирование в pydantic-core).
+Оба пути читают одну и ту же страницу из SQLite в памяти, поэтому
+разница — это стоимость ORM-сущностей и двойной валидации.
+
+Запуск из каталога backend:
+    python -m benchmarks.serialization_benchmark --rows 10000
+    python -m benchmarks.serialization_benchmark --json
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import date, timedelta
+from typing import Any, Awaitable, Callable, Dict, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.future import select
+
+from core.database import Base
+from core.database.models import import_models
+
+import_models()
+
+from app.grades.models.grade_model import GradeResponse  # noqa: E402
+from app.grades.repositories.grade_repo import GradeRepo  # noqa: E402
+from app.grades.schemas.grade_schem import Grade  # noqa: E402
+from app.user.schemas.user_schem import User  # noqa: E402
+from core.database.pagination import Page, paginate  # noqa: E402
+from core.serialization.response import page_response  # noqa: E402
+
+
+RESPONSE_FIELD = create_model_field(name="Response_list_grades", type_=Page[GradeResponse], mode="serialization")
+
+
+async def seed(session: AsyncSession, rows: int) -> None:
+    session.add_all([
+        User(id=1, email="teacher@example.com", first_name="T", last_name="T", hased_password=b"x"),
+        User(id=2, email="student@example.com", first_name="S", last_name="S", hased_password=b"x"),
+    ])
+    await session.flush()
+    start = date(2025, 9, 1)
+    await session.execute(insert(Grade), [
+        {
+            "student_id": 2,
+            "teacher_id": 1,
+            "subject": f"Subject {i % 12}",
+            "value": i % 6 + 1,
+            "date": start + timedelta(days=i % 300),
+            "comment": None if i % 3 else "Praca klasowa",
+        }
+        for i in range(rows)
+    ])
+    await session.commit()
+
+
+async def orm_path(session: AsyncSession, rows: int) -> bytes:
+    result = await session.execute(select(Grade).where(Grade.student_id == 2).order_by(Grade.id).limit(rows + 1))
+    grades, next_cursor = paginate(result.scalars().all(), rows, lambda g: (g.id,))
+    page = Page[GradeResponse](items=[GradeResponse(**g.__dict__) for g in grades], next_cursor=next_cursor)
+    content = await serialize_response(field=RESPONSE_FIELD, response_content=page)
+    return JSONResponse(content).body
+
+
+async def columns_path(session: AsyncSession, rows: int) -> bytes:
+    grades, next_cursor = await GradeRepo(session).list_grades(student_id=2, limit=rows)
+    return page_response(grades, next_cursor, GradeResponse).body
+
+
+async def measure(
+    session_maker: async_sessionmaker[AsyncSession],
+    path: Callable[[AsyncSession, int], Awaitable[bytes]],
+    rows: int,
+    repeats: int,
+) -> Dict[str, Any]:
+    timings: List[float] = []
+    body = b""
+    for _ in range(repeats):
+        # Новая сессия на повтор — как на каждый HTTP-запрос, без тёплой identity map.
+        async with session_maker() as session:
+            started = time.perf_counter()
+            body = await path(session, rows)
+            timings.append(time.perf_counter() - started)
+    return {
+        "median_ms": round(statistics.median(timings) * 1000, 1),
+        "min_ms": round(min(timings) * 1000, 1),
+        "rows_per_s": round(rows / statistics.median(timings)),
+        "body_bytes": len(body),
+        "body": body,
+    }
+
+
+async def main(args: argparse.Namespace) -> Dict[str, Any]:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_maker() as session:
+        await seed(session, args.rows)
+
+    orm = await measure(session_maker, orm_path, args.rows, args.repeats)
+    columns = await measure(session_maker, columns_path, args.rows, args.repeats)
+    await engine.dispose()
+
+    same = json.loads(orm.pop("body")) == json.loads(columns.pop("body"))
+    return {
+        "rows": args.rows,
+        "repeats": args.repeats,
+        "same_payload": same,
+        "orm": orm,
+        "columns_orjson": columns,
+        "speedup": round(orm["median_ms"] / columns["median_ms"], 2),
+    }
+
+
+def print_table(results: Dict[str, Any]) -> None:
+    print(f"rows: {results['rows']}, repeats: {results['repeats']}, same payload: {results['same_payload']}")
+    print(f"{'metric':<14}{'orm':>12}{'columns':>12}")
+    for key in results["orm"]:
+        print(f"{key:<14}{results['orm'][key]:>12}{results['columns_orjson'][key]:>12}")
+    print(f"speedup: {results['speedup']}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="вывести результат в JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(main(args))
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_table(results)
@@ -7,7 +7,7 @@ import yaml
 import base64
 from functools import lru_cache
 from pydantic import BaseModel
-from typing import List, Literal
+from typing import Dict, List, Literal
 
 
 class AppConfig(BaseModel):
@@ -33,6 +33,11 @@ class JWTConfig(BaseModel):
     default_max_age_in_minutes: int = 60 * 60 * 24 * 3
     remember_me_max_age_in_minutes: int = 60 * 60 * 24 * 30
 
+class TokenCacheConfig(BaseModel):
+    enabled: bool = True
+    max_size: int = 10000
+    ttl_seconds: int = 60
+
 class LoggingConfig(BaseModel):
     level: int = 20
     format: str = "%(asctime)s - %(levelname)s - %(message)s"
@@ -43,6 +48,60 @@ class LoggingConfig(BaseModel):
 
 class DatabaseConfig(BaseModel):
     connect_string: str = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./test.db")
+    echo: bool = False
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    sqlite_pragmas: Dict[str, str | int] = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+    }
+    postgres_server_settings: Dict[str, str] = {}
+    replica_urls: List[str] = [u for u in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if u]
+    replica_health_check_interval_seconds: float = 10.0
+    replica_health_check_timeout_seconds: float = 2.0
+    read_your_writes_seconds: int = 5
+    query_stats_enabled: bool = True
+    slow_query_threshold_ms: float = 200.0
+    slow_query_log_parameters: bool = True
+
+class PasswordHashingConfig(BaseModel):
+    workers: int = 4
+
+class PaginationConfig(BaseModel):
+    default_limit: int = 50
+    max_limit: int = 500
+
+class RealtimeConfig(BaseModel):
+    resync_interval_seconds: float = 5.0
+    long_poll_timeout_seconds: int = 25
+    subscriber_queue_size: int = 100
+    batch_limit: int = 100
+
+class ScheduleCacheConfig(BaseModel):
+    backend: Literal["memory", "redis", "none"] = "memory"
+    max_entries: int = 1024
+    ttl_seconds: int = 60
+    redis_url: str | None = os.getenv("REDIS_URL")
+    key_prefix: str = "edziennik:schedule"
+
+class MetricsConfig(BaseModel):
+    enabled: bool = False
+    token: str | None = os.getenv("METRICS_TOKEN")
+    multiprocess_dir: str | None = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    latency_buckets: List[float] = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+class ProfilingConfig(BaseModel):
+    enabled: bool = False
+    sample_rate: float = 0.01
+    interval_seconds: float = 0.001
+    max_concurrent: int = 1
+    header_secret: str | None = os.getenv("PROFILING_SECRET")
+    header_max_age_seconds: int = 300
+    max_file_bytes: int = 50 * 1024 * 1024
 
 class CookiesSettings(BaseModel):
     secure: bool = True
@@ -55,9 +114,16 @@ class Config(BaseModel):
     uvicorn: UvicornConfig = UvicornConfig()
     cors: CORSConfig = CORSConfig()
     jwt: JWTConfig = JWTConfig()
+    token_cache: TokenCacheConfig = TokenCacheConfig()
     logging: LoggingConfig = LoggingConfig()
     database: DatabaseConfig = DatabaseConfig()
     cookies: CookiesSettings = CookiesSettings()
+    pagination: PaginationConfig = PaginationConfig()
+    password_hashing: PasswordHashingConfig = PasswordHashingConfig()
+    realtime: RealtimeConfig = RealtimeConfig()
+    schedule_cache: ScheduleCacheConfig = ScheduleCacheConfig()
+    metrics: MetricsConfig = MetricsConfig()
+    profiling: ProfilingConfig = ProfilingConfig()
 
 
 class LoadConfig:
@@ -1,7 +1,8 @@
 from .base import Base
-from .db import get_db
+from .db import get_db, get_read_db
 
 __all__ = [
     "Base",
     "get_db",
+    "get_read_db",
 ]
\ No newline at end of file
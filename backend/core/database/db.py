@@ -1,12 +1,20 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from fastapi import Request
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from typing import AsyncGenerator
-from core.config import config
-from core.database.base import Base
+from core.database.engine import create_engine_from_config
+from core.database.instrumentation import instrument_engine
+from core.database.migrations import run_migrations
+from core.metrics import instrument_pool
+from core.database.replicas import prefers_primary, replica_pool
+from core.database import versions  # noqa: F401  (registers table version tracking)
 from sqlalchemy import select
 from app.user.schemas.role_schem import Roles
 
 
-engine = create_async_engine(config.database.connect_string)
+engine = create_engine_from_config()
+instrument_engine(engine)
+instrument_pool(engine, "primary")
 
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
@@ -22,14 +30,39 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
         yield session
 
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Получает сессию для репозиториев, которые только читают.
+
+    Сессия открывается на одной из здоровых реплик (database.replica_urls,
+    по кругу), а если реплик нет, все недоступны или клиент недавно выполнял
+    запись (cookie read-your-writes) — на primary, как get_db.
+
+    Возвращает:
+        AsyncGenerator[AsyncSession, None]: Асинхронный генератор сессий SQLAlchemy.
+    """
+    index = None if prefers_primary(request) else replica_pool.choose()
+    if index is None:
+        async with async_session_maker() as session:
+            yield session
+        return
+
+    async with replica_pool.session_makers[index]() as session:
+        try:
+            yield session
+        except DBAPIError as e:
+            if e.connection_invalidated or isinstance(e, OperationalError):
+                replica_pool.mark_unhealthy(index)
+            raise
+
 async def init_db():
     """
     Инициализирует базу данных.
 
-    Создаёт все таблицы, описанные в метаданных SQLAlchemy.
+    Применяет версионированные миграции Alembic (каталог migrations/) до head.
     """
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(run_migrations)
 
 
 async def seed_roles() -> None:
@@ -0,0 +1,57 @@
+from typing import Any, Dict
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from core.config import config
+from core.config.config import DatabaseConfig
+
+
+def _is_memory_sqlite(database: str | None) -> bool:
+    return not database or database == ":memory:" or database.startswith("file::memory:")
+
+
+def create_engine_from_config(database: DatabaseConfig = config.database) -> AsyncEngine:
+    """
+    Создаёт асинхронный движок с настройками пула и соединений из DatabaseConfig.
+
+    Для SQLite при каждом новом соединении выполняются PRAGMA из
+    database.sqlite_pragmas (по умолчанию WAL, synchronous=NORMAL и busy_timeout,
+    чтобы воркеры uvicorn ждали блокировку, а не падали с "database is locked").
+    Для asyncpg database.postgres_server_settings передаются как server_settings.
+
+    Аргументы:
+        database (DatabaseConfig): Секция конфигурации базы данных.
+
+    Возвращает:
+        AsyncEngine: Настроенный движок SQLAlchemy.
+    """
+    url = make_url(database.connect_string)
+    kwargs: Dict[str, Any] = {
+        "echo": database.echo,
+        "pool_pre_ping": database.pool_pre_ping,
+        "pool_recycle": database.pool_recycle,
+    }
+    is_sqlite = url.get_backend_name() == "sqlite"
+    # SQLite в памяти работает на StaticPool с единственным соединением — размеры пула к нему не применимы.
+    if not (is_sqlite and _is_memory_sqlite(url.database)):
+        kwargs.update(
+            pool_size=database.pool_size,
+            max_overflow=database.max_overflow,
+            pool_timeout=database.pool_timeout,
+        )
+    if url.get_driver_name() == "asyncpg" and database.postgres_server_settings:
+        kwargs["connect_args"] = {"server_settings": dict(database.postgres_server_settings)}
+
+    engine = create_async_engine(url, **kwargs)
+
+    if is_sqlite and database.sqlite_pragmas:
+        pragmas = dict(database.sqlite_pragmas)
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+    return engine
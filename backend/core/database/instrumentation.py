@@ -0,0 +1,124 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Optional
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from core.config import config
+from core.config.config import DatabaseConfig
+from core.logging import logger
+
+MAX_LOGGED_SQL = 2000
+MAX_LOGGED_PARAMETER = 200
+
+
+@dataclass
+class QueryStats:
+    """
+    SQL-статистика одного HTTP-запроса.
+
+    Атрибуты:
+        count (int): Число выполненных statement.
+        total_seconds (float): Суммарное время в базе.
+        slowest_seconds (float): Время самого медленного statement.
+        slowest_statement (Optional[str]): Его SQL.
+    """
+    count: int = 0
+    total_seconds: float = 0.0
+    slowest_seconds: float = 0.0
+    slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+
+    def server_timing(self) -> str:
+        return (
+            f'db;desc="{self.count} queries";dur={self.total_seconds * 1000:.2f}, '
+            f"db-slowest;dur={self.slowest_seconds * 1000:.2f}"
+        )
+
+
+query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def _shorten(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return f"<{len(value)} bytes>"
+    if isinstance(value, str) and len(value) > MAX_LOGGED_PARAMETER:
+        return value[:MAX_LOGGED_PARAMETER] + "..."
+    if isinstance(value, dict):
+        return {key: _shorten(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        if value and isinstance(value[0], (list, tuple, dict)):
+            return f"<executemany: {len(value)} rows>"
+        return [_shorten(item) for item in value]
+    return value
+
+
+def instrument_engine(engine: AsyncEngine, database: DatabaseConfig = config.database) -> None:
+    """
+    Подключает к движку учёт времени выполнения SQL.
+
+    Время каждого statement добавляется в QueryStats текущего запроса
+    (contextvar query_stats; SQLAlchemy переносит контекст в свои greenlet),
+    а statement дольше database.slow_query_threshold_ms пишется в лог вместе
+    с параметрами. Байтовые параметры (хэши паролей) заменяются длиной,
+    длинные строки обрезаются.
+
+    Аргументы:
+        engine (AsyncEngine): Движок приложения или реплики.
+        database (DatabaseConfig): Секция конфигурации базы данных.
+    """
+    if not database.query_stats_enabled:
+        return
+    threshold = database.slow_query_threshold_ms / 1000
+    log_parameters = database.slow_query_log_parameters
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info["query_started"] = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def stop_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = time.perf_counter() - conn.info.pop("query_started")
+        stats = query_stats.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+        if elapsed >= threshold:
+            fields = {"duration_ms": round(elapsed * 1000, 2), "sql": statement[:MAX_LOGGED_SQL]}
+            if log_parameters:
+                fields["parameters"] = _shorten(parameters)
+            logger.warning("Slow SQL query", **fields)
+
+
+async def query_stats_middleware(request: Request, call_next) -> Response:
+    """
+    Собирает SQL-статистику запроса и отдаёт её в Server-Timing и в лог.
+
+    Запросы, выполняемые при потоковой отдаче тела (выгрузки), завершаются
+    после возврата ответа и в статистику не попадают.
+    """
+    stats = QueryStats()
+    token = query_stats.set(stats)
+    try:
+        response = await call_next(request)
+    finally:
+        query_stats.reset(token)
+    if stats.count:
+        response.headers["Server-Timing"] = stats.server_timing()
+        logger.info(
+            "DB usage",
+            method=request.method,
+            path=request.url.path,
+            status_code=response.status_code,
+            db_queries=stats.count,
+            db_time_ms=round(stats.total_seconds * 1000, 2),
+            db_slowest_ms=round(stats.slowest_seconds * 1000, 2),
+            db_slowest_sql=(stats.slowest_statement or "")[:MAX_LOGGED_SQL],
+        )
+    return response
@@ -0,0 +1,50 @@
+from pathlib import Path
+from alembic import command
+from alembic.config import Config as AlembicConfig
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# Ревизия, соответствующая схеме, которую раньше создавал Base.metadata.create_all.
+BASELINE_REVISION = "0001"
+
+
+def get_alembic_config(connection: Connection | None = None) -> AlembicConfig:
+    """
+    Собирает конфигурацию Alembic независимо от текущего рабочего каталога.
+
+    Аргументы:
+        connection (Connection | None): Уже открытое соединение, в котором нужно выполнять миграции.
+
+    Возвращает:
+        alembic.config.Config: Конфигурация Alembic.
+    """
+    alembic_config = AlembicConfig(str(BACKEND_DIR / "alembic.ini"))
+    alembic_config.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+    if connection is not None:
+        alembic_config.attributes["connection"] = connection
+    return alembic_config
+
+
+def run_migrations(connection: Connection) -> None:
+    """
+    Применяет все миграции до head в переданном соединении.
+
+    Базы, созданные до появления миграций через create_all, не содержат
+    таблицы alembic_version — такие базы помечаются базовой ревизией,
+    после чего применяются только последующие миграции.
+
+    Аргументы:
+        connection (Connection): Синхронное соединение (через AsyncConnection.run_sync).
+    """
+    if connection.dialect.name == "postgresql":
+        # Несколько воркеров uvicorn стартуют одновременно — миграции выполняет только один.
+        connection.execute(text("SELECT pg_advisory_xact_lock(746150)"))
+
+    alembic_config = get_alembic_config(connection)
+    tables = set(inspect(connection).get_table_names())
+    if "alembic_version" not in tables and "users" in tables:
+        command.stamp(alembic_config, BASELINE_REVISION)
+    command.upgrade(alembic_config, "head")
@@ -0,0 +1,12 @@
+def import_models() -> None:
+    """
+    Импортирует все ORM-схемы приложения, чтобы Base.metadata была полной.
+
+    Нужна миграциям Alembic и служебным командам, которые работают
+    с базой без импорта FastAPI-приложения.
+    """
+    from core.database.schemas import table_versions  # noqa: F401
+    from app.user.schemas import user_schem, role_schem  # noqa: F401
+    from app.grades.schemas import grade_schem, grade_summary_schem  # noqa: F401
+    from app.schedule.schemas import schedule_schem  # noqa: F401
+    from app.messages.schemas import message_schem, conversation_schem  # noqa: F401
@@ -0,0 +1,108 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+from fastapi import Query
+from pydantic import BaseModel
+from core.config import config
+from core.exceptions.pagination import InvalidCursor
+
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """
+    Страница результатов keyset-пагинации.
+
+    Атрибуты:
+        items (List[T]): Элементы текущей страницы.
+        next_cursor (Optional[str]): Курсор следующей страницы или None, если страница последняя.
+    """
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class PageParams:
+    limit: int
+    after: Optional[str] = None
+
+
+def get_page_params(
+    limit: int = Query(
+        default=config.pagination.default_limit,
+        ge=1,
+        le=config.pagination.max_limit,
+        description="Максимальное количество элементов на странице",
+    ),
+    after: Optional[str] = Query(default=None, description="Курсор, полученный в поле next_cursor"),
+) -> PageParams:
+    """
+    Зависимость FastAPI, собирающая параметры пагинации из строки запроса.
+
+    Возвращает:
+        PageParams: Размер страницы и курсор.
+    """
+    return PageParams(limit=limit, after=after)
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Кодирует значения ключа сортировки последней строки в непрозрачный курсор.
+
+    Аргументы:
+        *values (Any): Значения ключа, например (id,) или (created_at, id).
+
+    Возвращает:
+        str: URL-безопасная строка курсора.
+    """
+    raw = json.dumps(
+        [v.isoformat() if isinstance(v, (date, datetime)) else v for v in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: Callable[[Any], Any]) -> Tuple[Any, ...]:
+    """
+    Декодирует курсор, приводя каждое значение к ожидаемому типу.
+
+    Аргументы:
+        cursor (str): Строка курсора от клиента.
+        *types (Callable): Конструкторы типов для каждого значения ключа.
+
+    Возвращает:
+        Tuple[Any, ...]: Значения ключа сортировки.
+
+    Вызывает:
+        InvalidCursor: Исключение (core.exceptions.pagination.InvalidCursor) если курсор повреждён.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("cursor arity mismatch")
+        return tuple(cast(value) for cast, value in zip(types, values))
+    except (ValueError, TypeError, binascii.Error) as e:
+        raise InvalidCursor("Invalid pagination cursor") from e
+
+
+def paginate(rows: Sequence[T], limit: int, key: Callable[[T], Tuple[Any, ...]]) -> Tuple[List[T], Optional[str]]:
+    """
+    Отрезает лишнюю строку, выбранную с запасом (limit + 1), и строит курсор следующей страницы.
+
+    Аргументы:
+        rows (Sequence[T]): Строки, выбранные с LIMIT limit + 1.
+        limit (int): Запрошенный размер страницы.
+        key (Callable): Функция, возвращающая ключ сортировки строки.
+
+    Возвращает:
+        Tuple[List[T], Optional[str]]: Строки страницы и курсор следующей страницы.
+    """
+    items = list(rows[:limit])
+    if len(rows) > limit and items:
+        return items, encode_cursor(*key(items[-1]))
+    return items, None
@@ -0,0 +1,140 @@
+import asyncio
+import itertools
+import time
+from typing import List, Optional
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from starlette.responses import Response
+from core.config import config
+from core.config.config import DatabaseConfig
+from core.database.engine import create_engine_from_config
+from core.database.instrumentation import instrument_engine
+from core.logging import logger
+from core.metrics import instrument_pool
+
+
+STICKY_COOKIE = "db_primary_until"
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ReplicaPool:
+    """
+    Набор пулов соединений к репликам чтения.
+
+    Реплики выбираются по кругу среди тех, что прошли последнюю проверку
+    здоровья (SELECT 1 раз в database.replica_health_check_interval_seconds).
+    Если здоровых реплик нет, chooser возвращает None и чтение идёт на primary.
+    """
+
+    def __init__(self, database: DatabaseConfig):
+        self.database = database
+        self.engines: List[AsyncEngine] = [
+            create_engine_from_config(database.model_copy(update={"connect_string": url}))
+            for url in database.replica_urls
+        ]
+        for index, engine in enumerate(self.engines):
+            instrument_engine(engine, database)
+            instrument_pool(engine, f"replica{index}")
+        self.session_makers: List[async_sessionmaker[AsyncSession]] = [
+            async_sessionmaker(engine, expire_on_commit=False) for engine in self.engines
+        ]
+        self.healthy: List[bool] = [True] * len(self.engines)
+        self._counter = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.engines)
+
+    def choose(self) -> Optional[int]:
+        """
+        Возвращает индекс следующей здоровой реплики или None.
+        """
+        if not self.engines:
+            return None
+        start = next(self._counter)
+        for offset in range(len(self.engines)):
+            index = (start + offset) % len(self.engines)
+            if self.healthy[index]:
+                return index
+        return None
+
+    def mark_unhealthy(self, index: int) -> None:
+        if self.healthy[index]:
+            logger.error(f"Read replica #{index} marked unhealthy")
+        self.healthy[index] = False
+
+    async def _check(self, index: int) -> None:
+        try:
+            async with self.engines[index].connect() as conn:
+                await asyncio.wait_for(
+                    conn.execute(text("SELECT 1")),
+                    timeout=self.database.replica_health_check_timeout_seconds,
+                )
+        except Exception as e:
+            if self.healthy[index]:
+                logger.error(f"Read replica #{index} health check failed: {e}")
+            self.healthy[index] = False
+            return
+        self.healthy[index] = True
+
+    async def check_health(self) -> None:
+        await asyncio.gather(*(self._check(index) for index in range(len(self.engines))))
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.database.replica_health_check_interval_seconds)
+            await self.check_health()
+
+    async def start(self) -> None:
+        if not self.enabled or self._task is not None:
+            return
+        await self.check_health()
+        self._task = asyncio.create_task(self._health_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for engine in self.engines:
+            await engine.dispose()
+
+
+replica_pool = ReplicaPool(config.database)
+
+
+def prefers_primary(request: Request) -> bool:
+    """
+    True, если клиент недавно что-то записал и его чтения должны видеть собственные изменения.
+    """
+    value = request.cookies.get(STICKY_COOKIE)
+    if not value:
+        return False
+    try:
+        return float(value) > time.time()
+    except ValueError:
+        return False
+
+
+async def read_your_writes_middleware(request: Request, call_next) -> Response:
+    """
+    После успешного изменяющего запроса ставит cookie, которая на
+    database.read_your_writes_seconds направляет чтения клиента на primary:
+    реплика может ещё не получить только что записанные данные.
+    """
+    response = await call_next(request)
+    if replica_pool.enabled and request.method not in SAFE_METHODS and response.status_code < 400:
+        window = config.database.read_your_writes_seconds
+        response.set_cookie(
+            key=STICKY_COOKIE,
+            value=str(int(time.time()) + window),
+            max_age=window,
+            path="/",
+            domain=config.cookies.domain,
+            secure=config.cookies.secure,
+            httponly=True,
+            samesite=config.cookies.samesite,
+        )
+    return response
@@ -0,0 +1,40 @@
+from typing import Any, Optional, Type, TypeVar
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+
+T = TypeVar("T")
+
+
+async def update_returning(db: AsyncSession, model: Type[T], pk: Any, values: dict) -> Optional[T]:
+    """
+    Обновляет строку по первичному ключу и возвращает её новое состояние.
+
+    На диалектах с UPDATE ... RETURNING (PostgreSQL, SQLite 3.35+, MariaDB)
+    это один запрос. Иначе выполняется UPDATE, и только если rowcount > 0 —
+    дополнительный SELECT. Commit остаётся за вызывающим кодом.
+
+    Аргументы:
+        db (AsyncSession): Сессия, в транзакции которой выполняется обновление.
+        model (Type[T]): ORM-модель.
+        pk (Any): Значение первичного ключа.
+        values (dict): Новые значения столбцов.
+
+    Возвращает:
+        Optional[T]: Обновлённый объект или None, если строки с таким ключом нет.
+    """
+    pk_column = model.__mapper__.primary_key[0]
+    if not values:
+        return await db.get(model, pk)
+    stmt = update(model).where(pk_column == pk).values(**values)
+    if db.bind.dialect.update_returning:
+        result = await db.execute(stmt.returning(model))
+        return result.scalars().first()
+    # Без RETURNING синхронизация "fetch" добавила бы SELECT перед UPDATE;
+    # объект всё равно перечитывается ниже с populate_existing.
+    result = await db.execute(stmt.execution_options(synchronize_session=False))
+    if not result.rowcount:
+        return None
+    result = await db.execute(select(model).where(pk_column == pk).execution_options(populate_existing=True))
+    return result.scalars().first()
@@ -0,0 +1,10 @@
+from sqlalchemy import Table, Column, String, BigInteger, DateTime
+from core.database import Base
+
+table_versions = Table(
+    "table_versions",
+    Base.metadata,
+    Column("name", String(100), primary_key=True),
+    Column("version", BigInteger, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
@@ -0,0 +1,98 @@
+from datetime import datetime, timezone
+from typing import Dict, Iterable
+from sqlalchemy import event, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+from core.database.schemas.table_versions import table_versions
+
+TOUCHED_TABLES_KEY = "touched_tables"
+
+
+def _touch(session: Session, tables: Iterable[str]) -> None:
+    session.info.setdefault(TOUCHED_TABLES_KEY, set()).update(tables)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session: Session, flush_context) -> None:
+    _touch(session, {obj.__table__.name for obj in (*session.new, *session.dirty, *session.deleted)})
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_dml(state: ORMExecuteState) -> None:
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    name = state.statement.table.name
+    if name != table_versions.name:
+        _touch(state.session, [name])
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_on_commit(session: Session) -> None:
+    session.flush()
+    tables = session.info.pop(TOUCHED_TABLES_KEY, None)
+    if tables:
+        bump_versions(session, sorted(tables))
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_on_rollback(session: Session) -> None:
+    session.info.pop(TOUCHED_TABLES_KEY, None)
+
+
+def bump_versions(session: Session, tables: Iterable[str]) -> None:
+    """
+    Увеличивает версии таблиц в текущей транзакции.
+
+    Вызывается автоматически перед commit для всех таблиц, в которые сессия
+    писала (через ORM flush или insert/update/delete через session.execute),
+    поэтому версия становится видна ровно вместе с изменёнными данными.
+    Таблицы обрабатываются в отсортированном порядке, чтобы конкурентные
+    транзакции брали блокировки строк в одном порядке.
+
+    Аргументы:
+        session (Session): Синхронная сессия (внутри AsyncSession — sync_session).
+        tables (Iterable[str]): Имена изменённых таблиц.
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    rows = [{"name": name, "version": 1, "updated_at": now} for name in tables]
+    dialect = session.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = dialect_insert(table_versions).values(rows)
+        session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[table_versions.c.name],
+                set_={"version": table_versions.c.version + 1, "updated_at": now},
+            )
+        )
+        return
+
+    for row in rows:
+        result = session.execute(
+            update(table_versions)
+            .where(table_versions.c.name == row["name"])
+            .values(version=table_versions.c.version + 1, updated_at=now)
+        )
+        if result.rowcount == 0:
+            session.execute(table_versions.insert().values(row))
+
+
+async def read_versions(db: AsyncSession, tables: Iterable[str]) -> Dict[str, int]:
+    """
+    Читает текущие версии таблиц; таблица, в которую ещё не писали, имеет версию 0.
+
+    Аргументы:
+        db (AsyncSession): Сессия, из которой затем читаются данные ответа.
+        tables (Iterable[str]): Имена таблиц.
+
+    Возвращает:
+        Dict[str, int]: Версия каждой таблицы.
+    """
+    names = sorted(set(tables))
+    result = await db.execute(
+        select(table_versions.c.name, table_versions.c.version).where(table_versions.c.name.in_(names))
+    )
+    versions = dict.fromkeys(names, 0)
+    versions.update(result.tuples().all())
+    return versions
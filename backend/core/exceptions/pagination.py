@@ -0,0 +1,12 @@
+class PaginationBaseException(Exception):
+    """
+    Базовое исключение для ошибок постраничной выборки.
+    """
+    pass
+
+
+class InvalidCursor(PaginationBaseException):
+    """
+    Курсор страницы повреждён или не соответствует эндпоинту.
+    """
+    pass
@@ -0,0 +1,36 @@
+import os
+from core.config import config
+
+# prometheus_client выбирает хранилище значений при импорте, поэтому каталог
+# для многопроцессного режима нужно указать до импорта registry.
+if config.metrics.multiprocess_dir:
+    os.makedirs(config.metrics.multiprocess_dir, exist_ok=True)
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", config.metrics.multiprocess_dir)
+
+from .registry import (  # noqa: E402
+    auth_attempts,
+    cache_requests,
+    db_pool_checked_out,
+    db_pool_overflow,
+    instrument_pool,
+    mark_worker_dead,
+    metrics_response,
+    password_hashing_pending,
+    request_latency,
+    requests_in_progress,
+)
+from .middleware import metrics_middleware  # noqa: E402
+
+__all__ = [
+    "auth_attempts",
+    "cache_requests",
+    "db_pool_checked_out",
+    "db_pool_overflow",
+    "instrument_pool",
+    "mark_worker_dead",
+    "metrics_middleware",
+    "metrics_response",
+    "password_hashing_pending",
+    "request_latency",
+    "requests_in_progress",
+]
@@ -0,0 +1,33 @@
+import time
+from fastapi import Request, Response
+from .registry import request_latency, requests_in_progress
+
+METRICS_PATH = "/metrics"
+
+
+async def metrics_middleware(request: Request, call_next) -> Response:
+    """
+    Замеряет время запроса и считает запросы в обработке.
+
+    Метка route — шаблон маршрута ("/api/v1/grades/{grade_id}"), а не путь,
+    чтобы число временных рядов не зависело от id. Запросы, не совпавшие
+    ни с одним маршрутом, попадают в route="<unmatched>".
+    """
+    if request.url.path == METRICS_PATH:
+        return await call_next(request)
+    in_progress = requests_in_progress.labels(request.method)
+    in_progress.inc()
+    started = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        request_latency.labels(
+            request.method,
+            getattr(route, "path", "<unmatched>"),
+            str(status_code),
+        ).observe(time.perf_counter() - started)
+        in_progress.dec()
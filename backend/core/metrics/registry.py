@@ -0,0 +1,123 @@
+import hmac
+import os
+from fastapi import HTTPException, Request, Response, status
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from core.config import config
+
+request_latency = Histogram(
+    "http_request_duration_seconds",
+    "Время обработки HTTP-запроса по шаблону маршрута.",
+    ["method", "route", "status"],
+    buckets=config.metrics.latency_buckets,
+)
+requests_in_progress = Gauge(
+    "http_requests_in_progress",
+    "Запросы, обрабатываемые в данный момент.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+db_pool_checked_out = Gauge(
+    "db_pool_checked_out_connections",
+    "Соединения, выданные из пула SQLAlchemy.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+db_pool_overflow = Gauge(
+    "db_pool_overflow_connections",
+    "Выданные соединения сверх pool_size (из max_overflow).",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+password_hashing_pending = Gauge(
+    "password_hashing_pending",
+    "Задачи bcrypt в пуле потоков хеширования: в очереди и выполняемые.",
+    multiprocess_mode="livesum",
+)
+cache_requests = Counter(
+    "cache_requests_total",
+    "Обращения к кешам; доля попаданий — hit / (hit + miss).",
+    ["cache", "result"],
+)
+auth_attempts = Counter(
+    "auth_attempts_total",
+    "Попытки входа, регистрации и проверки токена.",
+    ["action", "result"],
+)
+
+
+def instrument_pool(engine: AsyncEngine, name: str) -> None:
+    """
+    Обновляет метрики пула при каждой выдаче и возврате соединения.
+
+    Событие checkin срабатывает до того, как соединение вернулось в пул,
+    поэтому в нём из checkedout() вычитается само возвращаемое соединение.
+    Пулы без размера (NullPool, StaticPool) не отслеживаются.
+
+    Аргументы:
+        engine (AsyncEngine): Движок, чей пул отслеживается.
+        name (str): Значение метки pool ("primary", "replica0", ...).
+    """
+    pool = engine.sync_engine.pool
+    if not hasattr(pool, "checkedout") or not hasattr(pool, "size"):
+        return
+    checked_out = db_pool_checked_out.labels(name)
+    overflow = db_pool_overflow.labels(name)
+
+    def update(in_use: int) -> None:
+        checked_out.set(in_use)
+        overflow.set(max(0, in_use - pool.size()))
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def on_checkout(*args) -> None:
+        update(pool.checkedout())
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def on_checkin(*args) -> None:
+        update(max(0, pool.checkedout() - 1))
+
+
+def metrics_response(request: Request) -> Response:
+    """
+    Отдаёт метрики в текстовом формате Prometheus.
+
+    Маршрут /metrics подключается только при metrics.enabled (по умолчанию
+    выключено). Если задан metrics.token (METRICS_TOKEN), запрос должен нести
+    заголовок "Authorization: Bearer <token>" (bearer_token в конфигурации
+    Prometheus); без токена доступ к /metrics нужно ограничить на уровне сети.
+
+    В многопроцессном режиме (PROMETHEUS_MULTIPROC_DIR) значения собираются
+    из файлов всех воркеров, поэтому любой воркер отвечает за весь сервер.
+
+    Вызывает:
+        HTTPException: 401, если токен задан, а запрос его не содержит или он неверный.
+    """
+    token = config.metrics.token
+    if token:
+        presented = request.headers.get("authorization", "")
+        if not hmac.compare_digest(presented.encode(), f"Bearer {token}".encode()):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(content=generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+def mark_worker_dead() -> None:
+    """
+    Убирает live-gauge текущего воркера при его остановке.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,10 @@
+from .collapsed import append_profile, collapsed_stacks
+from .sampler import PROFILE_HEADER, profiling_middleware, sign_profile_request
+
+__all__ = [
+    "PROFILE_HEADER",
+    "append_profile",
+    "collapsed_stacks",
+    "profiling_middleware",
+    "sign_profile_request",
+]
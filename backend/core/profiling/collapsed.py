@@ -0,0 +1,64 @@
+import os
+from typing import Iterator, List
+
+
+def _frame_name(frame) -> str:
+    if frame.is_synthetic:
+        name = frame.function
+    else:
+        name = f"{frame.function} ({frame.file_path_short}:{frame.line_no})"
+    return name.replace(";", ":")
+
+
+def collapsed_stacks(root) -> Iterator[str]:
+    """
+    Переводит дерево кадров pyinstrument в формат "collapsed stacks".
+
+    Каждая строка — стек от корня к листу через ";" и время листа
+    в микросекундах; такой файл принимают flamegraph.pl, speedscope и inferno.
+    Одинаковые стеки из разных запросов инструменты суммируют сами,
+    поэтому профили одного маршрута можно дописывать в один файл.
+
+    Аргументы:
+        root: Корневой кадр (Session.root_frame()).
+
+    Возвращает:
+        Iterator[str]: Строки без перевода строки.
+    """
+    stack: List[tuple] = [(root, _frame_name(root))]
+    while stack:
+        frame, path = stack.pop()
+        if not frame.children:
+            micros = int(frame.time * 1_000_000)
+            if micros > 0:
+                yield f"{path} {micros}"
+            continue
+        for child in frame.children:
+            stack.append((child, f"{path};{_frame_name(child)}"))
+
+
+def append_profile(path: str, root, max_file_bytes: int) -> bool:
+    """
+    Дописывает профиль в файл маршрута, если файл ещё не превысил лимит.
+
+    Аргументы:
+        path (str): Файл *.collapsed.
+        root: Корневой кадр профиля или None, если не набралось ни одного сэмпла.
+        max_file_bytes (int): Предельный размер файла.
+
+    Возвращает:
+        bool: True, если профиль записан.
+    """
+    if root is None:
+        return False
+    try:
+        if os.path.getsize(path) >= max_file_bytes:
+            return False
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = "".join(f"{line}\n" for line in collapsed_stacks(root))
+    if not data:
+        return False
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(data)
+    return True
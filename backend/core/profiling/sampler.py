@@ -0,0 +1,136 @@
+import asyncio
+import hashlib
+import hmac
+import os
+import random
+import re
+import time
+from fastapi import Request, Response
+from core.config import config
+from core.logging import logger
+from .collapsed import append_profile
+
+PROFILE_HEADER = "X-Profile"
+
+_active = 0
+_profiler_class = None
+_profiler_missing = False
+
+
+def _signature(secret: str, timestamp: str, method: str, path: str) -> str:
+    message = f"{timestamp}:{method.upper()}:{path}".encode("utf-8")
+    return hmac.new(secret.encode("utf-8"), message, hashlib.sha256).hexdigest()
+
+
+def sign_profile_request(method: str, path: str, secret: str | None = None) -> str:
+    """
+    Собирает значение заголовка X-Profile, включающего профилирование одного запроса.
+
+    Подпись привязана к методу, пути и времени и действует
+    profiling.header_max_age_seconds секунд.
+
+    Аргументы:
+        method (str): HTTP-метод запроса.
+        path (str): Путь запроса без query ("/api/v1/auth/login").
+        secret (str | None): Секрет; по умолчанию profiling.header_secret.
+
+    Возвращает:
+        str: Значение заголовка в виде "<unix-время>.<hmac-sha256>".
+
+    Вызывает:
+        RuntimeError: Если секрет не задан.
+    """
+    secret = secret or config.profiling.header_secret
+    if not secret:
+        raise RuntimeError("profiling.header_secret (PROFILING_SECRET) is not set")
+    timestamp = str(int(time.time()))
+    return f"{timestamp}.{_signature(secret, timestamp, method, path)}"
+
+
+def _has_valid_signature(request: Request) -> bool:
+    secret = config.profiling.header_secret
+    value = request.headers.get(PROFILE_HEADER)
+    if not secret or not value:
+        return False
+    timestamp, _, signature = value.partition(".")
+    if not timestamp.isdigit():
+        return False
+    if abs(time.time() - int(timestamp)) > config.profiling.header_max_age_seconds:
+        return False
+    expected = _signature(secret, timestamp, request.method, request.url.path)
+    return hmac.compare_digest(expected, signature)
+
+
+def _load_profiler():
+    global _profiler_class, _profiler_missing
+    if _profiler_class is None and not _profiler_missing:
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            _profiler_missing = True
+            logger.error("Request profiling requires the 'pyinstrument' package")
+        else:
+            _profiler_class = Profiler
+    return _profiler_class
+
+
+def _profile_path(method: str, route_path: str) -> str:
+    name = re.sub(r"[^A-Za-z0-9]+", "_", f"{method}_{route_path}").strip("_")
+    return os.path.join(config.logging.logs_dir, "profiles", f"{name}.collapsed")
+
+
+def _write_profile(path: str, session, max_file_bytes: int) -> bool:
+    return append_profile(path, session.root_frame(), max_file_bytes)
+
+
+async def profiling_middleware(request: Request, call_next) -> Response:
+    """
+    Профилирует выборку запросов статистическим профилировщиком pyinstrument.
+
+    Запрос профилируется, если profiling.enabled и он попал в долю
+    profiling.sample_rate, или если в нём есть действующий заголовок
+    X-Profile (см. sign_profile_request). Одновременно профилируется не больше
+    profiling.max_concurrent запросов на процесс, остальные идут как обычно.
+
+    Профиль дописывается в <logging.logs_dir>/profiles/<METHOD>_<маршрут>.collapsed
+    в отдельном потоке. Запросы без совпавшего маршрута не записываются.
+    """
+    global _active
+    settings = config.profiling
+    sampled = settings.enabled and random.random() < settings.sample_rate
+    if not sampled and not _has_valid_signature(request):
+        return await call_next(request)
+    if _active >= settings.max_concurrent:
+        return await call_next(request)
+    profiler_class = _load_profiler()
+    if profiler_class is None:
+        return await call_next(request)
+
+    profiler = profiler_class(interval=settings.interval_seconds, async_mode="enabled")
+    _active += 1
+    profiler.start()
+    try:
+        response = await call_next(request)
+    finally:
+        session = profiler.stop()
+        _active -= 1
+
+    route = request.scope.get("route")
+    if route is not None:
+        path = _profile_path(request.method, route.path)
+        try:
+            written = await asyncio.to_thread(
+                _write_profile, path, session, settings.max_file_bytes
+            )
+        except OSError as e:
+            logger.error(f"Failed to write profile {path}: {e}")
+        else:
+            if written:
+                logger.info(
+                    "Request profiled",
+                    method=request.method,
+                    route=route.path,
+                    duration_ms=round(session.duration * 1000, 2),
+                    profile=path,
+                )
+    return response
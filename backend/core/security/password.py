@@ -1,4 +1,53 @@
+import asyncio
+import re
 import bcrypt
+from concurrent.futures import ThreadPoolExecutor
+from core.config import config
+from core.metrics import password_hashing_pending
+
+
+_hashing_executor: ThreadPoolExecutor | None = None
+
+_BCRYPT_HASH = re.compile(r"^\$2[aby]\$\d{2}\$[./A-Za-z0-9]{53}$")
+
+
+def get_hashing_executor() -> ThreadPoolExecutor:
+    """
+    Возвращает пул потоков для bcrypt, создавая его при первом обращении.
+
+    bcrypt освобождает GIL на время хеширования, поэтому пул потоков
+    размером config.password_hashing.workers даёт реальный параллелизм
+    и не блокирует цикл событий.
+
+    Возвращает:
+        ThreadPoolExecutor: Пул потоков для хеширования паролей.
+    """
+    global _hashing_executor
+    if _hashing_executor is None:
+        _hashing_executor = ThreadPoolExecutor(
+            max_workers=config.password_hashing.workers,
+            thread_name_prefix="bcrypt",
+        )
+    return _hashing_executor
+
+
+async def _run_hashing(fn, *args):
+    loop = asyncio.get_running_loop()
+    password_hashing_pending.inc()
+    try:
+        return await loop.run_in_executor(get_hashing_executor(), fn, *args)
+    finally:
+        password_hashing_pending.dec()
+
+
+def shutdown_hashing_executor() -> None:
+    """
+    Останавливает пул потоков хеширования, дожидаясь завершения текущих задач.
+    """
+    global _hashing_executor
+    if _hashing_executor is not None:
+        _hashing_executor.shutdown(wait=True)
+        _hashing_executor = None
 
 
 def verify_password(plain_password: str, hashed_password: bytes) -> bool:
@@ -26,4 +75,41 @@ def get_password_hash(password: str) -> bytes:
         bytes: Захешированный пароль.
     """
     password_byte_enc = password.encode("utf-8")
-    return bcrypt.hashpw(password_byte_enc, bcrypt.gensalt())
\ No newline at end of file
+    return bcrypt.hashpw(password_byte_enc, bcrypt.gensalt())
+
+def is_password_hash(value: str) -> bool:
+    """
+    Проверяет, является ли строка готовым bcrypt-хешем (например, при переносе пользователей из другой системы).
+
+    Аргументы:
+        value (str): Проверяемая строка.
+
+    Возвращает:
+        bool: True, если строка имеет формат bcrypt-хеша.
+    """
+    return bool(_BCRYPT_HASH.match(value))
+
+async def verify_password_async(plain_password: str, hashed_password: bytes) -> bool:
+    """
+    Асинхронная версия verify_password, выполняемая в пуле потоков хеширования.
+
+    Аргументы:
+        plain_password (str): Обычный пароль пользователя.
+        hashed_password (bytes): Захешированный пароль из базы данных.
+
+    Возвращает:
+        bool: True, если пароль совпадает, иначе False.
+    """
+    return await _run_hashing(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> bytes:
+    """
+    Асинхронная версия get_password_hash, выполняемая в пуле потоков хеширования.
+
+    Аргументы:
+        password (str): Обычный пароль пользователя.
+
+    Возвращает:
+        bytes: Захешированный пароль.
+    """
+    return await _run_hashing(get_password_hash, password)
@@ -0,0 +1,182 @@
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Set, Tuple
+from core.config import config
+
+
+@dataclass(frozen=True)
+class CachedToken:
+    """
+    Результат успешной проверки JWT токена.
+
+    Атрибуты:
+        signing_input (str): Заголовок и полезная нагрузка токена ("header.payload").
+        claims (Dict[str, Any]): Декодированная полезная нагрузка.
+        user_id (int): ID пользователя.
+        email (str): Email пользователя.
+        first_name (str): Имя пользователя.
+        last_name (str): Фамилия пользователя.
+        roles (Tuple[str, ...]): Названия ролей пользователя.
+        expires_at (float): Unix-время, после которого запись недействительна.
+    """
+    signing_input: str
+    claims: Dict[str, Any]
+    user_id: int
+    email: str
+    first_name: str
+    last_name: str
+    roles: Tuple[str, ...]
+    expires_at: float
+
+
+class TokenCache:
+    """
+    Ограниченный LRU-кеш проверенных JWT токенов с TTL.
+
+    Ключ — подпись токена. Вместе с записью хранится подписанная часть токена,
+    и при чтении она сравнивается с предъявленной, поэтому подделать запись,
+    подставив чужую подпись, нельзя. Запись живёт не дольше exp токена и
+    не дольше ttl_seconds (не более MAX_TTL_SECONDS при любой конфигурации).
+
+    Кеш свой у каждого воркера и между воркерами не синхронизируется:
+    invalidate_user очищает только текущий процесс. Поэтому изменение
+    пользователя или его ролей (в том числе отзыв роли) гарантированно
+    доходит до всех воркеров не позже чем через ttl_seconds, а не через
+    exp токена, который составляет дни.
+    """
+
+    MAX_TTL_SECONDS = 300
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = min(ttl_seconds, self.MAX_TTL_SECONDS)
+        self._entries: "OrderedDict[str, CachedToken]" = OrderedDict()
+        self._by_user: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _split(token: str) -> Optional[Tuple[str, str]]:
+        signing_input, _, signature = token.rpartition(".")
+        if not signing_input or not signature:
+            return None
+        return signing_input, signature
+
+    def get(self, token: str) -> Optional[CachedToken]:
+        """
+        Возвращает запись для токена, если она есть и ещё действительна.
+
+        Аргументы:
+            token (str): JWT токен без префикса "Bearer ".
+
+        Возвращает:
+            Optional[CachedToken]: Запись кеша или None.
+        """
+        parts = self._split(token)
+        if parts is None:
+            return None
+        signing_input, signature = parts
+        with self._lock:
+            entry = self._entries.get(signature)
+            if entry is None:
+                return None
+            if not hmac.compare_digest(entry.signing_input, signing_input):
+                return None
+            if entry.expires_at <= time.time():
+                self._discard(signature)
+                return None
+            self._entries.move_to_end(signature)
+            return entry
+
+    def put(
+        self,
+        token: str,
+        claims: Dict[str, Any],
+        user_id: int,
+        email: str,
+        first_name: str,
+        last_name: str,
+        roles: Tuple[str, ...],
+    ) -> None:
+        """
+        Сохраняет результат проверки токена.
+
+        Аргументы:
+            token (str): JWT токен без префикса "Bearer ".
+            claims (Dict[str, Any]): Декодированная полезная нагрузка.
+            user_id (int): ID пользователя.
+            email (str): Email пользователя.
+            first_name (str): Имя пользователя.
+            last_name (str): Фамилия пользователя.
+            roles (Tuple[str, ...]): Названия ролей пользователя.
+        """
+        parts = self._split(token)
+        if parts is None or self.max_size <= 0:
+            return
+        signing_input, signature = parts
+        expires_at = time.time() + self.ttl_seconds
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+        entry = CachedToken(
+            signing_input=signing_input,
+            claims=dict(claims),
+            user_id=user_id,
+            email=email,
+            first_name=first_name,
+            last_name=last_name,
+            roles=tuple(roles),
+            expires_at=expires_at,
+        )
+        with self._lock:
+            self._discard(signature)
+            self._entries[signature] = entry
+            self._by_user.setdefault(user_id, set()).add(signature)
+            while len(self._entries) > self.max_size:
+                oldest, _ = next(iter(self._entries.items()))
+                self._discard(oldest)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        Удаляет все записи пользователя в текущем процессе.
+
+        Сейчас пользователи и user_roles только создаются (регистрация, импорт),
+        и у новых пользователей записей в кеше нет. Код, который изменит или удалит
+        существующего пользователя или его роли, должен вызывать этот метод после
+        commit; остальные воркеры увидят изменение через ttl_seconds.
+
+        Аргументы:
+            user_id (int): ID пользователя.
+        """
+        with self._lock:
+            for signature in list(self._by_user.get(user_id, ())):
+                self._discard(signature)
+
+    def clear(self) -> None:
+        """
+        Полностью очищает кеш.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _discard(self, signature: str) -> None:
+        entry = self._entries.pop(signature, None)
+        if entry is None:
+            return
+        signatures = self._by_user.get(entry.user_id)
+        if signatures is not None:
+            signatures.discard(signature)
+            if not signatures:
+                del self._by_user[entry.user_id]
+
+
+token_cache = TokenCache(
+    max_size=config.token_cache.max_size if config.token_cache.enabled else 0,
+    ttl_seconds=config.token_cache.ttl_seconds,
+)
@@ -0,0 +1,83 @@
+from typing import Annotated, Awaitable, Callable, Optional
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.database import get_db, get_read_db
+from core.database.versions import read_versions
+from core.serialization.etag import etag_matches, make_etag
+
+CACHE_CONTROL = "private, no-cache"
+
+
+async def _no_user() -> None:
+    return None
+
+
+def conditional_get(
+    *tables: str,
+    primary: bool = False,
+    vary_on_user: Optional[Callable[..., Awaitable[int]]] = None,
+) -> Callable[..., Awaitable[None]]:
+    """
+    Создаёт зависимость условного GET для маршрута, данные которого зависят от таблиц tables.
+
+    ETag вычисляется по URL запроса и версиям таблиц (table_versions) без
+    чтения и сериализации самих данных. Если If-None-Match совпадает,
+    маршрут не выполняется и клиент получает 304. Иначе ETag сохраняется
+    в request.state и добавляется к ответу 200 в etag_middleware.
+
+    Версии читаются из той же сессии, что и данные маршрута (основной БД
+    или реплики), и до них: запись, закоммиченная между двумя чтениями,
+    даёт клиенту старый ETag на новых данных, и следующий запрос просто
+    получит 200.
+
+    Если ответ зависит от пользователя, зависимость vary_on_user (обычно
+    get_current_user_id) выполняется до сравнения ETag: недействительный или
+    просроченный токен получает её ошибку (401), а не 304. ETag включает
+    ID пользователя, а не сам заголовок Authorization.
+
+    Аргументы:
+        *tables (str): Таблицы, из которых собирается ответ.
+        primary (bool): Маршрут читает через get_db, а не get_read_db.
+        vary_on_user (Optional[Callable[..., Awaitable[int]]]): Зависимость, возвращающая ID
+            текущего пользователя, если ответ зависит от него.
+
+    Возвращает:
+        Callable[..., Awaitable[None]]: Зависимость для dependencies=[Depends(...)].
+    """
+    get_session = get_db if primary else get_read_db
+
+    async def check(
+        request: Request,
+        db: Annotated[AsyncSession, Depends(get_session)],
+        user_id: Annotated[Optional[int], Depends(vary_on_user or _no_user)],
+    ) -> None:
+        versions = await read_versions(db, tables)
+        parts = [request.url.path, request.url.query]
+        parts.extend(f"{name}={version}" for name, version in versions.items())
+        headers = {"Cache-Control": CACHE_CONTROL}
+        if vary_on_user is not None:
+            parts.append(f"user={user_id}")
+            headers["Vary"] = "Authorization"
+        headers["ETag"] = make_etag("\n".join(parts).encode(), weak=True)
+        if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        request.state.conditional_headers = headers
+
+    return check
+
+
+async def etag_middleware(request: Request, call_next) -> Response:
+    """
+    Добавляет заголовки, подготовленные conditional_get, к успешному ответу.
+
+    Нужен потому, что маршруты, возвращающие Response напрямую (page_response),
+    не получают заголовки из параметра response. Заголовки, уже выставленные
+    маршрутом, не перезаписываются.
+    """
+    response = await call_next(request)
+    headers = getattr(request.state, "conditional_headers", None)
+    if headers and response.status_code == status.HTTP_200_OK:
+        for name, value in headers.items():
+            if name not in response.headers:
+                response.headers[name] = value
+    return response
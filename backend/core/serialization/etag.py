@@ -0,0 +1,39 @@
+import hashlib
+from typing import Optional
+
+
+def make_etag(body: bytes, weak: bool = False) -> str:
+    """
+    Строит ETag по байтам тела ответа или иным данным, определяющим представление.
+
+    Аргументы:
+        body (bytes): Тело ответа или данные версии.
+        weak (bool): Вернуть слабый ETag (W/"...").
+
+    Возвращает:
+        str: ETag в кавычках, например '"3f2a..."'.
+    """
+    tag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    return "W/" + tag if weak else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Проверяет заголовок If-None-Match против текущего ETag.
+
+    Для If-None-Match по RFC 9110 используется слабое сравнение, поэтому
+    префикс W/ игнорируется.
+
+    Аргументы:
+        if_none_match (Optional[str]): Значение заголовка If-None-Match.
+        etag (str): Текущий ETag ресурса.
+
+    Возвращает:
+        bool: True, если клиент уже имеет актуальную версию.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == current for tag in if_none_match.split(","))
@@ -0,0 +1,70 @@
+import csv
+import io
+from datetime import date
+from typing import AsyncIterator, Literal, Type
+import orjson
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Select
+from core.database.db import async_session_maker
+from core.serialization.response import response_fields
+
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+CHUNK_ROWS = 1000
+
+
+def _csv_value(value):
+    # date и datetime пишутся в ISO 8601, как в JSON-ответах API.
+    return value.isoformat() if isinstance(value, date) else value
+
+
+async def iter_export(query: Select, model: Type[BaseModel], fmt: ExportFormat) -> AsyncIterator[bytes]:
+    """
+    Построчно читает результат запроса серверным курсором и отдаёт его частями.
+
+    Сессия открывается внутри генератора: сессия из Depends(get_db) закрывается
+    раньше, чем StreamingResponse начинает отправку тела. В памяти одновременно
+    находится не больше CHUNK_ROWS строк.
+
+    Аргументы:
+        query (Select): Core-запрос, выбирающий колонки.
+        model (Type[BaseModel]): Модель ответа, задающая набор и порядок полей.
+        fmt (ExportFormat): "ndjson" или "csv".
+
+    Возвращает:
+        AsyncIterator[bytes]: Части тела ответа.
+    """
+    fields = response_fields(model)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if fmt == "csv":
+        writer.writerow(fields)
+        yield buffer.getvalue().encode()
+
+    async with async_session_maker() as session:
+        result = await session.stream(query.execution_options(yield_per=CHUNK_ROWS))
+        async for partition in result.partitions():
+            if fmt == "ndjson":
+                yield b"".join(
+                    orjson.dumps({name: row._mapping[name] for name in fields}) + b"\n" for row in partition
+                )
+                continue
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([tuple(_csv_value(row._mapping[name]) for name in fields) for row in partition])
+            yield buffer.getvalue().encode()
+
+
+def export_response(query: Select, model: Type[BaseModel], fmt: ExportFormat, filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        iter_export(query, model, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
@@ -0,0 +1,75 @@
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple, Type
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Row
+
+
+@lru_cache(maxsize=None)
+def response_fields(model: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(model.model_fields)
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+def items_json(rows: Sequence[Any], model: Type[BaseModel]) -> bytes:
+    """
+    Проверяет строки моделью ответа один раз и кодирует их в JSON-массив.
+
+    Валидация и кодирование выполняются pydantic-core за один проход по
+    строкам: строки select(колонки) и ORM-объекты читаются по атрибутам
+    (from_attributes), лишние столбцы в ответ не попадают. Повторной
+    валидации через response_model маршрута нет, потому что маршрут
+    возвращает готовые байты.
+
+    Аргументы:
+        rows (Sequence[Any]): Строки Core-запроса или ORM-объекты.
+        model (Type[BaseModel]): Модель ответа, описанная в response_model маршрута.
+
+    Возвращает:
+        bytes: JSON-массив объектов модели.
+    """
+    adapter = list_adapter(model)
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+
+def envelope(items: bytes, **fields: Any) -> bytes:
+    """
+    Оборачивает готовый JSON-массив в объект {"items": [...], **fields}.
+    """
+    if not fields:
+        return b'{"items":' + items + b"}"
+    return b'{"items":' + items + b"," + orjson.dumps(fields)[1:]
+
+
+def page_body(rows: Sequence[Row], next_cursor: Optional[str], model: Type[BaseModel]) -> bytes:
+    """
+    Сериализует страницу Page[model] в JSON-байты.
+
+    Страница ограничена pagination.max_limit, поэтому тело собирается целиком,
+    а не потоком: так у ответа есть Content-Length и его можно положить в кеш
+    (schedule_cache). Для выгрузок без ограничения размера есть потоковый
+    core.serialization.export.
+
+    Возвращает:
+        bytes: Тело {"items": [...], "next_cursor": ...}.
+    """
+    return envelope(items_json(rows, model), next_cursor=next_cursor)
+
+
+def json_response(body: bytes, status_code: int = 200) -> Response:
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def page_response(rows: Sequence[Row], next_cursor: Optional[str], model: Type[BaseModel]) -> Response:
+    """
+    Собирает ответ Page[model] напрямую в байты, минуя повторную валидацию response_model.
+
+    Возвращает:
+        Response: Тело {"items": [...], "next_cursor": ...}.
+    """
+    return json_response(page_body(rows, next_cursor, model))
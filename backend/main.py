@@ -1,6 +1,7 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from core.config import config
 from core.logging import logger
 from lynx_logger.middleware import FastAPILoggingMiddleware
@@ -11,7 +12,15 @@ from app.user.api import user_router
 from app.grades.api import grade_router
 from app.schedule.api import schedule_router
 from app.messages.api import message_router
+from app.schedule.services.schedule_cache import schedule_cache
 from core.database.db import init_db, seed_roles
+from core.database.replicas import read_your_writes_middleware, replica_pool
+from core.database.instrumentation import query_stats_middleware
+from core.metrics import mark_worker_dead, metrics_middleware, metrics_response
+from core.profiling import profiling_middleware
+from core.security.password import shutdown_hashing_executor
+from core.serialization.conditional import etag_middleware
+from core.exceptions.pagination import InvalidCursor
 
 # Ensure ORM models are imported so SQLAlchemy can configure relationships
 from app.user.schemas import user_schem, role_schem  # noqa: F401
@@ -35,6 +44,25 @@ main_router.include_router(schedule_router)
 main_router.include_router(message_router)
 app.include_router(main_router)
 
+if config.metrics.enabled:
+    app.get("/metrics", include_in_schema=False)(metrics_response)
+
+
+@app.exception_handler(InvalidCursor)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": "Invalid pagination cursor"},
+    )
+
+if config.profiling.enabled or config.profiling.header_secret:
+    app.middleware("http")(profiling_middleware)
+app.middleware("http")(read_your_writes_middleware)
+app.middleware("http")(etag_middleware)
+app.middleware("http")(query_stats_middleware)
+if config.metrics.enabled:
+    app.middleware("http")(metrics_middleware)
+
 middleware_logger = logger.get_logger()
 if not middleware_logger:
     raise RuntimeError("Middleware logger is not available.")
@@ -58,3 +86,12 @@ async def on_startup() -> None:
     # Create tables and finalize mappers after models have been imported
     await init_db()
     await seed_roles()
+    await replica_pool.start()
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    shutdown_hashing_executor()
+    await replica_pool.stop()
+    await schedule_cache.close()
+    mark_worker_dead()
@@ -0,0 +1,146 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from core.database.models import import_models
+from core.database.db import async_session_maker, init_db
+
+import_models()
+
+
+async def rebuild_grade_summary(args: argparse.Namespace) -> None:
+    """
+    Пересобирает таблицу grade_summary по таблице grades.
+    """
+    from app.grades.repositories.grade_repo import GradeRepo
+
+    async with async_session_maker() as session:
+        rows = await GradeRepo(session).rebuild_summary()
+    print(f"grade_summary rebuilt: {rows} rows")
+
+
+async def import_csv(args: argparse.Namespace) -> None:
+    """
+    Импортирует CSV-файл пользователей, расписания или оценок и печатает JSON-отчёт.
+    """
+    from app.imports.repositories.import_repo import ImportRepo
+    from app.imports.services.import_service import ImportService
+    from app.schedule.services.schedule_cache import schedule_cache
+
+    with ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix="bcrypt") as executor:
+        async with async_session_maker() as session:
+            service = ImportService(ImportRepo(session), hashing_executor=executor)
+            run = {
+                "import-users": service.import_users,
+                "import-schedule": service.import_schedule,
+                "import-grades": service.import_grades,
+            }[args.command]
+            try:
+                report = await run(Path(args.file), dry_run=args.dry_run)
+            finally:
+                await schedule_cache.close()
+
+    output = report.model_dump_json(indent=2)
+    if args.report:
+        Path(args.report).write_text(output, encoding="utf-8")
+    else:
+        print(output)
+    print(
+        f"{report.kind}: {report.created} created, {len(report.skipped)} skipped, "
+        f"{len(report.errors)} errors in {report.elapsed_s}s",
+        file=sys.stderr,
+    )
+
+
+async def generate_data(args: argparse.Namespace) -> None:
+    """
+    Применяет миграции и заполняет пустую базу синтетическими данными.
+    """
+    from datetime import date
+    from benchmarks.datagen import DatasetSpec, generate
+
+    spec = DatasetSpec(
+        schools=args.schools,
+        classes_per_school=args.classes_per_school,
+        students_per_class=args.students_per_class,
+        years=args.years,
+        grades_per_student_week=args.grades_per_week,
+        class_messages_per_day=args.class_messages_per_day,
+        direct_messages_per_student_week=args.direct_messages_per_week,
+        end_date=date.fromisoformat(args.end_date),
+        seed=args.seed,
+        batch_size=args.batch_size,
+    )
+    await init_db()
+    async with async_session_maker() as session:
+        counts = await generate(session, spec, progress=lambda line: print(line, file=sys.stderr))
+    print(json.dumps(counts, indent=2))
+
+
+async def profile_header(args: argparse.Namespace) -> None:
+    """
+    Печатает заголовок X-Profile, включающий профилирование одного запроса.
+    """
+    from core.profiling import PROFILE_HEADER, sign_profile_request
+
+    print(f"{PROFILE_HEADER}: {sign_profile_request(args.method, args.path)}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Служебные команды eDziennik")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser("rebuild-grade-summary", help="пересчитать grade_summary по таблице grades")
+    rebuild.set_defaults(handler=rebuild_grade_summary)
+
+    for name, columns in (
+        ("import-users", "email,first_name,last_name,password,roles (роли через ';')"),
+        ("import-schedule", "class_name,weekday,time_from,time_to,subject,teacher_email"),
+        ("import-grades", "student_email,teacher_email,subject,value,date,comment"),
+    ):
+        command = commands.add_parser(name, help=f"импорт CSV: {columns}")
+        command.add_argument("file", help="CSV-файл с заголовком")
+        command.add_argument("--report", help="записать JSON-отчёт в файл вместо stdout")
+        command.add_argument("--dry-run", action="store_true", help="только проверить файл, ничего не записывать")
+        command.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 4,
+            help="потоков для bcrypt (по умолчанию — число CPU)",
+        )
+        command.set_defaults(handler=import_csv)
+
+    from benchmarks.datagen import DatasetSpec
+
+    defaults = DatasetSpec()
+    generate = commands.add_parser("generate-data", help="заполнить пустую базу синтетическими данными")
+    generate.add_argument("--schools", type=int, default=defaults.schools)
+    generate.add_argument("--classes-per-school", type=int, default=defaults.classes_per_school)
+    generate.add_argument("--students-per-class", type=int, default=defaults.students_per_class)
+    generate.add_argument("--years", type=int, default=defaults.years, help="учебных лет оценок и сообщений")
+    generate.add_argument("--grades-per-week", type=float, default=defaults.grades_per_student_week,
+                          help="оценок на ученика в неделю")
+    generate.add_argument("--class-messages-per-day", type=float, default=defaults.class_messages_per_day)
+    generate.add_argument("--direct-messages-per-week", type=float,
+                          default=defaults.direct_messages_per_student_week,
+                          help="личных сообщений на ученика в неделю")
+    generate.add_argument("--end-date", default=defaults.end_date.isoformat(), help="последний день данных")
+    generate.add_argument("--seed", type=int, default=defaults.seed)
+    generate.add_argument("--batch-size", type=int, default=defaults.batch_size)
+    generate.set_defaults(handler=generate_data)
+
+    profile = commands.add_parser("profile-header", help="подписать заголовок X-Profile (нужен PROFILING_SECRET)")
+    profile.add_argument("method", help="HTTP-метод, например POST")
+    profile.add_argument("path", help="путь без query, например /api/v1/auth/login")
+    profile.set_defaults(handler=profile_header)
+
+    return parser
+
+
+if __name__ == "__main__":
+    args = build_parser().parse_args()
+    asyncio.run(args.handler(args))
@@ -0,0 +1,49 @@
+"""grade_summary aggregate table
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Базы, созданные через create_all после появления grade_summary, уже содержат таблицу.
+    if "grade_summary" in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    op.create_table(
+        "grade_summary",
+        sa.Column("student_id", sa.Integer(), nullable=False),
+        sa.Column("subject", sa.String(length=100), nullable=False),
+        sa.Column("grade_count", sa.Integer(), nullable=False),
+        sa.Column("value_sum", sa.Integer(), nullable=False),
+        sa.Column("value_sum_sq", sa.Integer(), nullable=False),
+        sa.Column("min_value", sa.Integer(), nullable=False),
+        sa.Column("max_value", sa.Integer(), nullable=False),
+        sa.Column("last_date", sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(["student_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("student_id", "subject"),
+    )
+    op.execute(
+        """
+        INSERT INTO grade_summary
+            (student_id, subject, grade_count, value_sum, value_sum_sq, min_value, max_value, last_date)
+        SELECT student_id, subject, COUNT(id), SUM(value), SUM(value * value), MIN(value), MAX(value), MAX(date)
+        FROM grades
+        GROUP BY student_id, subject
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("grade_summary")
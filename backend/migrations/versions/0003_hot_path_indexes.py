@@ -0,0 +1,35 @@
+"""indexes for hot filter columns
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_grades_student_id_id", "grades", ["student_id", "id"])
+    op.create_index("ix_grades_teacher_id_id", "grades", ["teacher_id", "id"])
+    op.create_index("ix_grades_student_id_subject", "grades", ["student_id", "subject"])
+    op.create_index("ix_messages_from_id_id", "messages", ["from_id", "id"])
+    op.create_index("ix_messages_to_id_id", "messages", ["to_id", "id"])
+    op.create_index("ix_messages_class_name_id", "messages", ["class_name", "id"])
+    op.create_index("ix_schedule_class_name_weekday", "schedule", ["class_name", "weekday"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_schedule_class_name_weekday", table_name="schedule")
+    op.drop_index("ix_messages_class_name_id", table_name="messages")
+    op.drop_index("ix_messages_to_id_id", table_name="messages")
+    op.drop_index("ix_messages_from_id_id", table_name="messages")
+    op.drop_index("ix_grades_student_id_subject", table_name="grades")
+    op.drop_index("ix_grades_teacher_id_id", table_name="grades")
+    op.drop_index("ix_grades_student_id_id", table_name="grades")
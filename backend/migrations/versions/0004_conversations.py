@@ -0,0 +1,128 @@
+"""conversations and per-participant unread counters
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "conversations",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("key", sa.String(length=100), nullable=False),
+        sa.Column("kind", sa.String(length=10), nullable=False),
+        sa.Column("user_low_id", sa.Integer(), nullable=True),
+        sa.Column("user_high_id", sa.Integer(), nullable=True),
+        sa.Column("class_name", sa.String(length=50), nullable=True),
+        sa.Column("last_message_id", sa.Integer(), nullable=True),
+        sa.Column("last_message_at", sa.DateTime(), nullable=True),
+        sa.Column("message_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_low_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["user_high_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("key"),
+    )
+    op.create_table(
+        "conversation_participants",
+        sa.Column("conversation_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("unread_count", sa.Integer(), nullable=False),
+        sa.Column("last_read_message_id", sa.Integer(), nullable=False),
+        sa.Column("last_message_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["conversation_id"], ["conversations.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("conversation_id", "user_id"),
+    )
+    op.create_index(
+        "ix_conversation_participants_inbox",
+        "conversation_participants",
+        ["user_id", "last_message_id", "conversation_id"],
+    )
+    with op.batch_alter_table("messages") as batch_op:
+        batch_op.add_column(sa.Column("conversation_id", sa.Integer(), nullable=True))
+        batch_op.create_foreign_key("fk_messages_conversation_id", "conversations", ["conversation_id"], ["id"])
+        batch_op.create_index("ix_messages_conversation_id_id", ["conversation_id", "id"])
+
+    # Переносим существующую историю: сообщение с to_id — личный диалог, иначе чат класса.
+    # Вся прошлая переписка считается прочитанной.
+    op.execute(
+        """
+        INSERT INTO conversations (key, kind, user_low_id, user_high_id, class_name, last_message_id, message_count)
+        SELECT 'direct:' || CAST(low_id AS VARCHAR) || ':' || CAST(high_id AS VARCHAR), 'direct',
+               low_id, high_id, NULL, MAX(id), COUNT(id)
+        FROM (
+            SELECT id,
+                   CASE WHEN from_id < to_id THEN from_id ELSE to_id END AS low_id,
+                   CASE WHEN from_id < to_id THEN to_id ELSE from_id END AS high_id
+            FROM messages
+            WHERE to_id IS NOT NULL
+        ) AS pairs
+        GROUP BY low_id, high_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO conversations (key, kind, user_low_id, user_high_id, class_name, last_message_id, message_count)
+        SELECT 'class:' || class_name, 'class', NULL, NULL, class_name, MAX(id), COUNT(id)
+        FROM messages
+        WHERE to_id IS NULL AND class_name IS NOT NULL
+        GROUP BY class_name
+        """
+    )
+    op.execute(
+        """
+        UPDATE conversations
+        SET last_message_at = (SELECT created_at FROM messages WHERE messages.id = conversations.last_message_id)
+        """
+    )
+    op.execute(
+        """
+        UPDATE messages
+        SET conversation_id = (
+            SELECT conversations.id FROM conversations
+            WHERE conversations.key = CASE
+                WHEN messages.to_id IS NOT NULL THEN
+                    'direct:'
+                    || CAST(CASE WHEN messages.from_id < messages.to_id THEN messages.from_id ELSE messages.to_id END AS VARCHAR)
+                    || ':'
+                    || CAST(CASE WHEN messages.from_id < messages.to_id THEN messages.to_id ELSE messages.from_id END AS VARCHAR)
+                ELSE 'class:' || messages.class_name
+            END
+        )
+        WHERE messages.to_id IS NOT NULL OR messages.class_name IS NOT NULL
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO conversation_participants
+            (conversation_id, user_id, unread_count, last_read_message_id, last_message_id)
+        SELECT conversations.id, members.user_id, 0, conversations.last_message_id, conversations.last_message_id
+        FROM conversations
+        JOIN (
+            SELECT conversation_id, from_id AS user_id FROM messages WHERE conversation_id IS NOT NULL
+            UNION
+            SELECT conversation_id, to_id AS user_id FROM messages WHERE conversation_id IS NOT NULL AND to_id IS NOT NULL
+        ) AS members ON members.conversation_id = conversations.id
+        """
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("messages") as batch_op:
+        batch_op.drop_index("ix_messages_conversation_id_id")
+        batch_op.drop_constraint("fk_messages_conversation_id", type_="foreignkey")
+        batch_op.drop_column("conversation_id")
+    op.drop_index("ix_conversation_participants_inbox", table_name="conversation_participants")
+    op.drop_table("conversation_participants")
+    op.drop_table("conversations")
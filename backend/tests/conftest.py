@@ -0,0 +1,19 @@
+import os
+import tempfile
+
+# Конфигурация читается из окружения при импорте core.config,
+# поэтому временная база задаётся до импорта приложения.
+_tmp_dir = tempfile.mkdtemp(prefix="edziennik-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(_tmp_dir, 'test.db')}"
+os.environ.setdefault("SECRET_KEY", "test-secret-key-test-secret-key-0123")
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    import main
+
+    with TestClient(main.app) as test_client:
+        yield test_client
@@ -0,0 +1,52 @@
+"""
+Условный GET для ответов, зависящих от пользователя (/messages/inbox).
+"""
+import time
+from datetime import datetime, timedelta
+
+from core.security.jwt import JWTManager
+
+PASSWORD = "Passw0rd!x"
+
+
+def register(client, email: str) -> dict:
+    response = client.post("/api/v1/auth/register", json={
+        "email": email, "first_name": "Test", "last_name": "Inbox", "password": PASSWORD, "role": "student",
+    })
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_inbox_authenticates_before_not_modified(client):
+    owner = register(client, "etag-owner@example.com")
+    other = register(client, "etag-other@example.com")
+    headers = {"Authorization": f"Bearer {owner['access_token']}"}
+
+    first = client.get("/api/v1/messages/inbox", headers=headers)
+    assert first.status_code == 200, first.text
+    etag = first.headers["ETag"]
+    assert first.headers["Vary"] == "Authorization"
+
+    assert client.get("/api/v1/messages/inbox", headers={**headers, "If-None-Match": etag}).status_code == 304
+    for authorization in ({}, {"Authorization": "Bearer invalid.token.value"}):
+        response = client.get("/api/v1/messages/inbox", headers={**authorization, "If-None-Match": etag})
+        assert response.status_code == 401, response.text
+
+    foreign = client.get("/api/v1/messages/inbox", headers={
+        "Authorization": f"Bearer {other['access_token']}", "If-None-Match": etag,
+    })
+    assert foreign.status_code == 200 and foreign.headers["ETag"] != etag
+
+
+def test_expired_token_with_matching_etag_is_rejected(client):
+    user = register(client, "etag-expired@example.com")["user"]
+    expires = datetime.utcnow() + timedelta(seconds=2)
+    token = JWTManager().create_token({"sub": user["email"], "user_id": user["id"]}, expire_at=expires)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = client.get("/api/v1/messages/inbox", headers=headers)
+    assert first.status_code == 200, first.text
+
+    time.sleep(max(0.0, (expires - datetime.utcnow()).total_seconds()) + 1)
+    response = client.get("/api/v1/messages/inbox", headers={**headers, "If-None-Match": first.headers["ETag"]})
+    assert response.status_code == 401, response.text
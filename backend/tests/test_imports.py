@@ -0,0 +1,59 @@
+"""
+Проверка пользователей при импорте CSV и при регистрации.
+"""
+from pathlib import Path
+
+from app.auth.repositories.auth_repo import AuthRepo
+from app.imports.repositories.import_repo import ImportRepo
+from app.imports.services.import_service import ImportService
+from core.database.db import async_session_maker
+
+HEADER = "email,first_name,last_name,password,roles\n"
+
+
+class StudentRoleOnlyRepo(ImportRepo):
+    """База, в которой роль teacher ещё не заведена."""
+
+    async def role_ids(self):
+        return {name: role_id for name, role_id in (await super().role_ids()).items() if name == "student"}
+
+
+def test_import_reports_roles_missing_from_database(client, tmp_path: Path):
+    path = tmp_path / "users.csv"
+    path.write_text(
+        HEADER
+        + "roles-ok@example.com,Ann,Smith,secret,student\n"
+        + "roles-missing@example.com,Bob,Smith,secret,student;teacher\n"
+    )
+
+    async def run():
+        async with async_session_maker() as session:
+            return await ImportService(StudentRoleOnlyRepo(session)).import_users(path, dry_run=True)
+
+    report = client.portal.call(run)
+    assert report.created == 1
+    assert [(issue.line, issue.field, issue.message) for issue in report.errors] == [
+        (3, "roles", "Role teacher not found"),
+    ]
+
+
+def test_email_checks_ignore_case(client, tmp_path: Path):
+    path = tmp_path / "users.csv"
+    path.write_text(HEADER + "Mixed.Case@Example.com,Ann,Smith,secret,student\n")
+
+    async def run():
+        async with async_session_maker() as session:
+            repo = ImportRepo(session)
+            await repo.insert_users(
+                [{"email": "Mixed.Case@Example.com", "first_name": "Ann", "last_name": "Smith", "hased_password": b"x"}],
+                [[]],
+            )
+            await repo.commit()
+        async with async_session_maker() as session:
+            exists = await AuthRepo(session).email_exists("mixed.case@example.com")
+            report = await ImportService(ImportRepo(session)).import_users(path, dry_run=True)
+        return exists, report
+
+    exists, report = client.portal.call(run)
+    assert exists
+    assert report.created == 0 and [issue.field for issue in report.skipped] == ["email"]
@@ -0,0 +1,26 @@
+"""
+Доступ к /metrics.
+"""
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from core.config import config
+from core.metrics import metrics_response
+
+
+def test_metrics_are_off_by_default(client):
+    assert not config.metrics.enabled
+    assert client.get("/metrics").status_code == 404
+
+
+def test_metrics_token_is_required_when_set(monkeypatch):
+    monkeypatch.setattr(config.metrics, "token", "scrape-secret")
+    app = FastAPI()
+    app.get("/metrics")(metrics_response)
+    metrics = TestClient(app)
+
+    assert metrics.get("/metrics").status_code == 401
+    assert metrics.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    response = metrics.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    assert "http_request_duration_seconds" in response.text
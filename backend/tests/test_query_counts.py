@@ -0,0 +1,117 @@
+"""
+Регрессионные тесты числа SQL-запросов на эндпоинт.
+
+Связи Roles.users и User.roles объявлены с lazy="raise", а роли грузятся
+явным selectinload. Если кто-то вернёт lazy="selectin" или добавит неявную
+загрузку, число запросов вырастет и эти тесты упадут.
+
+Чтение table_versions для условного GET (conditional_get) считается отдельно:
+это один запрос на ответ, не зависящий от загрузки связей.
+
+Запуск из каталога backend (нужны pytest и httpx):
+    python -m pytest tests
+"""
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import event
+
+from core.database.db import engine
+
+PASSWORD = "Passw0rd!x"
+
+
+@contextmanager
+def count_statements() -> Iterator[List[str]]:
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+def split_version_reads(statements: List[str]) -> tuple:
+    versions = [s for s in statements if "FROM table_versions" in s]
+    return [s for s in statements if s not in versions], versions
+
+
+@pytest.fixture(scope="module")
+def users(client):
+    ids = []
+    for n, role in enumerate(("student", "student", "teacher")):
+        response = client.post("/api/v1/auth/register", json={
+            "email": f"user{n}@example.com",
+            "first_name": "Test",
+            "last_name": f"User{n}",
+            "password": PASSWORD,
+            "role": role,
+        })
+        assert response.status_code == 200, response.text
+        ids.append(response.json()["user"]["id"])
+    return ids
+
+
+@pytest.mark.parametrize(("method", "path", "expected"), [
+    ("GET", "/api/v1/roles/", 1),
+    ("GET", "/api/v1/users/", 2),
+    ("GET", "/api/v1/users/{user_id}", 2),
+])
+def test_read_endpoints(client, users, method, path, expected):
+    with count_statements() as statements:
+        response = client.request(method, path.format(user_id=users[0]))
+    assert response.status_code == 200, response.text
+
+    queries, version_reads = split_version_reads(statements)
+    assert len(queries) == expected, queries
+    assert len(version_reads) <= 1, version_reads
+
+
+def test_login(client, users):
+    with count_statements() as statements:
+        response = client.post("/api/v1/auth/login", json={"email": "user0@example.com", "password": PASSWORD})
+    assert response.status_code == 200, response.text
+    assert len(statements) == 2, statements
+
+
+@pytest.fixture(scope="module")
+def grade(client, users):
+    student_id, _, teacher_id = users
+    token = client.post("/api/v1/auth/login", json={"email": "user2@example.com", "password": PASSWORD}).json()
+    headers = {"Authorization": f"Bearer {token['access_token']}"}
+    response = client.post("/api/v1/grades/", headers=headers, json={
+        "student_id": student_id, "teacher_id": teacher_id, "subject": "Math", "value": 3, "date": "2026-01-05",
+    })
+    assert response.status_code == 201, response.text
+    return response.json(), headers
+
+
+@pytest.mark.parametrize(("payload", "reads"), [
+    ({"comment": "Poprawa"}, 0),
+    ({"value": 5}, 0),
+    ({"date": "2026-01-06"}, 0),
+    ({"subject": "Physics"}, 1),
+])
+def test_grade_update_reads_old_row_only_for_subject_change(client, grade, payload, reads):
+    created, headers = grade
+    with count_statements() as statements:
+        response = client.patch(f"/api/v1/grades/{created['id']}", headers=headers, json=payload)
+    assert response.status_code == 200, response.text
+    assert all(response.json()[key] == value for key, value in payload.items())
+
+    old_row_reads = [s for s in statements if s.lstrip().startswith("SELECT") and "WHERE grades.id" in s]
+    assert len(old_row_reads) == reads, statements
+
+
+def test_grade_summary_follows_updates(client, grade):
+    created, headers = grade
+    stats = client.get("/api/v1/grades/stats", params={"student_id": created["student_id"]}, headers=headers).json()
+    subjects = {s["subject"]: s for s in stats["subjects"]}
+    assert "Math" not in subjects
+    assert subjects["Physics"]["count"] == 1
+    assert subjects["Physics"]["mean"] == 5
@@ -0,0 +1,92 @@
+"""
+Проверка планов запросов репозиториев через EXPLAIN.
+
+Каждый метод вызывается с типичными фильтрами, выполненные SELECT
+перехватываются и прогоняются через EXPLAIN QUERY PLAN (SQLite) или
+EXPLAIN (PostgreSQL, с enable_seqscan = off, чтобы маленькие таблицы
+не маскировали отсутствие индекса). Тест падает, если запрос сканирует
+таблицу целиком или не обращается ни к одному индексу.
+
+Запуск из каталога backend (нужны pytest и httpx):
+    python -m pytest tests
+"""
+import re
+from typing import Any, Awaitable, Callable, List, Tuple
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.repositories.auth_repo import AuthRepo
+from app.grades.repositories.grade_repo import GradeRepo
+from app.messages.repositories.conversation_repo import ConversationRepo
+from app.messages.repositories.message_repo import MessageRepo
+from app.schedule.repositories.schedule_repo import ScheduleRepo
+from core.database.db import async_session_maker, engine
+
+CHECKS: List[Tuple[str, Callable[[AsyncSession], Awaitable[Any]]]] = [
+    ("AuthRepo.email_exists(email)", lambda s: AuthRepo(s).email_exists("Someone@Example.com")),
+    ("GradeRepo.list_grades(student_id)", lambda s: GradeRepo(s).list_grades(student_id=1)),
+    ("GradeRepo.list_grades(teacher_id)", lambda s: GradeRepo(s).list_grades(teacher_id=1)),
+    ("GradeRepo.list_grades(student_id, subject)", lambda s: GradeRepo(s).list_grades(student_id=1, subject="Math")),
+    ("GradeRepo.grade_stats(student_id)", lambda s: GradeRepo(s).grade_stats(student_id=1)),
+    ("GradeRepo.grade_stats(teacher_id)", lambda s: GradeRepo(s).grade_stats(teacher_id=1)),
+    ("MessageRepo.list_messages(from_id)", lambda s: MessageRepo(s).list_messages(from_id=1)),
+    ("MessageRepo.list_messages(to_id)", lambda s: MessageRepo(s).list_messages(to_id=1)),
+    ("MessageRepo.list_messages(class_name)", lambda s: MessageRepo(s).list_messages(class_name="1A")),
+    ("ConversationRepo.inbox(user_id)", lambda s: ConversationRepo(s).inbox(user_id=1)),
+    ("ConversationRepo.list_thread(conversation_id)", lambda s: ConversationRepo(s).list_thread(1)),
+    ("ScheduleRepo.list_items(class_name, weekday)", lambda s: ScheduleRepo(s).list_items("1A", 1)),
+]
+
+SQLITE_FULL_SCAN = re.compile(r"^SCAN (\w+)(?! USING (COVERING )?INDEX)")
+SQLITE_INDEXED = re.compile(r"USING (COVERING )?INDEX|USING INTEGER PRIMARY KEY|USING ROWID")
+
+
+async def capture(check: Callable[[AsyncSession], Awaitable[Any]]) -> List[Tuple[str, Any]]:
+    statements: List[Tuple[str, Any]] = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "table_versions" not in statement:
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+    try:
+        async with async_session_maker() as session:
+            await check(session)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", on_execute)
+    return statements
+
+
+async def explain(statement: str, parameters: Any) -> List[str]:
+    async with engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text("SET enable_seqscan = off"))
+            result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+            return [row[0] for row in result]
+        result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return [row[-1] for row in result]
+
+
+def problems(plan: List[str]) -> List[str]:
+    if engine.dialect.name == "postgresql":
+        found = [line for line in plan if "Seq Scan" in line]
+        if not any("Index" in line for line in plan):
+            found.append("no index used")
+        return found
+    found = [line for line in plan if SQLITE_FULL_SCAN.match(line.strip())]
+    if not any(SQLITE_INDEXED.search(line) for line in plan):
+        found.append("no index used")
+    return found
+
+
+@pytest.mark.parametrize(("name", "check"), CHECKS, ids=[name for name, _ in CHECKS])
+def test_repository_queries_use_indexes(client, name, check):
+    async def plans() -> List[Tuple[str, List[str]]]:
+        return [(statement, await explain(statement, parameters)) for statement, parameters in await capture(check)]
+
+    captured = client.portal.call(plans)
+    assert captured, f"{name} issued no SELECT"
+    for statement, plan in captured:
+        assert not problems(plan), f"{name}\n{statement}\n" + "\n".join(plan)
@@ -0,0 +1,41 @@
+"""
+Кеш GET /schedule с бэкендом в памяти при нескольких воркерах.
+
+Каждый воркер держит свой MemoryCacheBackend; здесь два ScheduleCache
+изображают два воркера над одной базой. Изменение через один из них
+должно сразу стать видно через другой, без ожидания ttl_seconds.
+"""
+import orjson
+
+from app.schedule.repositories.schedule_repo import ScheduleRepo
+from app.schedule.services.schedule_cache import MemoryCacheBackend, ScheduleCache
+from app.schedule.services.schedule_service import ScheduleService
+from core.database.db import async_session_maker
+
+
+def worker_cache() -> ScheduleCache:
+    return ScheduleCache(MemoryCacheBackend(max_entries=16), ttl_seconds=3600, key_prefix="test")
+
+
+def test_memory_cache_sees_writes_from_other_workers(client):
+    first, second = worker_cache(), worker_cache()
+
+    async def subjects(cache: ScheduleCache) -> list:
+        async with async_session_maker() as session:
+            page = await ScheduleService(ScheduleRepo(session), cache).list_page("7C")
+        return [item["subject"] for item in orjson.loads(page.body)["items"]]
+
+    async def scenario() -> list:
+        async with async_session_maker() as session:
+            item = await ScheduleService(ScheduleRepo(session), second).create_item({
+                "class_name": "7C", "weekday": 1, "time_from": "08:00", "time_to": "08:45", "subject": "Math",
+            })
+        seen = [await subjects(first), await subjects(first)]
+        async with async_session_maker() as session:
+            await ScheduleService(ScheduleRepo(session), second).update_item(item.id, {"subject": "Physics"})
+        seen.append(await subjects(first))
+        return seen
+
+    assert client.portal.call(scenario) == [["Math"], ["Math"], ["Physics"]]
+    # Повторное чтение до изменения обслужено из кеша: в нём две страницы, а не три.
+    assert len(first.backend._entries) == 2
@@ -0,0 +1,81 @@
+"""
+Тесты общего сериализатора списков core.serialization.response.
+
+Ответы списков собираются в байты в обход response_model, поэтому здесь
+проверяется, что строки всё же проходят валидацию моделью ответа и что тело
+совпадает с тем, что выдал бы pydantic через Page[Model].
+"""
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from app.grades.models.grade_model import GradeResponse
+from app.messages.models.message_model import MessageResponse
+from core.database.pagination import Page
+from core.serialization.response import envelope, items_json, page_body
+
+PASSWORD = "Passw0rd!x"
+
+
+def grade_row(**overrides):
+    row = {
+        "id": 1, "student_id": 2, "teacher_id": 3, "subject": "Math", "value": 5,
+        "date": date(2026, 1, 5), "comment": None, "created_at": datetime(2026, 1, 5, 8, 0),
+    }
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+def test_page_body_matches_pydantic_page():
+    rows = [grade_row(id=1), grade_row(id=2, comment="Sprawdzian")]
+    expected = Page[GradeResponse](
+        items=[GradeResponse.model_validate(r, from_attributes=True) for r in rows],
+        next_cursor="abc",
+    ).model_dump_json()
+    assert orjson.loads(page_body(rows, "abc", GradeResponse)) == orjson.loads(expected)
+
+
+def test_extra_columns_are_dropped():
+    body = orjson.loads(items_json([grade_row()], GradeResponse))
+    assert set(body[0]) == set(GradeResponse.model_fields)
+
+
+def test_rows_are_validated():
+    with pytest.raises(ValidationError):
+        items_json([grade_row(value="five")], GradeResponse)
+
+
+def test_envelope_keeps_extra_fields():
+    body = orjson.loads(envelope(b"[]", watermark=7, has_more=False))
+    assert body == {"items": [], "watermark": 7, "has_more": False}
+
+
+def register(client, email: str, role: str) -> dict:
+    response = client.post("/api/v1/auth/register", json={
+        "email": email, "first_name": "Test", "last_name": role, "password": PASSWORD, "role": role,
+    })
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_message_routes_use_serializer(client):
+    teacher = register(client, "serializer-teacher@example.com", "teacher")
+    student = register(client, "serializer-student@example.com", "student")
+    headers = {"Authorization": f"Bearer {teacher['access_token']}"}
+    sent = client.post("/api/v1/messages/", headers=headers, json={
+        "from_id": teacher["user"]["id"], "to_id": student["user"]["id"], "content": "Dzień dobry",
+    })
+    assert sent.status_code == 201, sent.text
+    message = sent.json()
+
+    sync = client.get("/api/v1/messages/sync", params={"since_id": message["id"] - 1, "to_id": student["user"]["id"]})
+    assert sync.status_code == 200, sync.text
+    assert sync.json() == {"items": [message], "watermark": message["id"], "has_more": False}
+    MessageResponse.model_validate(sync.json()["items"][0])
+
+    thread = client.get(f"/api/v1/messages/conversations/{message['conversation_id']}/messages", headers=headers)
+    assert thread.status_code == 200, thread.text
+    assert thread.json() == {"items": [message], "next_cursor": None}
@@ -0,0 +1,32 @@
+"""
+Срок жизни записей кеша проверенных JWT токенов.
+"""
+import time
+
+from core.security.token_cache import TokenCache
+
+TOKEN = "header.payload.signature"
+
+
+def put(cache: TokenCache, exp: float) -> float:
+    cache.put(TOKEN, {"exp": exp}, 1, "a@example.com", "Ann", "Smith", ("student",))
+    return cache.get(TOKEN).expires_at
+
+
+def test_entries_outlive_neither_ttl_nor_token_exp():
+    now = time.time()
+    assert put(TokenCache(max_size=10, ttl_seconds=60), now + 3 * 86400) <= now + 61
+    assert put(TokenCache(max_size=10, ttl_seconds=60), now + 10) <= now + 10
+
+
+def test_configured_ttl_is_capped():
+    cache = TokenCache(max_size=10, ttl_seconds=86400)
+    assert cache.ttl_seconds == TokenCache.MAX_TTL_SECONDS
+    assert put(cache, time.time() + 3 * 86400) <= time.time() + TokenCache.MAX_TTL_SECONDS
+
+
+def test_invalidate_user_drops_cached_tokens():
+    cache = TokenCache(max_size=10, ttl_seconds=60)
+    put(cache, time.time() + 3600)
+    cache.invalidate_user(1)
+    assert cache.get(TOKEN) is None
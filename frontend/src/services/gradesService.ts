@@ -1,4 +1,4 @@
-import { httpClient } from '@/utils/http'
+import { httpClient, type Page } from '@/utils/http'
 
 export type Grade = {
   id: number
@@ -10,9 +10,56 @@ export type Grade = {
   comment?: string
 }
 
-export async function getGrades(studentId?: number): Promise<Grade[]> {
-  const params = studentId ? `?student_id=${studentId}` : ''
-  return await httpClient.get<Grade[]>(`/grades${params}`)
+export type GradeFilter = {
+  studentId?: number
+  teacherId?: number
+  subject?: string
+}
+
+export async function getGradesPage(filter: GradeFilter = {}, after?: string | null): Promise<Page<Grade>> {
+  const params = new URLSearchParams()
+  if (filter.studentId) params.append('student_id', filter.studentId.toString())
+  if (filter.teacherId) params.append('teacher_id', filter.teacherId.toString())
+  if (filter.subject) params.append('subject', filter.subject)
+  const query = params.toString()
+  return await httpClient.getPage<Grade>(query ? `/grades/?${query}` : '/grades/', after)
+}
+
+export type GradeTrendPoint = {
+  period: string
+  count: number
+  mean: number
+}
+
+export type SubjectGradeStats = {
+  subject: string
+  count: number
+  mean: number
+  variance: number
+  min_value: number
+  max_value: number
+  last_date: string
+  distribution: Record<string, number>
+  trend: GradeTrendPoint[]
+}
+
+export type GradeStats = {
+  student_id: number | null
+  teacher_id: number | null
+  granularity: 'week' | 'month'
+  count: number
+  mean: number | null
+  subjects: SubjectGradeStats[]
+}
+
+export async function getGradeStats(
+  scope: { studentId?: number; teacherId?: number },
+  granularity: 'week' | 'month' = 'month'
+): Promise<GradeStats> {
+  const params = new URLSearchParams({ granularity })
+  if (scope.studentId) params.append('student_id', scope.studentId.toString())
+  if (scope.teacherId) params.append('teacher_id', scope.teacherId.toString())
+  return await httpClient.get<GradeStats>(`/grades/stats?${params.toString()}`)
 }
 
 export type CreateGradeInput = {
@@ -26,4 +73,8 @@ export type CreateGradeInput = {
 
 export async function createGrade(input: CreateGradeInput): Promise<Grade> {
   return await httpClient.post<Grade>('/grades/', input)
+}
+
+export async function createGrades(inputs: CreateGradeInput[]): Promise<Grade[]> {
+  return await httpClient.post<Grade[]>('/grades/batch', inputs)
 }
\ No newline at end of file
@@ -1,14 +1,28 @@
-import { httpClient } from '@/utils/http'
+import { API_BASE, httpClient, type Page } from '@/utils/http'
+import { getJSON } from '@/utils/storage'
 
 export type Message = {
   id: number
   from_id: number
   to_id?: number
   class_name?: string
+  conversation_id?: number
   content: string
   created_at: string
 }
 
+export type ConversationSummary = {
+  id: number
+  kind: 'direct' | 'class'
+  peer_id?: number
+  class_name?: string
+  message_count: number
+  unread_count: number
+  last_message_at?: string
+  last_message?: Message
+  preview?: string
+}
+
 export type CreateMessageInput = {
   from_id?: number
   to_id?: number
@@ -16,15 +30,90 @@ export type CreateMessageInput = {
   content: string
 }
 
-export async function getMessages(fromId?: number, toId?: number): Promise<Message[]> {
+function messagesEndpoint(fromId?: number, toId?: number): string {
   const params = new URLSearchParams()
   if (fromId) params.append('from_id', fromId.toString())
   if (toId) params.append('to_id', toId.toString())
-  
+
   const queryString = params.toString()
-  return await httpClient.get<Message[]>(`/messages/${queryString ? '?' + queryString : ''}`)
+  return `/messages/${queryString ? '?' + queryString : ''}`
+}
+
+export async function getMessagesPage(fromId?: number, toId?: number, after?: string | null): Promise<Page<Message>> {
+  return await httpClient.getPage<Message>(messagesEndpoint(fromId, toId), after)
+}
+
+export async function getMessages(fromId?: number, toId?: number): Promise<Message[]> {
+  return await httpClient.getAll<Message>(messagesEndpoint(fromId, toId))
 }
 
 export async function sendMessage(input: CreateMessageInput): Promise<Message> {
   return await httpClient.post<Message>('/messages/', input)
-}
\ No newline at end of file
+}
+
+export async function getInbox(): Promise<ConversationSummary[]> {
+  return await httpClient.getAll<ConversationSummary>('/messages/inbox')
+}
+
+export async function markConversationRead(conversationId: number): Promise<void> {
+  await httpClient.post(`/messages/conversations/${conversationId}/read`, {})
+}
+
+export async function pollMessages(afterId: number, timeout = 25): Promise<Message[]> {
+  return await httpClient.get<Message[]>(`/messages/poll?after_id=${afterId}&timeout=${timeout}`)
+}
+
+/**
+ * Subscribes to new messages: WebSocket first, long-poll on /messages/poll if the
+ * socket cannot be opened. Returns a function that closes the subscription.
+ */
+export function subscribeMessages(afterId: number, onMessage: (message: Message) => void): () => void {
+  let lastId = afterId
+  let stopped = false
+  let socket: WebSocket | null = null
+
+  const deliver = (message: Message) => {
+    lastId = Math.max(lastId, message.id)
+    onMessage(message)
+  }
+
+  const longPoll = async () => {
+    while (!stopped) {
+      try {
+        const messages = await pollMessages(lastId)
+        messages.forEach(deliver)
+      } catch (error) {
+        console.error('Message poll failed:', error)
+        await new Promise(resolve => setTimeout(resolve, 3000))
+      }
+    }
+  }
+
+  const connect = () => {
+    const token = getJSON<string>('auth_token')
+    if (!token || typeof WebSocket === 'undefined') {
+      longPoll()
+      return
+    }
+    const url = `${API_BASE.replace(/^http/, 'ws')}/messages/ws?token=${encodeURIComponent(token)}&after_id=${lastId}`
+    let opened = false
+    socket = new WebSocket(url)
+    socket.onopen = () => { opened = true }
+    socket.onmessage = event => {
+      const data = JSON.parse(event.data)
+      if (data.type === 'message') deliver(data.message)
+    }
+    socket.onclose = () => {
+      socket = null
+      if (stopped) return
+      if (opened) setTimeout(connect, 1000)
+      else longPoll()
+    }
+  }
+
+  connect()
+  return () => {
+    stopped = true
+    socket?.close()
+  }
+}
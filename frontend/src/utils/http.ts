@@ -1,6 +1,11 @@
 import { getJSON } from './storage'
 
-const API_BASE = 'http://localhost:8000/api/v1'
+export const API_BASE = 'http://localhost:8000/api/v1'
+
+export type Page<T> = {
+  items: T[]
+  next_cursor: string | null
+}
 
 export class HttpClient {
   private baseURL: string
@@ -40,6 +45,26 @@ export class HttpClient {
     return this.request<T>(endpoint, { method: 'GET' })
   }
 
+  async getPage<T>(endpoint: string, after?: string | null, limit?: number): Promise<Page<T>> {
+    const params = new URLSearchParams()
+    if (after) params.append('after', after)
+    if (limit) params.append('limit', limit.toString())
+    const query = params.toString()
+    if (!query) return this.get<Page<T>>(endpoint)
+    return this.get<Page<T>>(`${endpoint}${endpoint.includes('?') ? '&' : '?'}${query}`)
+  }
+
+  async getAll<T>(endpoint: string): Promise<T[]> {
+    const items: T[] = []
+    let cursor: string | null = null
+    do {
+      const page: Page<T> = await this.getPage<T>(endpoint, cursor)
+      items.push(...page.items)
+      cursor = page.next_cursor
+    } while (cursor)
+    return items
+  }
+
   async post<T>(endpoint: string, data?: any): Promise<T> {
     return this.request<T>(endpoint, {
       method: 'POST',